@@ -17,6 +17,8 @@ Features:
 
 Dependencies:
 - docker>=7.0.0 (Docker SDK for Python)
+- aiodocker>=0.21.0 (optional, for AsyncDockerModule bulk operations)
+- orjson (optional, faster decoding of Docker API JSON responses)
 
 Configuration (aibasic.conf):
 [docker]
@@ -29,73 +31,313 @@ TIMEOUT = 60
 DEFAULT_REGISTRY = docker.io
 REGISTRY_USERNAME = your_username
 REGISTRY_PASSWORD = your_password
+LIST_CACHE_TTL = 2.0  # seconds to reuse list results, 0 disables
+MAX_POOL_SIZE = 32  # connections kept per daemon for concurrent calls
 
 Author: AIBasic Team
 Version: 1.0
 """
 
 import os
+import re
+import random
+import codecs
+import json
+import asyncio
+import functools
 import threading
-from typing import Optional, Dict, List, Any, Union
+import time
+import weakref
+from typing import Optional, Dict, List, Any, Union, Callable, Iterable, Iterator
 import configparser
+from collections import deque
+from types import MappingProxyType
+
+# The Docker SDK is imported when the first DockerModule is created (see _ensure_docker)
+docker = None
+DOCKER_AVAILABLE = None  # None until the import has been attempted
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 try:
-    import docker
-    from docker.types import Mount, LogConfig, RestartPolicy
-    from docker.errors import DockerException, ImageNotFound, ContainerError, APIError
-    DOCKER_AVAILABLE = True
+    import aiodocker
+    AIODOCKER_AVAILABLE = True
 except ImportError:
-    DOCKER_AVAILABLE = False
+    AIODOCKER_AVAILABLE = False
+
+
+from .module_base import AIbasicModuleBase, MethodInfo
 
 
-from .module_base import AIbasicModuleBase
+def _ensure_docker() -> bool:
+    """Import the Docker SDK on first use and report whether it is available."""
+    global docker, DOCKER_AVAILABLE
+    if DOCKER_AVAILABLE is None:
+        try:
+            import docker as _docker
+            docker = _docker
+            DOCKER_AVAILABLE = True
+        except ImportError:
+            DOCKER_AVAILABLE = False
+    return DOCKER_AVAILABLE
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+# (attribute, environment variable, default, converter)
+_ENV_KEYS = (
+    ('docker_host', 'DOCKER_HOST', 'unix:///var/run/docker.sock', str),
+    ('tls_verify', 'DOCKER_TLS_VERIFY', 'false', _parse_bool),
+    ('tls_ca_cert', 'DOCKER_TLS_CA_CERT', None, str),
+    ('tls_client_cert', 'DOCKER_TLS_CLIENT_CERT', None, str),
+    ('tls_client_key', 'DOCKER_TLS_CLIENT_KEY', None, str),
+    ('timeout', 'DOCKER_TIMEOUT', '60', int),
+    ('default_registry', 'DOCKER_REGISTRY', 'docker.io', str),
+    ('registry_username', 'DOCKER_REGISTRY_USERNAME', None, str),
+    ('registry_password', 'DOCKER_REGISTRY_PASSWORD', None, str),
+    ('list_cache_ttl', 'DOCKER_LIST_CACHE_TTL', '2.0', float),
+    ('max_pool_size', 'DOCKER_MAX_POOL_SIZE', '32', int),
+)
+
+
+# Container port spec without protocol ("80", "8000-8010") defaults to TCP
+_PORT_SPEC_RE = re.compile(r'^(\d+(?:-\d+)?)(?:/(tcp|udp|sctp))?$')
+_DEFAULT_PORT_PROTOCOL = 'tcp'
+
+
+def _freeze_mapping(mapping: Dict) -> Optional[tuple]:
+    """Convert a dict into a hashable cache key, or None if values are unhashable."""
+    try:
+        frozen = tuple(sorted(mapping.items(), key=lambda item: str(item[0])))
+        hash(frozen)
+    except TypeError:
+        return None
+    return frozen
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_ports(ports_items: tuple) -> Dict[str, Any]:
+    """Normalize port mappings to the SDK's 'port/protocol' keyed form."""
+    normalized = {}
+    for spec, binding in ports_items:
+        spec = str(spec)
+        match = _PORT_SPEC_RE.match(spec)
+        if match and match.group(2) is None:
+            spec = f"{match.group(1)}/{_DEFAULT_PORT_PROTOCOL}"
+        normalized[spec] = binding
+    return normalized
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_environment(env_items: tuple) -> tuple:
+    """Normalize environment variables to the Engine API's 'KEY=value' list form."""
+    return tuple(key if value is None else f"{key}={value}" for key, value in env_items)
+
+
+# Instance attribute -> docker.APIClient method, bound once per client
+_API_METHODS = {
+    '_api_start': 'start',
+    '_api_stop': 'stop',
+    '_api_restart': 'restart',
+    '_api_remove_container': 'remove_container',
+    '_api_inspect_container': 'inspect_container',
+    '_api_logs': 'logs',
+    '_api_stats': 'stats',
+    '_api_pause': 'pause',
+    '_api_unpause': 'unpause',
+    '_api_kill': 'kill',
+    '_api_rename': 'rename',
+}
+
+
+# Resource kinds whose list results are cached
+_LIST_CACHE_KINDS = ('containers', 'images', 'volumes', 'networks')
+
+
+def _list_cache_key(*parts: Any) -> str:
+    """Build a stable cache key from list arguments (filters may hold lists)."""
+    return repr(tuple(sorted(part.items()) if isinstance(part, dict) else part for part in parts))
+
+
+# Filters that can be evaluated client-side against a cached unfiltered listing
+_LOCAL_CONTAINER_FILTERS = frozenset({'status', 'name', 'id', 'label'})
+_LOCAL_IMAGE_FILTERS = frozenset({'dangling', 'label'})
+# Container states returned by the daemon when all=False
+_DEFAULT_LISTED_STATES = frozenset({'running', 'paused'})
+
+
+def _as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, (list, tuple)) else [value]
+
+
+def _labels_match(labels: Dict[str, str], specs: List[str]) -> bool:
+    """Docker label filter semantics: every 'key' or 'key=value' spec must match."""
+    for spec in specs:
+        key, sep, value = str(spec).partition('=')
+        if key not in labels or (sep and labels[key] != value):
+            return False
+    return True
+
+
+def _container_matches(container: Any, filters: Dict) -> bool:
+    """Apply container list filters locally (OR within a key, AND across keys)."""
+    for key, value in filters.items():
+        values = _as_list(value)
+        if key == 'status':
+            matched = container.status in values
+        elif key == 'name':
+            matched = any(re.search(pattern, container.name) for pattern in values)
+        elif key == 'id':
+            matched = any(container.id.startswith(prefix) for prefix in values)
+        else:
+            matched = _labels_match(container.labels, values)
+        if not matched:
+            return False
+    return True
+
+
+def _image_matches(image: Any, filters: Dict) -> bool:
+    """Apply image list filters locally."""
+    for key, value in filters.items():
+        values = _as_list(value)
+        if key == 'dangling':
+            matched = (not image.tags) == (str(values[0]).lower() in ('true', '1'))
+        else:
+            matched = _labels_match(image.labels, values)
+        if not matched:
+            return False
+    return True
+
+
+def _iter_decoded(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode a byte stream incrementally, never splitting multi-byte characters."""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+def _configure_tcp_pools(api: Any, max_pool_size: int):
+    """Size TCP connection pools and enable TCP keep-alive on an APIClient."""
+    import socket
+    from urllib3.connection import HTTPConnection
+
+    socket_options = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    for adapter in api.adapters.values():
+        poolmanager = getattr(adapter, 'poolmanager', None)
+        if poolmanager is not None:
+            poolmanager.connection_pool_kw['maxsize'] = max_pool_size
+            poolmanager.connection_pool_kw['socket_options'] = socket_options
+
+
+def _use_orjson_results(api: Any):
+    """Decode JSON API responses of this APIClient with orjson."""
+    default_result = api._result
+
+    def _result(response, json=False, binary=False):
+        if json:
+            api._raise_for_status(response)
+            return orjson.loads(response.content)
+        return default_result(response, json=json, binary=binary)
+
+    api._result = _result
+
+
+# Bounded retry with jittered exponential backoff for transient daemon errors
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 2.0
+
+
+def _is_transient(error: Exception) -> bool:
+    """Server-side API errors, dropped connections and timeouts are worth retrying."""
+    if isinstance(error, docker.errors.APIError):
+        return error.is_server_error()
+    import requests
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def _retry(attempts: int = _RETRY_ATTEMPTS, base: float = _RETRY_BASE_DELAY,
+           max_delay: float = _RETRY_MAX_DELAY):
+    """Retry an idempotent daemon call on transient errors."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(attempts):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == attempts - 1 or not _is_transient(e):
+                        raise
+                    time.sleep(min(max_delay, random.random() * base * 2 ** attempt))
+        return wrapper
+    return decorator
+
+
+def _load_env() -> Dict[str, Any]:
+    """Read Docker settings from the environment in a single pass."""
+    env = os.environ
+    settings = {}
+    for attr, key, default, convert in _ENV_KEYS:
+        value = env.get(key, default)
+        settings[attr] = convert(value) if value is not None else None
+    return settings
 
 
 class DockerModule(AIbasicModuleBase):
     """
     Docker module for container and image management.
 
-    Implements singleton pattern for efficient resource usage.
+    A shared per-process instance is available through DockerModule.instance().
     Provides comprehensive Docker operations through Docker SDK.
     """
 
-    _instance = None
-    _lock = threading.Lock()
-    _initialized = False
+    @classmethod
+    def instance(cls) -> 'DockerModule':
+        """
+        Get the shared Docker module instance.
 
-    def __new__(cls):
-        """Singleton pattern implementation."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super(DockerModule, cls).__new__(cls)
-        return cls._instance
+        Same instance as get_docker_module() returns for the default config
+        path; created once, under a lock, on first call.
+        """
+        return get_docker_module()
 
     def __init__(self):
-        """Initialize Docker module (only once due to singleton)."""
-        if self._initialized:
-            return
-
-        if not DOCKER_AVAILABLE:
+        """Initialize Docker module."""
+        if not _ensure_docker():
             raise ImportError(
                 "Docker SDK not available. Install with: pip install docker>=7.0.0"
             )
 
         # Configuration
-        self.docker_host = os.getenv('DOCKER_HOST', 'unix:///var/run/docker.sock')
-        self.tls_verify = os.getenv('DOCKER_TLS_VERIFY', 'false').lower() == 'true'
-        self.tls_ca_cert = os.getenv('DOCKER_TLS_CA_CERT')
-        self.tls_client_cert = os.getenv('DOCKER_TLS_CLIENT_CERT')
-        self.tls_client_key = os.getenv('DOCKER_TLS_CLIENT_KEY')
-        self.timeout = int(os.getenv('DOCKER_TIMEOUT', '60'))
-        self.default_registry = os.getenv('DOCKER_REGISTRY', 'docker.io')
-        self.registry_username = os.getenv('DOCKER_REGISTRY_USERNAME')
-        self.registry_password = os.getenv('DOCKER_REGISTRY_PASSWORD')
-
-        # Docker client (lazy initialized)
+        self.__dict__.update(_load_env())
+
+        # Docker client (lazy initialized, then shared by all methods)
         self._client = None
+        self._client_finalizer = None
+
+        # Registry credentials resolved once, login performed lazily on first push
+        self._default_auth = self._resolve_default_auth()
+        self._registry_logged_in = False
 
-        self._initialized = True
+        # Image IDs pulled by this module: {(repository, tag): image_id}
+        self._pull_cache = {}
+
+        # Short-lived list results per resource kind: {kind: {key: (expiry, result)}}
+        self._list_cache = {kind: {} for kind in _LIST_CACHE_KINDS}
+        self._list_cache_lock = threading.Lock()
 
     def load_config(self, config_path: str = 'aibasic.conf'):
         """Load configuration from aibasic.conf file."""
@@ -116,6 +358,19 @@ class DockerModule(AIbasicModuleBase):
             self.default_registry = docker_config.get('DEFAULT_REGISTRY', self.default_registry)
             self.registry_username = docker_config.get('REGISTRY_USERNAME', self.registry_username)
             self.registry_password = docker_config.get('REGISTRY_PASSWORD', self.registry_password)
+            self.list_cache_ttl = float(docker_config.get('LIST_CACHE_TTL', self.list_cache_ttl))
+            self.max_pool_size = int(docker_config.get('MAX_POOL_SIZE', self.max_pool_size))
+            self._default_auth = self._resolve_default_auth()
+            self._registry_logged_in = False
+
+    def _resolve_default_auth(self) -> Optional[Dict[str, str]]:
+        """Build the default registry auth dict from configured credentials."""
+        if self.registry_username and self.registry_password:
+            return {
+                'username': self.registry_username,
+                'password': self.registry_password
+            }
+        return None
 
     @property
     def client(self):
@@ -132,20 +387,80 @@ class DockerModule(AIbasicModuleBase):
                     )
 
                 # Create Docker client
-                self._client = docker.DockerClient(
+                client = docker.DockerClient(
                     base_url=self.docker_host,
                     tls=tls_config,
-                    timeout=self.timeout
+                    timeout=self.timeout,
+                    max_pool_size=self.max_pool_size
                 )
+                if self.docker_host.startswith(('tcp://', 'http://', 'https://')):
+                    _configure_tcp_pools(client.api, self.max_pool_size)
 
                 # Test connection
-                self._client.ping()
+                client.ping()
 
-            except Exception as e:
-                raise ConnectionError(f"Failed to connect to Docker daemon: {e}")
+            except (docker.errors.DockerException, OSError) as e:
+                raise ConnectionError(f"Failed to connect to Docker daemon: {e}") from e
+
+            if ORJSON_AVAILABLE:
+                _use_orjson_results(client.api)
+
+            # Bind low-level container operations once for the hot path
+            api = client.api
+            for attr, api_method in _API_METHODS.items():
+                self.__dict__[attr] = getattr(api, api_method)
+
+            # Publish the client only once it is fully set up
+            self._client = client
+
+            # Close the shared client's connection pool when the module is collected
+            self._client_finalizer = weakref.finalize(self, client.close)
 
         return self._client
 
+    def _cached_list(self, kind: str, key: str, fetch: Callable[[], List[Any]]) -> List[Any]:
+        """Return a list result from the TTL cache, fetching it from the daemon on a miss."""
+        if self.list_cache_ttl <= 0:
+            return fetch()
+
+        cache = self._list_cache[kind]
+        now = time.monotonic()
+        with self._list_cache_lock:
+            entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                return list(entry[1])
+
+        result = fetch()
+        with self._list_cache_lock:
+            cache[key] = (now + self.list_cache_ttl, result)
+        return list(result)
+
+    def _peek_list_cache(self, kind: str, key: str) -> Optional[List[Any]]:
+        """Return a fresh cached list result without fetching, or None."""
+        if self.list_cache_ttl <= 0:
+            return None
+        with self._list_cache_lock:
+            entry = self._list_cache[kind].get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+        return None
+
+    def _invalidate_list_cache(self, *kinds: str):
+        """Drop cached list results after a mutating operation."""
+        with self._list_cache_lock:
+            for kind in kinds or _LIST_CACHE_KINDS:
+                self._list_cache[kind].clear()
+
+    def __getattr__(self, name: str):
+        """Bind the APIClient method table on first use of any _api_* attribute."""
+        if name in _API_METHODS:
+            self.client
+            try:
+                return self.__dict__[name]
+            except KeyError:
+                pass
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
     # =============================================================================
     # Container Management
     # =============================================================================
@@ -175,271 +490,341 @@ class DockerModule(AIbasicModuleBase):
         Returns:
             Container object
         """
-        try:
-            container = self.client.containers.run(
-                image=image,
-                name=name,
-                command=command,
-                environment=environment,
-                ports=ports,
-                volumes=volumes,
-                detach=detach,
-                remove=remove,
-                network=network,
-                **kwargs
-            )
-            return container
-        except Exception as e:
-            raise RuntimeError(f"Failed to run container: {e}")
+        # Reuse normalized specs for repeated launches of the same template
+        if ports:
+            frozen = _freeze_mapping(ports)
+            if frozen is not None:
+                ports = _normalize_ports(frozen)
+        if isinstance(environment, dict):
+            frozen = _freeze_mapping(environment)
+            if frozen is not None:
+                environment = _normalize_environment(frozen)
+
+        container = self.client.containers.run(
+            image=image,
+            name=name,
+            command=command,
+            environment=environment,
+            ports=ports,
+            volumes=volumes,
+            detach=detach,
+            remove=remove,
+            network=network,
+            **kwargs
+        )
+        # May pull the image and create volumes as a side effect
+        self._invalidate_list_cache('containers', 'images', 'volumes')
+        return container
 
     def container_create(self, image: str, name: Optional[str] = None,
                         command: Optional[Union[str, List[str]]] = None,
                         **kwargs) -> Any:
         """Create a container without starting it."""
-        try:
-            container = self.client.containers.create(
-                image=image,
-                name=name,
-                command=command,
-                **kwargs
-            )
-            return container
-        except Exception as e:
-            raise RuntimeError(f"Failed to create container: {e}")
+        container = self.client.containers.create(
+            image=image,
+            name=name,
+            command=command,
+            **kwargs
+        )
+        self._invalidate_list_cache('containers', 'images', 'volumes')
+        return container
 
+    @_retry()
     def container_start(self, container_id: str) -> bool:
         """Start a container."""
-        try:
-            container = self.client.containers.get(container_id)
-            container.start()
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to start container: {e}")
+        self._api_start(container_id)
+        self._invalidate_list_cache('containers')
+        return True
 
+    @_retry()
     def container_stop(self, container_id: str, timeout: int = 10) -> bool:
         """Stop a container."""
-        try:
-            container = self.client.containers.get(container_id)
-            container.stop(timeout=timeout)
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to stop container: {e}")
+        self._api_stop(container_id, timeout=timeout)
+        self._invalidate_list_cache('containers')
+        return True
 
+    @_retry()
     def container_restart(self, container_id: str, timeout: int = 10) -> bool:
         """Restart a container."""
-        try:
-            container = self.client.containers.get(container_id)
-            container.restart(timeout=timeout)
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to restart container: {e}")
+        self._api_restart(container_id, timeout=timeout)
+        self._invalidate_list_cache('containers')
+        return True
 
     def container_remove(self, container_id: str, force: bool = False,
                         volumes: bool = False) -> bool:
         """Remove a container."""
-        try:
-            container = self.client.containers.get(container_id)
-            container.remove(force=force, v=volumes)
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to remove container: {e}")
+        self._api_remove_container(container_id, v=volumes, force=force)
+        self._invalidate_list_cache('containers', 'volumes')
+        return True
 
+    @_retry()
     def container_list(self, all: bool = False, filters: Optional[Dict] = None) -> List[Any]:
-        """List containers."""
-        try:
-            return self.client.containers.list(all=all, filters=filters)
-        except Exception as e:
-            raise RuntimeError(f"Failed to list containers: {e}")
+        """List containers (results reused for LIST_CACHE_TTL seconds)."""
+        if filters and _LOCAL_CONTAINER_FILTERS.issuperset(filters):
+            # Filter a fresh unfiltered listing locally instead of another round-trip
+            # (the daemon implies all=True when filtering by status)
+            if all or 'status' in filters:
+                snapshot = self._peek_list_cache('containers', _list_cache_key(True, None))
+                if snapshot is not None:
+                    return [c for c in snapshot if _container_matches(c, filters)]
+            else:
+                snapshot = self._peek_list_cache('containers', _list_cache_key(False, None))
+                if snapshot is not None:
+                    return [c for c in snapshot if _container_matches(c, filters)]
+                snapshot = self._peek_list_cache('containers', _list_cache_key(True, None))
+                if snapshot is not None:
+                    return [c for c in snapshot
+                            if c.status in _DEFAULT_LISTED_STATES and _container_matches(c, filters)]
+
+        return self._cached_list(
+            'containers', _list_cache_key(all, filters),
+            lambda: self.client.containers.list(all=all, filters=filters)
+        )
 
-    def container_logs(self, container_id: str, tail: int = 100,
-                      follow: bool = False, timestamps: bool = False) -> str:
-        """Get container logs."""
-        try:
-            container = self.client.containers.get(container_id)
-            logs = container.logs(
-                tail=tail,
-                follow=follow,
-                timestamps=timestamps
-            )
-            return logs.decode('utf-8') if isinstance(logs, bytes) else logs
-        except Exception as e:
-            raise RuntimeError(f"Failed to get container logs: {e}")
+    @_retry()
+    def container_logs(self, container_id: str, tail: Union[int, str] = 100,
+                      follow: bool = False, timestamps: bool = False) -> Union[str, Iterator[str]]:
+        """
+        Get container logs.
 
-    def container_stats(self, container_id: str, stream: bool = False) -> Dict:
-        """Get container stats."""
-        try:
-            container = self.client.containers.get(container_id)
-            stats = container.stats(stream=stream)
-            if not stream:
-                return stats
-            return next(stats)  # Return first stats object
-        except Exception as e:
-            raise RuntimeError(f"Failed to get container stats: {e}")
+        Logs are read as a stream and decoded chunk by chunk. With an integer
+        tail only the last `tail` lines are kept in memory; with follow=True a
+        generator of decoded text chunks is returned instead of a string.
+        """
+        chunks = _iter_decoded(self._api_logs(
+            container_id,
+            stream=True,
+            tail=tail,
+            follow=follow,
+            timestamps=timestamps
+        ))
+        if follow:
+            return chunks
+        if not isinstance(tail, int) or isinstance(tail, bool):
+            return ''.join(chunks)
+
+        lines = deque(maxlen=tail)
+        pending = ''
+        for text in chunks:
+            # Only newlines end a log line (splitlines would also break on \r, \x0b, \u2028, ...)
+            *complete, pending = (pending + text).split('\n')
+            lines.extend(line + '\n' for line in complete)
+        if pending:
+            lines.append(pending)
+        return ''.join(lines)
+
+    @_retry()
+    def container_stats(self, container_id: str, stream: bool = False,
+                        one_shot: bool = False) -> Dict:
+        """
+        Get container stats.
+
+        one_shot=True returns a single sample without the daemon's one-second
+        wait (Docker API 1.41+), but its precpu_stats are zeroed, so CPU usage
+        cannot be computed from it. Older daemons fall back to a regular sample.
+        """
+        if not stream:
+            if one_shot:
+                try:
+                    return self._api_stats(container_id, stream=False, one_shot=True)
+                except docker.errors.InvalidVersion:
+                    pass
+            return self._api_stats(container_id, stream=False)
+        return next(self._api_stats(container_id, stream=True, decode=True))  # First stats object
 
     def container_exec(self, container_id: str, command: Union[str, List[str]],
                       detach: bool = False, tty: bool = False) -> Union[str, bool]:
         """Execute a command in a running container."""
-        try:
-            container = self.client.containers.get(container_id)
-            result = container.exec_run(command, detach=detach, tty=tty)
-            if detach:
-                return True
-            return result.output.decode('utf-8') if isinstance(result.output, bytes) else result.output
-        except Exception as e:
-            raise RuntimeError(f"Failed to execute command in container: {e}")
+        container = self.client.containers.get(container_id)
+        result = container.exec_run(command, detach=detach, tty=tty)
+        if detach:
+            return True
+        return result.output.decode('utf-8', errors='replace')
 
+    @_retry()
     def container_inspect(self, container_id: str) -> Dict:
         """Inspect a container."""
-        try:
-            container = self.client.containers.get(container_id)
-            return container.attrs
-        except Exception as e:
-            raise RuntimeError(f"Failed to inspect container: {e}")
+        return self._api_inspect_container(container_id)
 
+    @_retry()
     def container_pause(self, container_id: str) -> bool:
         """Pause a container."""
-        try:
-            container = self.client.containers.get(container_id)
-            container.pause()
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to pause container: {e}")
+        self._api_pause(container_id)
+        self._invalidate_list_cache('containers')
+        return True
 
+    @_retry()
     def container_unpause(self, container_id: str) -> bool:
         """Unpause a container."""
-        try:
-            container = self.client.containers.get(container_id)
-            container.unpause()
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to unpause container: {e}")
+        self._api_unpause(container_id)
+        self._invalidate_list_cache('containers')
+        return True
 
     def container_kill(self, container_id: str, signal: str = 'SIGKILL') -> bool:
         """Kill a container."""
-        try:
-            container = self.client.containers.get(container_id)
-            container.kill(signal=signal)
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to kill container: {e}")
+        self._api_kill(container_id, signal=signal)
+        self._invalidate_list_cache('containers')
+        return True
 
     def container_rename(self, container_id: str, new_name: str) -> bool:
         """Rename a container."""
-        try:
-            container = self.client.containers.get(container_id)
-            container.rename(new_name)
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to rename container: {e}")
+        self._api_rename(container_id, new_name)
+        self._invalidate_list_cache('containers')
+        return True
 
     # =============================================================================
     # Image Management
     # =============================================================================
 
+    @_retry()
     def image_pull(self, repository: str, tag: str = 'latest',
-                   all_tags: bool = False) -> Any:
-        """Pull an image from registry."""
-        try:
-            image = self.client.images.pull(
-                repository=repository,
-                tag=tag,
-                all_tags=all_tags
-            )
-            return image
-        except Exception as e:
-            raise RuntimeError(f"Failed to pull image: {e}")
+                   all_tags: bool = False, force: bool = False) -> Any:
+        """
+        Pull an image from registry.
+
+        Images already pulled by this module are returned from the local
+        daemon without another registry round-trip while the local image ID
+        still matches. Use force=True to always contact the registry.
+        """
+        key = (repository, tag)
+        if not all_tags and not force:
+            cached_id = self._pull_cache.get(key)
+            if cached_id is not None:
+                try:
+                    image = self.client.images.get(f"{repository}:{tag}")
+                except docker.errors.ImageNotFound:
+                    image = None
+                if image is not None and image.id == cached_id:
+                    return image
+
+        image = self.client.images.pull(
+            repository=repository,
+            tag=tag,
+            all_tags=all_tags
+        )
+        if not all_tags:
+            self._pull_cache[key] = image.id
+        self._invalidate_list_cache('images')
+        return image
 
     def image_build(self, path: str, tag: Optional[str] = None,
                    dockerfile: str = 'Dockerfile',
                    buildargs: Optional[Dict[str, str]] = None,
-                   nocache: bool = False, rm: bool = True) -> Any:
-        """Build an image from a Dockerfile."""
-        try:
-            image, build_logs = self.client.images.build(
-                path=path,
-                tag=tag,
-                dockerfile=dockerfile,
-                buildargs=buildargs,
-                nocache=nocache,
-                rm=rm
-            )
-            return image
-        except Exception as e:
-            raise RuntimeError(f"Failed to build image: {e}")
+                   nocache: bool = False, rm: bool = True,
+                   on_log: Optional[Callable[[Dict], None]] = None) -> Any:
+        """
+        Build an image from a Dockerfile.
 
+        Build output is consumed as a stream and discarded chunk by chunk, so
+        memory stays flat regardless of log volume. Pass on_log to observe
+        each decoded log entry.
+        """
+        image_id = None
+        last_error = None
+        for chunk in self.client.api.build(
+            path=path,
+            tag=tag,
+            dockerfile=dockerfile,
+            buildargs=buildargs,
+            nocache=nocache,
+            rm=rm,
+            decode=True
+        ):
+            if on_log is not None:
+                on_log(chunk)
+            if 'error' in chunk:
+                last_error = chunk['error']
+            elif 'aux' in chunk and 'ID' in chunk['aux']:
+                image_id = chunk['aux']['ID']
+
+        self._invalidate_list_cache('images')
+        if last_error is not None:
+            raise docker.errors.BuildError(last_error, [])
+        if image_id is None and tag is None:
+            raise docker.errors.BuildError('Unknown', [])
+        return self.client.images.get(image_id or tag)
+
+    @_retry()
     def image_push(self, repository: str, tag: str = 'latest',
                    auth_config: Optional[Dict] = None) -> bool:
-        """Push an image to registry."""
-        try:
-            if auth_config is None and self.registry_username and self.registry_password:
-                auth_config = {
-                    'username': self.registry_username,
-                    'password': self.registry_password
-                }
-
-            self.client.images.push(
-                repository=repository,
-                tag=tag,
-                auth_config=auth_config
-            )
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to push image: {e}")
+        """
+        Push an image to registry.
+
+        With configured credentials the module logs in to the default registry
+        once (a failed login raises); pushes to it then use the client's cached
+        login instead of sending the credentials again. Other registries are
+        sent the configured credentials directly.
+        """
+        if auth_config is None and self._default_auth:
+            registry, _ = docker.auth.resolve_repository_name(repository)
+            if registry == docker.auth.resolve_index_name(self.default_registry or docker.auth.INDEX_NAME):
+                if not self._registry_logged_in:
+                    self.client.login(
+                        username=self.registry_username,
+                        password=self.registry_password,
+                        registry=self.default_registry,
+                        reauth=False
+                    )
+                    self._registry_logged_in = True
+            else:
+                auth_config = self._default_auth
+
+        self.client.images.push(
+            repository=repository,
+            tag=tag,
+            auth_config=auth_config
+        )
+        return True
 
     def image_tag(self, image: str, repository: str, tag: str = 'latest') -> bool:
         """Tag an image."""
-        try:
-            img = self.client.images.get(image)
-            img.tag(repository=repository, tag=tag)
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to tag image: {e}")
+        img = self.client.images.get(image)
+        img.tag(repository=repository, tag=tag)
+        self._invalidate_list_cache('images')
+        return True
 
     def image_remove(self, image: str, force: bool = False,
                     noprune: bool = False) -> bool:
         """Remove an image."""
-        try:
-            self.client.images.remove(image=image, force=force, noprune=noprune)
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to remove image: {e}")
+        self.client.images.remove(image=image, force=force, noprune=noprune)
+        self._invalidate_list_cache('images')
+        return True
 
+    @_retry()
     def image_list(self, all: bool = False, filters: Optional[Dict] = None) -> List[Any]:
-        """List images."""
-        try:
-            return self.client.images.list(all=all, filters=filters)
-        except Exception as e:
-            raise RuntimeError(f"Failed to list images: {e}")
+        """List images (results reused for LIST_CACHE_TTL seconds)."""
+        if filters and _LOCAL_IMAGE_FILTERS.issuperset(filters):
+            snapshot = self._peek_list_cache('images', _list_cache_key(all, None))
+            if snapshot is not None:
+                return [img for img in snapshot if _image_matches(img, filters)]
+
+        return self._cached_list(
+            'images', _list_cache_key(all, filters),
+            lambda: self.client.images.list(all=all, filters=filters)
+        )
 
+    @_retry()
     def image_search(self, term: str, limit: int = 25) -> List[Dict]:
         """Search for images on Docker Hub."""
-        try:
-            return self.client.images.search(term=term, limit=limit)
-        except Exception as e:
-            raise RuntimeError(f"Failed to search images: {e}")
+        return self.client.images.search(term=term, limit=limit)
 
+    @_retry()
     def image_inspect(self, image: str) -> Dict:
         """Inspect an image."""
-        try:
-            img = self.client.images.get(image)
-            return img.attrs
-        except Exception as e:
-            raise RuntimeError(f"Failed to inspect image: {e}")
+        img = self.client.images.get(image)
+        return img.attrs
 
+    @_retry()
     def image_history(self, image: str) -> List[Dict]:
         """Get image history."""
-        try:
-            img = self.client.images.get(image)
-            return img.history()
-        except Exception as e:
-            raise RuntimeError(f"Failed to get image history: {e}")
+        img = self.client.images.get(image)
+        return img.history()
 
     def image_prune(self, filters: Optional[Dict] = None) -> Dict:
         """Remove unused images."""
-        try:
-            return self.client.images.prune(filters=filters)
-        except Exception as e:
-            raise RuntimeError(f"Failed to prune images: {e}")
+        result = self.client.images.prune(filters=filters)
+        self._invalidate_list_cache('images')
+        return result
 
     # =============================================================================
     # Volume Management
@@ -450,47 +835,41 @@ class DockerModule(AIbasicModuleBase):
                      driver_opts: Optional[Dict] = None,
                      labels: Optional[Dict] = None) -> Any:
         """Create a volume."""
-        try:
-            volume = self.client.volumes.create(
-                name=name,
-                driver=driver,
-                driver_opts=driver_opts,
-                labels=labels
-            )
-            return volume
-        except Exception as e:
-            raise RuntimeError(f"Failed to create volume: {e}")
+        volume = self.client.volumes.create(
+            name=name,
+            driver=driver,
+            driver_opts=driver_opts,
+            labels=labels
+        )
+        self._invalidate_list_cache('volumes')
+        return volume
 
     def volume_remove(self, name: str, force: bool = False) -> bool:
         """Remove a volume."""
-        try:
-            volume = self.client.volumes.get(name)
-            volume.remove(force=force)
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to remove volume: {e}")
+        volume = self.client.volumes.get(name)
+        volume.remove(force=force)
+        self._invalidate_list_cache('volumes')
+        return True
 
+    @_retry()
     def volume_list(self, filters: Optional[Dict] = None) -> List[Any]:
-        """List volumes."""
-        try:
-            return self.client.volumes.list(filters=filters)
-        except Exception as e:
-            raise RuntimeError(f"Failed to list volumes: {e}")
+        """List volumes (results reused for LIST_CACHE_TTL seconds)."""
+        return self._cached_list(
+            'volumes', _list_cache_key(filters),
+            lambda: self.client.volumes.list(filters=filters)
+        )
 
+    @_retry()
     def volume_inspect(self, name: str) -> Dict:
         """Inspect a volume."""
-        try:
-            volume = self.client.volumes.get(name)
-            return volume.attrs
-        except Exception as e:
-            raise RuntimeError(f"Failed to inspect volume: {e}")
+        volume = self.client.volumes.get(name)
+        return volume.attrs
 
     def volume_prune(self, filters: Optional[Dict] = None) -> Dict:
         """Remove unused volumes."""
-        try:
-            return self.client.volumes.prune(filters=filters)
-        except Exception as e:
-            raise RuntimeError(f"Failed to prune volumes: {e}")
+        result = self.client.volumes.prune(filters=filters)
+        self._invalidate_list_cache('volumes')
+        return result
 
     # =============================================================================
     # Network Management
@@ -504,142 +883,120 @@ class DockerModule(AIbasicModuleBase):
                       labels: Optional[Dict] = None,
                       enable_ipv6: bool = False) -> Any:
         """Create a network."""
-        try:
-            network = self.client.networks.create(
-                name=name,
-                driver=driver,
-                options=options,
-                ipam=ipam,
-                check_duplicate=check_duplicate,
-                internal=internal,
-                labels=labels,
-                enable_ipv6=enable_ipv6
-            )
-            return network
-        except Exception as e:
-            raise RuntimeError(f"Failed to create network: {e}")
+        network = self.client.networks.create(
+            name=name,
+            driver=driver,
+            options=options,
+            ipam=ipam,
+            check_duplicate=check_duplicate,
+            internal=internal,
+            labels=labels,
+            enable_ipv6=enable_ipv6
+        )
+        self._invalidate_list_cache('networks')
+        return network
 
     def network_remove(self, name: str) -> bool:
         """Remove a network."""
-        try:
-            network = self.client.networks.get(name)
-            network.remove()
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to remove network: {e}")
+        network = self.client.networks.get(name)
+        network.remove()
+        self._invalidate_list_cache('networks')
+        return True
 
+    @_retry()
     def network_list(self, names: Optional[List[str]] = None,
                     ids: Optional[List[str]] = None,
                     filters: Optional[Dict] = None) -> List[Any]:
-        """List networks."""
-        try:
-            return self.client.networks.list(names=names, ids=ids, filters=filters)
-        except Exception as e:
-            raise RuntimeError(f"Failed to list networks: {e}")
+        """List networks (results reused for LIST_CACHE_TTL seconds)."""
+        return self._cached_list(
+            'networks', _list_cache_key(names, ids, filters),
+            lambda: self.client.networks.list(names=names, ids=ids, filters=filters)
+        )
 
+    @_retry()
     def network_inspect(self, name: str) -> Dict:
         """Inspect a network."""
-        try:
-            network = self.client.networks.get(name)
-            return network.attrs
-        except Exception as e:
-            raise RuntimeError(f"Failed to inspect network: {e}")
+        network = self.client.networks.get(name)
+        return network.attrs
 
     def network_connect(self, network_name: str, container_id: str,
                        aliases: Optional[List[str]] = None,
                        ipv4_address: Optional[str] = None,
                        ipv6_address: Optional[str] = None) -> bool:
         """Connect a container to a network."""
-        try:
-            network = self.client.networks.get(network_name)
-            network.connect(
-                container=container_id,
-                aliases=aliases,
-                ipv4_address=ipv4_address,
-                ipv6_address=ipv6_address
-            )
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to connect container to network: {e}")
+        network = self.client.networks.get(network_name)
+        network.connect(
+            container=container_id,
+            aliases=aliases,
+            ipv4_address=ipv4_address,
+            ipv6_address=ipv6_address
+        )
+        self._invalidate_list_cache('networks')
+        return True
 
     def network_disconnect(self, network_name: str, container_id: str,
                           force: bool = False) -> bool:
         """Disconnect a container from a network."""
-        try:
-            network = self.client.networks.get(network_name)
-            network.disconnect(container=container_id, force=force)
-            return True
-        except Exception as e:
-            raise RuntimeError(f"Failed to disconnect container from network: {e}")
+        network = self.client.networks.get(network_name)
+        network.disconnect(container=container_id, force=force)
+        self._invalidate_list_cache('networks')
+        return True
 
     def network_prune(self, filters: Optional[Dict] = None) -> Dict:
         """Remove unused networks."""
-        try:
-            return self.client.networks.prune(filters=filters)
-        except Exception as e:
-            raise RuntimeError(f"Failed to prune networks: {e}")
+        result = self.client.networks.prune(filters=filters)
+        self._invalidate_list_cache('networks')
+        return result
 
     # =============================================================================
     # System and Info
     # =============================================================================
 
+    @_retry()
     def system_info(self) -> Dict:
         """Get Docker system information."""
-        try:
-            return self.client.info()
-        except Exception as e:
-            raise RuntimeError(f"Failed to get system info: {e}")
+        return self.client.info()
 
+    @_retry()
     def system_version(self) -> Dict:
         """Get Docker version."""
-        try:
-            return self.client.version()
-        except Exception as e:
-            raise RuntimeError(f"Failed to get version: {e}")
+        return self.client.version()
 
+    @_retry()
     def system_df(self) -> Dict:
         """Get Docker disk usage."""
-        try:
-            return self.client.df()
-        except Exception as e:
-            raise RuntimeError(f"Failed to get disk usage: {e}")
+        return self.client.df()
 
+    @_retry()
     def system_ping(self) -> bool:
         """Ping Docker daemon."""
-        try:
-            return self.client.ping()
-        except Exception as e:
-            raise RuntimeError(f"Failed to ping Docker daemon: {e}")
+        return self.client.ping()
 
     def system_prune(self, all: bool = False, volumes: bool = False,
                     filters: Optional[Dict] = None) -> Dict:
         """Prune unused Docker objects."""
-        try:
-            # Prune containers
-            container_prune = self.client.containers.prune(filters=filters)
+        # Prune containers
+        container_prune = self.client.containers.prune(filters=filters)
 
-            # Prune images
-            image_filters = filters.copy() if filters else {}
-            if all:
-                image_filters['dangling'] = False
-            image_prune = self.client.images.prune(filters=image_filters)
+        # Prune images
+        image_filters = {**(filters or {}), 'dangling': False} if all else filters
+        image_prune = self.client.images.prune(filters=image_filters)
 
-            # Prune networks
-            network_prune = self.client.networks.prune(filters=filters)
+        # Prune networks
+        network_prune = self.client.networks.prune(filters=filters)
 
-            # Prune volumes
-            volume_prune = {}
-            if volumes:
-                volume_prune = self.client.volumes.prune(filters=filters)
+        # Prune volumes
+        volume_prune = {}
+        if volumes:
+            volume_prune = self.client.volumes.prune(filters=filters)
 
-            return {
-                'containers': container_prune,
-                'images': image_prune,
-                'networks': network_prune,
-                'volumes': volume_prune
-            }
-        except Exception as e:
-            raise RuntimeError(f"Failed to prune system: {e}")
+        self._invalidate_list_cache()
+        return {
+            'containers': container_prune,
+            'images': image_prune,
+            'networks': network_prune,
+            'volumes': volume_prune
+        }
 
     # =============================================================================
     # Utility Methods
@@ -647,9 +1004,12 @@ class DockerModule(AIbasicModuleBase):
 
     def close(self):
         """Close Docker client connection."""
-        if self._client:
-            self._client.close()
-            self._client = None
+        if self._client_finalizer is not None:
+            self._client_finalizer()
+            self._client_finalizer = None
+        self._client = None
+        for attr in _API_METHODS:
+            self.__dict__.pop(attr, None)
 
     # =============================================================================
     # Metadata Methods for AIbasic Compiler
@@ -672,7 +1032,7 @@ class DockerModule(AIbasicModuleBase):
     def get_usage_notes(cls):
         """Get detailed usage notes."""
         return [
-            "Module uses singleton pattern - one instance per application",
+            "Use DockerModule.instance() to share one module instance (and Docker client) per application",
             "Requires Docker daemon running (Docker Desktop on Windows/Mac, Docker Engine on Linux)",
             "Docker client connects via unix socket (Linux/Mac) or named pipe (Windows)",
             "TCP connection supported for remote Docker hosts with optional TLS",
@@ -681,317 +1041,468 @@ class DockerModule(AIbasicModuleBase):
             "Volume operations: create, remove, list, inspect for persistent data",
             "Network operations: create, connect, disconnect for container networking",
             "All operations use Docker SDK for Python (official Docker library)",
+            "One Docker client connection pool is created on first use and reused by every method until close()",
             "Detach mode runs containers in background (detach=True)",
             "Port mappings format: {'80/tcp': 8080} maps container port 80 to host port 8080",
             "Volume mounts format: {'/host/path': {'bind': '/container/path', 'mode': 'rw'}}",
             "Environment variables passed as dict: {'VAR': 'value'}",
             "Container logs support tail, follow, and timestamp options",
+            "List results (containers, images, volumes, networks) are cached for LIST_CACHE_TTL seconds (default 2) and invalidated by mutating calls",
             "System prune removes unused containers, images, networks, and volumes",
+            "Errors propagate as Docker SDK exceptions (docker.errors.NotFound, ImageNotFound, ContainerError, APIError)",
+            "Idempotent calls (start/stop, list, inspect, logs, pull, push, system info) retry transient daemon errors up to 3 times with jittered backoff",
             "Key methods: container_run, container_list, image_pull, image_build, volume_create, network_create",
         ]
 
     @classmethod
     def get_methods_info(cls):
         """Get information about module methods."""
-        from aibasic.modules.module_base import MethodInfo
-        return [
-            MethodInfo(
-                name="container_run",
-                description="Run a container from an image with full configuration options",
-                parameters={
-                    "image": "Image name and tag (e.g., 'nginx:latest', 'ubuntu:22.04')",
-                    "name": "Container name (optional, Docker generates if omitted)",
-                    "command": "Command to run (string or list, optional, uses image default)",
-                    "environment": "Environment variables dict (optional, e.g., {'DB_HOST': 'localhost'})",
-                    "ports": "Port mappings dict (optional, e.g., {'80/tcp': 8080})",
-                    "volumes": "Volume mounts dict (optional, e.g., {'/host': {'bind': '/container', 'mode': 'rw'}})",
-                    "detach": "Run in background (default: True)",
-                    "remove": "Auto-remove container when stopped (default: False)",
-                    "network": "Network to connect to (optional, e.g., 'bridge', 'host')"
-                },
-                returns="Container object if detach=True, otherwise container output",
-                examples=[
-                    '(docker) run container "nginx:latest" with name "web-server" ports {"80/tcp": 8080} detach True',
-                    '(docker) run container "ubuntu:22.04" command "echo Hello" detach False',
-                    '(docker) run container "postgres:15" environment {"POSTGRES_PASSWORD": "secret"} volumes {"/data": {"bind": "/var/lib/postgresql/data"}}',
-                ]
-            ),
-            MethodInfo(
-                name="container_start",
-                description="Start a stopped container",
-                parameters={
-                    "container_id": "Container ID or name (string)"
-                },
-                returns="Boolean True on success, raises RuntimeError on failure",
-                examples=[
-                    '(docker) start container "web-server"',
-                    '(docker) start container by id "a1b2c3d4"',
-                ]
-            ),
-            MethodInfo(
-                name="container_stop",
-                description="Stop a running container gracefully with timeout",
-                parameters={
-                    "container_id": "Container ID or name (string)",
-                    "timeout": "Seconds to wait before force kill (default: 10)"
-                },
-                returns="Boolean True on success",
-                examples=[
-                    '(docker) stop container "web-server"',
-                    '(docker) stop container "app" timeout 30',
-                ]
-            ),
-            MethodInfo(
-                name="container_restart",
-                description="Restart a container (stop then start)",
-                parameters={
-                    "container_id": "Container ID or name (string)",
-                    "timeout": "Seconds to wait before force kill (default: 10)"
-                },
-                returns="Boolean True on success",
-                examples=[
-                    '(docker) restart container "web-server"',
-                    '(docker) restart container "api-server" timeout 15',
-                ]
-            ),
-            MethodInfo(
-                name="container_remove",
-                description="Remove a container (must be stopped unless force=True)",
-                parameters={
-                    "container_id": "Container ID or name (string)",
-                    "force": "Force remove running container (default: False)",
-                    "volumes": "Remove associated anonymous volumes (default: False)"
-                },
-                returns="Boolean True on success",
-                examples=[
-                    '(docker) remove container "old-server"',
-                    '(docker) remove container "temp" force True volumes True',
-                ]
-            ),
-            MethodInfo(
-                name="container_list",
-                description="List containers (running by default, all with all=True)",
-                parameters={
-                    "all": "Include stopped containers (default: False)",
-                    "filters": "Filter dict (optional, e.g., {'status': 'running', 'name': 'web'})"
-                },
-                returns="List of Container objects with attributes: id, name, status, image",
-                examples=[
-                    '(docker) list containers',
-                    '(docker) list all containers',
-                    '(docker) list containers with filters {"status": "exited"}',
-                ]
-            ),
-            MethodInfo(
-                name="container_logs",
-                description="Get container logs with optional tail, follow, and timestamps",
-                parameters={
-                    "container_id": "Container ID or name (string)",
-                    "tail": "Number of lines from end (default: 100, 'all' for everything)",
-                    "follow": "Stream logs in real-time (default: False)",
-                    "timestamps": "Include timestamps (default: False)"
-                },
-                returns="String with container logs",
-                examples=[
-                    '(docker) get logs from container "web-server" tail 50',
-                    '(docker) get logs from container "app" timestamps True',
-                ]
-            ),
-            MethodInfo(
-                name="container_exec",
-                description="Execute a command inside a running container",
-                parameters={
-                    "container_id": "Container ID or name (string)",
-                    "command": "Command to execute (string or list, e.g., 'ls -la' or ['ls', '-la'])",
-                    "detach": "Run in background (default: False)",
-                    "tty": "Allocate pseudo-TTY (default: False)"
-                },
-                returns="Command output as string if detach=False, otherwise True",
-                examples=[
-                    '(docker) exec in container "web-server" command "cat /etc/nginx/nginx.conf"',
-                    '(docker) exec in container "db" command ["mysqldump", "-u", "root", "mydb"]',
-                ]
-            ),
-            MethodInfo(
-                name="image_pull",
-                description="Pull an image from Docker registry (Docker Hub by default)",
-                parameters={
-                    "repository": "Repository name (e.g., 'nginx', 'ubuntu', 'myuser/myimage')",
-                    "tag": "Image tag (default: 'latest')",
-                    "all_tags": "Pull all tags (default: False)"
-                },
-                returns="Image object",
-                examples=[
-                    '(docker) pull image "nginx" tag "latest"',
-                    '(docker) pull image "postgres" tag "15-alpine"',
-                    '(docker) pull image "python" tag "3.11-slim"',
-                ]
-            ),
-            MethodInfo(
-                name="image_build",
-                description="Build an image from a Dockerfile",
-                parameters={
-                    "path": "Build context path (directory containing Dockerfile)",
-                    "tag": "Tag for the image (optional, e.g., 'myapp:v1.0')",
-                    "dockerfile": "Dockerfile name (default: 'Dockerfile')",
-                    "buildargs": "Build arguments dict (optional, e.g., {'VERSION': '1.0'})",
-                    "nocache": "Don't use cache (default: False)",
-                    "rm": "Remove intermediate containers (default: True)"
-                },
-                returns="Image object",
-                examples=[
-                    '(docker) build image from "." tag "myapp:v1.0"',
-                    '(docker) build image from "/app" dockerfile "Dockerfile.prod" nocache True',
-                    '(docker) build image from "." tag "app:latest" buildargs {"NODE_ENV": "production"}',
-                ]
-            ),
-            MethodInfo(
-                name="image_push",
-                description="Push an image to Docker registry",
-                parameters={
-                    "repository": "Repository name (e.g., 'myuser/myimage')",
-                    "tag": "Image tag (default: 'latest')",
-                    "auth_config": "Auth dict with username/password (optional, uses config if omitted)"
-                },
-                returns="Boolean True on success",
-                examples=[
-                    '(docker) push image "myuser/myapp" tag "v1.0"',
-                    '(docker) push image "registry.example.com/app" tag "latest"',
-                ]
-            ),
-            MethodInfo(
-                name="image_list",
-                description="List Docker images on the system",
-                parameters={
-                    "all": "Include intermediate images (default: False)",
-                    "filters": "Filter dict (optional, e.g., {'dangling': True})"
-                },
-                returns="List of Image objects with attributes: id, tags, size",
-                examples=[
-                    '(docker) list images',
-                    '(docker) list all images',
-                ]
-            ),
-            MethodInfo(
-                name="volume_create",
-                description="Create a Docker volume for persistent data storage",
-                parameters={
-                    "name": "Volume name (optional, Docker generates if omitted)",
-                    "driver": "Volume driver (default: 'local')",
-                    "driver_opts": "Driver options dict (optional)",
-                    "labels": "Labels dict (optional)"
-                },
-                returns="Volume object",
-                examples=[
-                    '(docker) create volume "db-data"',
-                    '(docker) create volume "app-config" labels {"env": "prod"}',
-                ]
-            ),
-            MethodInfo(
-                name="volume_list",
-                description="List Docker volumes",
-                parameters={
-                    "filters": "Filter dict (optional)"
-                },
-                returns="List of Volume objects with attributes: name, driver, mountpoint",
-                examples=[
-                    '(docker) list volumes',
-                ]
-            ),
-            MethodInfo(
-                name="network_create",
-                description="Create a Docker network for container communication",
-                parameters={
-                    "name": "Network name (string)",
-                    "driver": "Network driver (default: 'bridge', options: 'host', 'overlay', 'macvlan')",
-                    "internal": "Internal network, no external access (default: False)",
-                    "enable_ipv6": "Enable IPv6 (default: False)"
-                },
-                returns="Network object",
-                examples=[
-                    '(docker) create network "app-network"',
-                    '(docker) create network "backend" driver "bridge" internal True',
-                ]
-            ),
-            MethodInfo(
-                name="network_connect",
-                description="Connect a container to a network",
-                parameters={
-                    "network_name": "Network name (string)",
-                    "container_id": "Container ID or name (string)",
-                    "aliases": "Network aliases list (optional)",
-                    "ipv4_address": "Static IPv4 address (optional)",
-                    "ipv6_address": "Static IPv6 address (optional)"
-                },
-                returns="Boolean True on success",
-                examples=[
-                    '(docker) connect container "web-server" to network "app-network"',
-                    '(docker) connect container "api" to network "backend" aliases ["api-service"]',
-                ]
-            ),
-        ]
+        return _METHOD_INFOS
+
+    @classmethod
+    def get_method(cls, name: str) -> Optional[MethodInfo]:
+        """Look up a method's info by name, or None if unknown."""
+        return _METHOD_INFOS_BY_NAME.get(name)
 
     @classmethod
     def get_examples(cls):
         """Get AIbasic usage examples."""
-        return [
-            # Container lifecycle
-            '10 (docker) pull image "nginx" tag "latest"',
-            '20 (docker) run container "nginx:latest" name "web" ports {"80/tcp": 8080} detach True',
-            '30 (docker) list containers',
-            '40 (docker) get logs from container "web" tail 100',
-            '50 (docker) stop container "web"',
-            '60 (docker) start container "web"',
-            '70 (docker) restart container "web"',
-            '80 (docker) remove container "web" force True',
-
-            # Image management
-            '90 (docker) pull image "postgres" tag "15-alpine"',
-            '100 (docker) build image from "." tag "myapp:v1.0"',
-            '110 (docker) list images',
-            '120 (docker) push image "myuser/myapp" tag "v1.0"',
-            '130 (docker) remove image "old-image:v0.1"',
-
-            # Container with environment and volumes
-            '140 (docker) run container "postgres:15" name "db" environment {"POSTGRES_PASSWORD": "secret", "POSTGRES_DB": "mydb"} volumes {"/var/lib/postgres": {"bind": "/var/lib/postgresql/data"}} ports {"5432/tcp": 5432}',
-
-            # Execute commands
-            '150 (docker) exec in container "web" command "nginx -s reload"',
-            '160 (docker) exec in container "db" command "pg_dump -U postgres mydb"',
-
-            # Volume management
-            '170 (docker) create volume "db-data"',
-            '180 (docker) list volumes',
-            '190 (docker) run container "mysql:8" volumes {"db-data": {"bind": "/var/lib/mysql"}}',
-
-            # Network management
-            '200 (docker) create network "app-network"',
-            '210 (docker) run container "nginx" network "app-network"',
-            '220 (docker) connect container "api-server" to network "app-network"',
-            '230 (docker) list networks',
-
-            # System operations
-            '240 (docker) system info',
-            '250 (docker) system version',
-        ]
+        return _EXAMPLES
+
+    @classmethod
+    @functools.cache
+    def get_examples_ast(cls) -> tuple:
+        """
+        Get the usage examples parsed by the AIbasic instruction parser.
+
+        Parsed once per process on first call; the compiler is imported here
+        rather than at module load to avoid a circular import.
+        """
+        from aibasic.aibasicc import parse_instruction
+        return tuple(parse_instruction(example) for example in _EXAMPLES)
+
+
+# Static metadata catalog, built once at import time and shared read-only
+_METHOD_INFOS = (
+    MethodInfo(
+        name="container_run",
+        description="Run a container from an image with full configuration options",
+        parameters=MappingProxyType({
+            "image": "Image name and tag (e.g., 'nginx:latest', 'ubuntu:22.04')",
+            "name": "Container name (optional, Docker generates if omitted)",
+            "command": "Command to run (string or list, optional, uses image default)",
+            "environment": "Environment variables dict (optional, e.g., {'DB_HOST': 'localhost'})",
+            "ports": "Port mappings dict (optional, e.g., {'80/tcp': 8080})",
+            "volumes": "Volume mounts dict (optional, e.g., {'/host': {'bind': '/container', 'mode': 'rw'}})",
+            "detach": "Run in background (default: True)",
+            "remove": "Auto-remove container when stopped (default: False)",
+            "network": "Network to connect to (optional, e.g., 'bridge', 'host')"
+        }),
+        returns="Container object if detach=True, otherwise container output",
+        examples=(
+            '(docker) run container "nginx:latest" with name "web-server" ports {"80/tcp": 8080} detach True',
+            '(docker) run container "ubuntu:22.04" command "echo Hello" detach False',
+            '(docker) run container "postgres:15" environment {"POSTGRES_PASSWORD": "secret"} volumes {"/data": {"bind": "/var/lib/postgresql/data"}}',
+        )
+    ),
+    MethodInfo(
+        name="container_start",
+        description="Start a stopped container",
+        parameters=MappingProxyType({
+            "container_id": "Container ID or name (string)"
+        }),
+        returns="Boolean True on success, raises docker.errors.APIError on failure",
+        examples=(
+            '(docker) start container "web-server"',
+            '(docker) start container by id "a1b2c3d4"',
+        )
+    ),
+    MethodInfo(
+        name="container_stop",
+        description="Stop a running container gracefully with timeout",
+        parameters=MappingProxyType({
+            "container_id": "Container ID or name (string)",
+            "timeout": "Seconds to wait before force kill (default: 10)"
+        }),
+        returns="Boolean True on success",
+        examples=(
+            '(docker) stop container "web-server"',
+            '(docker) stop container "app" timeout 30',
+        )
+    ),
+    MethodInfo(
+        name="container_restart",
+        description="Restart a container (stop then start)",
+        parameters=MappingProxyType({
+            "container_id": "Container ID or name (string)",
+            "timeout": "Seconds to wait before force kill (default: 10)"
+        }),
+        returns="Boolean True on success",
+        examples=(
+            '(docker) restart container "web-server"',
+            '(docker) restart container "api-server" timeout 15',
+        )
+    ),
+    MethodInfo(
+        name="container_remove",
+        description="Remove a container (must be stopped unless force=True)",
+        parameters=MappingProxyType({
+            "container_id": "Container ID or name (string)",
+            "force": "Force remove running container (default: False)",
+            "volumes": "Remove associated anonymous volumes (default: False)"
+        }),
+        returns="Boolean True on success",
+        examples=(
+            '(docker) remove container "old-server"',
+            '(docker) remove container "temp" force True volumes True',
+        )
+    ),
+    MethodInfo(
+        name="container_list",
+        description="List containers (running by default, all with all=True)",
+        parameters=MappingProxyType({
+            "all": "Include stopped containers (default: False)",
+            "filters": "Filter dict (optional, e.g., {'status': 'running', 'name': 'web'})"
+        }),
+        returns="List of Container objects with attributes: id, name, status, image",
+        examples=(
+            '(docker) list containers',
+            '(docker) list all containers',
+            '(docker) list containers with filters {"status": "exited"}',
+        )
+    ),
+    MethodInfo(
+        name="container_logs",
+        description="Get container logs with optional tail, follow, and timestamps",
+        parameters=MappingProxyType({
+            "container_id": "Container ID or name (string)",
+            "tail": "Number of lines from end (default: 100, 'all' for everything)",
+            "follow": "Stream logs in real-time (default: False)",
+            "timestamps": "Include timestamps (default: False)"
+        }),
+        returns="String with container logs (generator of text chunks if follow=True)",
+        examples=(
+            '(docker) get logs from container "web-server" tail 50',
+            '(docker) get logs from container "app" timestamps True',
+        )
+    ),
+    MethodInfo(
+        name="container_exec",
+        description="Execute a command inside a running container",
+        parameters=MappingProxyType({
+            "container_id": "Container ID or name (string)",
+            "command": "Command to execute (string or list, e.g., 'ls -la' or ['ls', '-la'])",
+            "detach": "Run in background (default: False)",
+            "tty": "Allocate pseudo-TTY (default: False)"
+        }),
+        returns="Command output as string if detach=False, otherwise True",
+        examples=(
+            '(docker) exec in container "web-server" command "cat /etc/nginx/nginx.conf"',
+            '(docker) exec in container "db" command ["mysqldump", "-u", "root", "mydb"]',
+        )
+    ),
+    MethodInfo(
+        name="image_pull",
+        description="Pull an image from Docker registry (Docker Hub by default)",
+        parameters=MappingProxyType({
+            "repository": "Repository name (e.g., 'nginx', 'ubuntu', 'myuser/myimage')",
+            "tag": "Image tag (default: 'latest')",
+            "all_tags": "Pull all tags (default: False)",
+            "force": "Always contact the registry even if this image was already pulled (default: False)"
+        }),
+        returns="Image object",
+        examples=(
+            '(docker) pull image "nginx" tag "latest"',
+            '(docker) pull image "postgres" tag "15-alpine"',
+            '(docker) pull image "python" tag "3.11-slim"',
+        )
+    ),
+    MethodInfo(
+        name="image_build",
+        description="Build an image from a Dockerfile",
+        parameters=MappingProxyType({
+            "path": "Build context path (directory containing Dockerfile)",
+            "tag": "Tag for the image (optional, e.g., 'myapp:v1.0')",
+            "dockerfile": "Dockerfile name (default: 'Dockerfile')",
+            "buildargs": "Build arguments dict (optional, e.g., {'VERSION': '1.0'})",
+            "nocache": "Don't use cache (default: False)",
+            "rm": "Remove intermediate containers (default: True)"
+        }),
+        returns="Image object",
+        examples=(
+            '(docker) build image from "." tag "myapp:v1.0"',
+            '(docker) build image from "/app" dockerfile "Dockerfile.prod" nocache True',
+            '(docker) build image from "." tag "app:latest" buildargs {"NODE_ENV": "production"}',
+        )
+    ),
+    MethodInfo(
+        name="image_push",
+        description="Push an image to Docker registry",
+        parameters=MappingProxyType({
+            "repository": "Repository name (e.g., 'myuser/myimage')",
+            "tag": "Image tag (default: 'latest')",
+            "auth_config": "Auth dict with username/password (optional, uses config if omitted)"
+        }),
+        returns="Boolean True on success",
+        examples=(
+            '(docker) push image "myuser/myapp" tag "v1.0"',
+            '(docker) push image "registry.example.com/app" tag "latest"',
+        )
+    ),
+    MethodInfo(
+        name="image_list",
+        description="List Docker images on the system",
+        parameters=MappingProxyType({
+            "all": "Include intermediate images (default: False)",
+            "filters": "Filter dict (optional, e.g., {'dangling': True})"
+        }),
+        returns="List of Image objects with attributes: id, tags, size",
+        examples=(
+            '(docker) list images',
+            '(docker) list all images',
+        )
+    ),
+    MethodInfo(
+        name="volume_create",
+        description="Create a Docker volume for persistent data storage",
+        parameters=MappingProxyType({
+            "name": "Volume name (optional, Docker generates if omitted)",
+            "driver": "Volume driver (default: 'local')",
+            "driver_opts": "Driver options dict (optional)",
+            "labels": "Labels dict (optional)"
+        }),
+        returns="Volume object",
+        examples=(
+            '(docker) create volume "db-data"',
+            '(docker) create volume "app-config" labels {"env": "prod"}',
+        )
+    ),
+    MethodInfo(
+        name="volume_list",
+        description="List Docker volumes",
+        parameters=MappingProxyType({
+            "filters": "Filter dict (optional)"
+        }),
+        returns="List of Volume objects with attributes: name, driver, mountpoint",
+        examples=(
+            '(docker) list volumes',
+        )
+    ),
+    MethodInfo(
+        name="network_create",
+        description="Create a Docker network for container communication",
+        parameters=MappingProxyType({
+            "name": "Network name (string)",
+            "driver": "Network driver (default: 'bridge', options: 'host', 'overlay', 'macvlan')",
+            "internal": "Internal network, no external access (default: False)",
+            "enable_ipv6": "Enable IPv6 (default: False)"
+        }),
+        returns="Network object",
+        examples=(
+            '(docker) create network "app-network"',
+            '(docker) create network "backend" driver "bridge" internal True',
+        )
+    ),
+    MethodInfo(
+        name="network_connect",
+        description="Connect a container to a network",
+        parameters=MappingProxyType({
+            "network_name": "Network name (string)",
+            "container_id": "Container ID or name (string)",
+            "aliases": "Network aliases list (optional)",
+            "ipv4_address": "Static IPv4 address (optional)",
+            "ipv6_address": "Static IPv6 address (optional)"
+        }),
+        returns="Boolean True on success",
+        examples=(
+            '(docker) connect container "web-server" to network "app-network"',
+            '(docker) connect container "api" to network "backend" aliases ["api-service"]',
+        )
+    ),
+)
+
+_METHOD_INFOS_BY_NAME = MappingProxyType({info.name: info for info in _METHOD_INFOS})
+
+_EXAMPLES = (
+    # Container lifecycle
+    '10 (docker) pull image "nginx" tag "latest"',
+    '20 (docker) run container "nginx:latest" name "web" ports {"80/tcp": 8080} detach True',
+    '30 (docker) list containers',
+    '40 (docker) get logs from container "web" tail 100',
+    '50 (docker) stop container "web"',
+    '60 (docker) start container "web"',
+    '70 (docker) restart container "web"',
+    '80 (docker) remove container "web" force True',
+
+    # Image management
+    '90 (docker) pull image "postgres" tag "15-alpine"',
+    '100 (docker) build image from "." tag "myapp:v1.0"',
+    '110 (docker) list images',
+    '120 (docker) push image "myuser/myapp" tag "v1.0"',
+    '130 (docker) remove image "old-image:v0.1"',
+
+    # Container with environment and volumes
+    '140 (docker) run container "postgres:15" name "db" environment {"POSTGRES_PASSWORD": "secret", "POSTGRES_DB": "mydb"} volumes {"/var/lib/postgres": {"bind": "/var/lib/postgresql/data"}} ports {"5432/tcp": 5432}',
+
+    # Execute commands
+    '150 (docker) exec in container "web" command "nginx -s reload"',
+    '160 (docker) exec in container "db" command "pg_dump -U postgres mydb"',
+
+    # Volume management
+    '170 (docker) create volume "db-data"',
+    '180 (docker) list volumes',
+    '190 (docker) run container "mysql:8" volumes {"db-data": {"bind": "/var/lib/mysql"}}',
+
+    # Network management
+    '200 (docker) create network "app-network"',
+    '210 (docker) run container "nginx" network "app-network"',
+    '220 (docker) connect container "api-server" to network "app-network"',
+    '230 (docker) list networks',
+
+    # System operations
+    '240 (docker) system info',
+    '250 (docker) system version',
+)
+
+
+class AsyncDockerModule:
+    """
+    Async Docker module for bulk container operations.
+
+    Mirrors the container API of DockerModule using aiodocker so that many
+    daemon round-trips (mass inspect/start/stop) can run concurrently instead
+    of being serialized by the blocking SDK. One aiodocker client is shared
+    per module instance.
+    """
+
+    def __init__(self, docker_host: Optional[str] = None):
+        """Initialize async Docker module."""
+        if not AIODOCKER_AVAILABLE:
+            raise ImportError(
+                "aiodocker not available. Install with: pip install aiodocker>=0.21.0"
+            )
+
+        self.docker_host = docker_host or os.getenv('DOCKER_HOST', 'unix:///var/run/docker.sock')
+
+        # aiodocker client (lazy initialized inside the running event loop)
+        self._adocker = None
+
+    @property
+    def client(self):
+        """Lazy-load aiodocker client."""
+        if self._adocker is None:
+            self._adocker = aiodocker.Docker(url=self.docker_host)
+        return self._adocker
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # =============================================================================
+    # Container Management
+    # =============================================================================
+
+    async def container_start(self, container_id: str) -> bool:
+        """Start a container."""
+        await self.client.containers.container(container_id).start()
+        return True
+
+    async def container_stop(self, container_id: str, timeout: int = 10) -> bool:
+        """Stop a container."""
+        await self.client.containers.container(container_id).stop(t=timeout)
+        return True
 
+    async def container_restart(self, container_id: str, timeout: int = 10) -> bool:
+        """Restart a container."""
+        await self.client.containers.container(container_id).restart(timeout=timeout)
+        return True
+
+    async def container_remove(self, container_id: str, force: bool = False,
+                               volumes: bool = False) -> bool:
+        """Remove a container."""
+        await self.client.containers.container(container_id).delete(force=force, v=volumes)
+        return True
+
+    async def container_inspect(self, container_id: str) -> Dict:
+        """Inspect a container."""
+        return await self.client.containers.container(container_id).show()
+
+    async def container_list(self, all: bool = False, filters: Optional[Dict] = None) -> List[Any]:
+        """List containers."""
+        params = {'all': all}
+        if filters:
+            params['filters'] = json.dumps({
+                key: value if isinstance(value, list) else [value]
+                for key, value in filters.items()
+            })
+        return await self.client.containers.list(**params)
+
+    # =============================================================================
+    # Bulk Operations
+    # =============================================================================
+
+    async def bulk_inspect(self, container_ids: List[str]) -> List[Dict]:
+        """Inspect many containers concurrently."""
+        return await asyncio.gather(*[self.container_inspect(cid) for cid in container_ids])
+
+    async def bulk_start(self, container_ids: List[str]) -> List[bool]:
+        """Start many containers concurrently."""
+        return await asyncio.gather(*[self.container_start(cid) for cid in container_ids])
 
-# Global instance
-_docker_module = None
+    async def bulk_stop(self, container_ids: List[str], timeout: int = 10) -> List[bool]:
+        """Stop many containers concurrently."""
+        return await asyncio.gather(*[self.container_stop(cid, timeout) for cid in container_ids])
+
+    async def bulk_remove(self, container_ids: List[str], force: bool = False,
+                          volumes: bool = False) -> List[bool]:
+        """Remove many containers concurrently."""
+        return await asyncio.gather(*[self.container_remove(cid, force, volumes) for cid in container_ids])
+
+    # =============================================================================
+    # Utility Methods
+    # =============================================================================
+
+    async def close(self):
+        """Close aiodocker client session."""
+        if self._adocker:
+            await self._adocker.close()
+            self._adocker = None
+
+
+# Configured instances per absolute config path
+_docker_modules: Dict[str, DockerModule] = {}
+_docker_modules_lock = threading.Lock()
+
+
+def _build_docker_module(config_path_abs: str) -> DockerModule:
+    """Create and configure one Docker module per resolved config path."""
+    module = _docker_modules.get(config_path_abs)
+    if module is not None:
+        return module
+
+    with _docker_modules_lock:
+        module = _docker_modules.get(config_path_abs)
+        if module is None:
+            module = DockerModule()
+            module.load_config(config_path_abs)
+            # Publish only once fully configured
+            _docker_modules[config_path_abs] = module
+    return module
 
 
 def get_docker_module(config_path: str = 'aibasic.conf') -> DockerModule:
     """
     Get or create Docker module instance.
 
+    Instances are cached per absolute config path, so repeated calls with the
+    same path reuse the configured module and different paths get their own.
+
     Args:
         config_path: Path to aibasic.conf configuration file
 
     Returns:
         DockerModule instance
     """
-    global _docker_module
-    if _docker_module is None:
-        _docker_module = DockerModule()
-        _docker_module.load_config(config_path)
-    return _docker_module
+    return _build_docker_module(os.path.abspath(config_path))
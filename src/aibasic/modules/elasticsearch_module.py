@@ -20,11 +20,203 @@ Author: AIbasic Team
 Version: 1.0
 """
 
+import os
+import asyncio
 import threading
-from typing import Any, Dict, List, Optional, Union
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import json
-from .module_base import AIbasicModuleBase
+import copy
+import time
+import hashlib
+import inspect
+import collections
+import functools
+import weakref
+import contextlib
+import logging
+from urllib.parse import quote
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from .module_base import AIbasicModuleBase, MethodInfo
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Index settings for create_index(ingest_mode=True); finalize_index() reverts them
+_INGEST_INDEX_SETTINGS = {
+    'number_of_replicas': 0,
+    'refresh_interval': '30s',
+    'translog': {'durability': 'async', 'sync_interval': '30s', 'flush_threshold_size': '1gb'}
+}
+
+# Shared default query; never mutated, only placed into request bodies
+_MATCH_ALL_QUERY = {'match_all': {}}
+
+# Response fields search() reads; everything else is dropped server-side via filter_path
+_SEARCH_FILTER_PATH = (
+    'took,pit_id,hits.total.value,hits.max_score,hits.hits._source,hits.hits.sort,aggregations'
+)
+
+# Accept numpy values, and non-string dict keys (e.g. ints) as the stdlib encoder does
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+try:
+    import cbor2
+    CBOR_AVAILABLE = True
+except ImportError:
+    CBOR_AVAILABLE = False
+
+
+def _orjson_serializer():
+    """Build a JSON serializer for the client backed by orjson."""
+    try:
+        # elasticsearch-py 8.12+ ships one that also covers NDJSON bulk bodies
+        from elasticsearch.serializer import OrjsonSerializer
+        return OrjsonSerializer()
+    except ImportError:
+        from elasticsearch.serializer import JSONSerializer
+
+    class ORJSONSerializer(JSONSerializer):
+        def dumps(self, data):
+            if isinstance(data, (str, bytes)):
+                return super().dumps(data)
+            try:
+                return orjson.dumps(data, default=self.default, option=_ORJSON_OPTIONS)
+            except TypeError:
+                return super().dumps(data)
+
+        def loads(self, data):
+            return orjson.loads(data)
+
+    return ORJSONSerializer()
+
+
+def _orjson_bulk_lines(index: str, id_field: Optional[str]):
+    """
+    Build a parallel_bulk expand_action_callback that encodes documents
+    straight to NDJSON bytes, skipping the per-document action dicts.
+    """
+    header = orjson.dumps({'index': {'_index': index}})
+    # Action lines with an _id are spliced from bytes: prefix + encoded id + b'}}'
+    id_prefix = header[:-2] + b',"_id":'
+    option = _ORJSON_OPTIONS
+
+    def expand(doc):
+        if id_field and id_field in doc:
+            action = id_prefix + orjson.dumps(doc[id_field], default=str) + b'}}'
+        else:
+            action = header
+        return action, orjson.dumps(doc, default=str, option=option)
+
+    return expand
+
+
+def _encode_source(document: Dict[str, Any]) -> bytes:
+    """Encode a document body once, so buffered writes have an exact byte size."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(document, default=str, option=_ORJSON_OPTIONS)
+    return json.dumps(document, default=str).encode('utf-8')
+
+
+def _reset_in_child(module_ref) -> None:
+    """Fork hook: rebuild the client of a module that is still alive."""
+    module = module_ref()
+    if module is not None:
+        module._reset_after_fork()
+
+
+def _cbor_serializer():
+    """Build an application/cbor serializer for the client backed by cbor2."""
+    from elasticsearch.serializer import Serializer
+
+    class CBORSerializer(Serializer):
+        mimetype = 'application/cbor'
+
+        def dumps(self, data):
+            return cbor2.dumps(data)
+
+        def loads(self, data):
+            return cbor2.loads(data)
+
+    return CBORSerializer()
+
+
+def _stable_preference(index: str, query: Optional[Dict[str, Any]]) -> str:
+    """
+    Derive a search preference from the request, so repeats of the same
+    query are routed to the same shard copies and find their caches warm.
+    """
+    if ORJSON_AVAILABLE:
+        canonical = orjson.dumps([index, query], default=str, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps([index, query], sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(canonical, digest_size=8).hexdigest()
+
+
+def _filter_context(query: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Run a query in filter context.
+
+    Filter clauses match the same documents but skip scoring and can be
+    served from the node query cache. Only used where scores are not read.
+    The must clauses of a bool query move into its filter list; other
+    queries (including bools with should clauses, which would change
+    meaning without must) are wrapped in constant_score.
+    """
+    if not query or list(query) in (['match_all'], ['constant_score']):
+        return query
+    clause = query.get('bool') if list(query) == ['bool'] else None
+    if not isinstance(clause, dict) or 'should' in clause:
+        return {'constant_score': {'filter': query}}
+    if 'must' not in clause:
+        # Only filter and must_not clauses: already unscored
+        return query
+    must = clause['must'] if isinstance(clause['must'], list) else [clause['must']]
+    filters = clause.get('filter', [])
+    filters = filters if isinstance(filters, list) else [filters]
+    rewritten = {key: value for key, value in clause.items() if key != 'must'}
+    rewritten['filter'] = filters + must
+    return {'bool': rewritten}
+
+
+def _search_body(query: Optional[Dict[str, Any]], **fields) -> Dict[str, Any]:
+    """
+    Build a search request body from the fields that are set.
+
+    Body fields passed as keyword arguments next to body= are merged into it
+    by the client, None values included, so they are placed here instead.
+    """
+    body = {'query': query or _MATCH_ALL_QUERY}
+    body.update((key, value) for key, value in fields.items() if value is not None)
+    return body
+
+
+def _field_mappings(response: Any, field: str) -> List[Optional[Dict[str, Any]]]:
+    """Per-index mapping of field from a get_field_mapping response (None where it is missing)."""
+    leaf = field.rsplit('.', 1)[-1]
+    return [
+        entry['mappings'][field]['mapping'][leaf] if field in entry.get('mappings', {}) else None
+        for entry in getattr(response, 'body', response).values()
+    ]
+
+
+def _is_plain_keyword(mapping: Optional[Dict[str, Any]]) -> bool:
+    """Whether a field mapping is a keyword field without a normalizer."""
+    return bool(mapping) and mapping.get('type') == 'keyword' and 'normalizer' not in mapping
+
+
+@functools.lru_cache(maxsize=None)
+def _init_signature(cls: type) -> inspect.Signature:
+    """Constructor signature of a module class, inspected once."""
+    return inspect.signature(cls.__init__)
 
 
 class ElasticsearchModule(AIbasicModuleBase):
@@ -34,23 +226,71 @@ class ElasticsearchModule(AIbasicModuleBase):
     Provides integration with Elasticsearch for full-text search,
     log analytics, and real-time data processing.
 
-    This class implements the singleton pattern to ensure only one instance
-    exists per process, with thread-safe initialization.
+    A shared instance per configuration is available through
+    ElasticsearchModule.instance(**config).
     """
 
-    _instance = None
-    _lock = threading.Lock()
+    # Fixed attribute layout for the hot paths; no per-instance __dict__
+    # (__weakref__ is kept for the fork hook)
+    __slots__ = (
+        '__weakref__',
+        'client', '_client_class', '_client_args', '_search_cbor',
+        'timeout', 'connections_per_node', 'bulk_thread_count',
+        'ConnectionError', 'ConnectionTimeout', 'AuthenticationException', 'NotFoundError',
+        '_bulk', '_parallel_bulk', '_streaming_bulk', '_scan',
+        '_cache', '_cache_ttl', '_cache_max', '_cache_lock', '_pinned_keys',
+        '_exists_cache', '_doc_cache', '_read_cache', '_ngram_fields', '_health_cache_ttl', '_stats_cache_ttl',
+        '_deferred_refresh', '_refreshed',
+        '_buffer', '_buffer_bytes', '_buffer_lock', '_flush_timer', '_flush_error',
+        '_write_batch_size', '_flush_interval', '_max_buffer_bytes',
+        'last_query', 'last_result', 'last_query_meta', '_debug', '_templates'
+    )
+
+    _instances = {}
+    _instances_lock = threading.Lock()
 
-    def __new__(cls, *args, **kwargs):
+    @classmethod
+    def instance(cls, **kwargs) -> 'ElasticsearchModule':
         """
-        Create or return the singleton instance (thread-safe).
+        Get the shared module (and client) for a configuration.
+
+        Instances are cached per distinct configuration (constructor
+        arguments with defaults filled in and hosts as a list), so repeated
+        calls with the same configuration reuse one client and a different
+        configuration gets its own. Lookups of an existing
+        instance take no lock.
+
+        Args:
+            **kwargs: Constructor parameters
+
+        Returns:
+            ElasticsearchModule instance
         """
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+        key = cls._instance_key(kwargs)
+        module = cls._instances.get(key)
+        if module is None:
+            with cls._instances_lock:
+                module = cls._instances.get(key)
+                if module is None:
+                    module = cls._instances[key] = cls(**kwargs)
+        return module
+
+    @classmethod
+    def _instance_key(cls, kwargs: Dict[str, Any]) -> str:
+        """
+        Build the instance() cache key for a configuration.
+
+        Defaults are filled in and hosts is always a list, so equivalent
+        configurations share one instance.
+        """
+        bound = _init_signature(cls).bind(None, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments['self']
+        arguments.update(arguments.pop('kwargs', {}))
+        if isinstance(arguments['hosts'], str):
+            arguments['hosts'] = [arguments['hosts']]
+        return json.dumps(arguments, sort_keys=True, default=repr)
 
     def __init__(
         self,
@@ -63,6 +303,19 @@ class ElasticsearchModule(AIbasicModuleBase):
         timeout: int = 30,
         max_retries: int = 3,
         retry_on_timeout: bool = True,
+        cache_ttl: float = 5.0,
+        cache_size: int = 512,
+        connections_per_node: int = 25,
+        http_compress: bool = True,
+        search_cbor: bool = False,
+        preload_queries: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+        write_batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffer_bytes: int = 8 * 1024 * 1024,
+        debug: bool = False,
+        bulk_thread_count: Optional[int] = None,
+        health_cache_ttl: float = 2.0,
+        stats_cache_ttl: float = 30.0,
         **kwargs
     ):
         """
@@ -78,18 +331,36 @@ class ElasticsearchModule(AIbasicModuleBase):
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries
             retry_on_timeout: Retry on timeout
+            cache_ttl: Seconds search results, documents and index existence
+                checks are reused from the in-process caches
+            cache_size: Maximum cached search results (0 disables the cache)
+            connections_per_node: HTTP connections pooled per node; size it to
+                the number of threads issuing requests concurrently (raised to
+                bulk_thread_count if that is larger)
+            http_compress: Gzip request bodies (cheap, and halves bulk traffic)
+            search_cbor: Exchange search requests and responses as CBOR instead
+                of JSON (requires cbor2; other APIs keep using JSON)
+            preload_queries: (index, query) pairs searched at startup and pinned
+                in the search cache (never evicted or expired)
+            write_batch_size: Buffered documents that trigger a bulk flush
+            flush_interval: Seconds after which buffered documents are flushed
+            max_buffer_bytes: Buffered bytes that trigger a bulk flush
+            debug: Keep the full raw response of the last search in last_result
+            bulk_thread_count: Default number of parallel bulk_index workers
+                (default: CPU count, at most connections_per_node)
+            health_cache_ttl: Seconds get_cluster_health() results are reused
+            stats_cache_ttl: Seconds get_index_stats() results are reused
             **kwargs: Additional Elasticsearch client parameters
         """
-        if self._initialized:
-            return
-
         try:
-            from elasticsearch import Elasticsearch
+            from elasticsearch import Elasticsearch, __version__ as es_version
             from elasticsearch.exceptions import (
                 ConnectionError,
+                ConnectionTimeout,
                 AuthenticationException,
                 NotFoundError
             )
+            from elasticsearch.helpers import bulk, parallel_bulk, scan, streaming_bulk
         except ImportError:
             raise ImportError(
                 "elasticsearch package is required. Install with: pip install elasticsearch"
@@ -97,9 +368,16 @@ class ElasticsearchModule(AIbasicModuleBase):
 
         # Store exception classes
         self.ConnectionError = ConnectionError
+        self.ConnectionTimeout = ConnectionTimeout
         self.AuthenticationException = AuthenticationException
         self.NotFoundError = NotFoundError
 
+        # Bulk/scroll helpers, resolved once instead of on every call
+        self._bulk = bulk
+        self._parallel_bulk = parallel_bulk
+        self._streaming_bulk = streaming_bulk
+        self._scan = scan
+
         # Parse hosts
         if isinstance(hosts, str):
             hosts = [hosts]
@@ -111,23 +389,162 @@ class ElasticsearchModule(AIbasicModuleBase):
         elif username and password:
             auth_params['basic_auth'] = (username, password)
 
-        # Create Elasticsearch client
-        self.client = Elasticsearch(
+        # Connection pool size: 8.x takes connections_per_node, 7.x the urllib3 maxsize.
+        # maxsize is accepted as an alias on either version.
+        connections_per_node = kwargs.pop('maxsize', connections_per_node)
+        # Every parallel bulk worker needs its own pooled connection
+        connections_per_node = max(connections_per_node, bulk_thread_count or 0)
+        if es_version[0] >= 8:
+            # 8.x deprecates timeout in favour of request_timeout
+            kwargs.setdefault('request_timeout', timeout)
+            kwargs.setdefault('connections_per_node', connections_per_node)
+            # Keep sniffing off the request path; pooled connections stay alive between calls
+            kwargs.setdefault('sniff_on_start', False)
+            kwargs.setdefault('sniff_on_node_failure', False)
+        else:
+            kwargs['maxsize'] = connections_per_node
+            kwargs.setdefault('timeout', timeout)
+
+        serializer = kwargs.pop('serializer', None)
+        if serializer is None and ORJSON_AVAILABLE:
+            serializer = _orjson_serializer()
+
+        if search_cbor:
+            if not CBOR_AVAILABLE:
+                raise ImportError("search_cbor requires cbor2. Install with: pip install cbor2")
+            kwargs['serializers'] = dict(kwargs.get('serializers') or {}, **{'application/cbor': _cbor_serializer()})
+
+        if serializer is not None:
+            if kwargs.get('serializers'):
+                # The client rejects serializer= next to serializers=, so it joins the mapping
+                kwargs['serializers'] = dict({serializer.mimetype: serializer}, **kwargs['serializers'])
+            else:
+                kwargs['serializer'] = serializer
+
+        # Kept so a forked child can build its own client
+        self._client_class = Elasticsearch
+        self._client_args = dict(
             hosts=hosts,
             verify_certs=verify_certs,
             ca_certs=ca_certs,
-            timeout=timeout,
             max_retries=max_retries,
             retry_on_timeout=retry_on_timeout,
+            http_compress=http_compress,
             **auth_params,
             **kwargs
         )
+        self._search_cbor = search_cbor
+
+        self.timeout = timeout
+        self.connections_per_node = connections_per_node
+        self.bulk_thread_count = bulk_thread_count
+
+        # Create Elasticsearch client
+        self._connect()
+
+        # LRU search result cache: key -> (timestamp, response)
+        self._cache = collections.OrderedDict()
+        self._cache_ttl = cache_ttl
+        self._cache_max = cache_size
+        self._cache_lock = threading.Lock()
+        self._pinned_keys = set()
+
+        # Buffered index_document() writes, sent together as one bulk request
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._buffer_lock = threading.Lock()
+        self._flush_timer = None
+        # Outcome of a failed timer-triggered flush, reported by the next flush()
+        self._flush_error = None
+        self._write_batch_size = write_batch_size
+        self._flush_interval = flush_interval
+        self._max_buffer_bytes = max_buffer_bytes
+
+        # Indices whose per-write refreshes are deferred by batched_refresh()
+        self._deferred_refresh = collections.Counter()
+        # Indices refreshed with no write through the module since: index -> timestamp
+        self._refreshed = {}
+
+        # Short-lived lookups guarded by the same lock and TTL
+        self._exists_cache = {}  # index -> (timestamp, exists)
+        self._doc_cache = collections.OrderedDict()  # (index, doc_id) -> (timestamp, source)
+        self._read_cache = collections.OrderedDict()  # count/health/stats key -> (timestamp, result)
+        self._ngram_fields = {}  # (index, field) -> has a <field>.ngram prefix sub-field
+        self._health_cache_ttl = health_cache_ttl
+        self._stats_cache_ttl = stats_cache_ttl
 
         # State variables
         self.last_query = None
         self.last_result = None
+        self.last_query_meta = None
+        self._debug = debug
+
+        # Stored search templates registered by this module: name -> canonical source
+        self._templates = {}
+
+        for preload_index, preload_query in preload_queries or ():
+            if self.search(preload_index, preload_query).get('success'):
+                with self._cache_lock:
+                    pinned = next(reversed(self._cache), None)
+                    if pinned is not None:
+                        self._pinned_keys.add(pinned)
+
+        # Connection pools must not be shared with a forked child (gunicorn, multiprocessing)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=functools.partial(_reset_in_child, weakref.ref(self)))
+
+    def _connect(self) -> None:
+        """Create the Elasticsearch client and the client used for searches."""
+        self.client = self._client_class(**self._client_args)
+
+    def _send_search(self, index: Optional[str] = None, body: Optional[Dict[str, Any]] = None,
+                     **params) -> Any:
+        """
+        Send a search request, as CBOR when search_cbor is set.
+
+        Only the search path uses binary bodies; index and cluster APIs stay
+        on JSON. client.search() always sets JSON content-type and accept
+        headers, overriding any set through client.options(), so CBOR
+        searches go through perform_request() with their own headers.
+        """
+        if not self._search_cbor:
+            return self.client.search(index=index, body=body, **params)
+        path = f'/{quote(index, safe=",*")}/_search' if index else '/_search'
+        query = {
+            key: str(value).lower() if isinstance(value, bool) else
+            ','.join(value) if isinstance(value, (list, tuple)) else value
+            for key, value in params.items() if value is not None
+        }
+        return self.client.perform_request(
+            'POST', path, params=query, body=body,
+            headers={'content-type': 'application/cbor', 'accept': 'application/cbor'}
+        )
+
+    def _reset_after_fork(self) -> None:
+        """Give a forked child its own connection pool and unlocked caches."""
+        # The inherited sockets belong to the parent, so they are dropped rather than closed
+        self._cache_lock = threading.Lock()
+        # Buffered writes are the parent's to flush
+        self._buffer_lock = threading.Lock()
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._flush_timer = None
+        self._flush_error = None
+        self._connect()
+
+    def _failure(self, e: Exception) -> Dict[str, Any]:
+        """
+        Build the error result for a failed call.
 
-        self._initialized = True
+        Connection failures and timeouts are flagged as retryable so callers
+        can tell them apart from request errors.
+        """
+        return {
+            'success': False,
+            'error': str(e),
+            'error_type': type(e).__name__,
+            'retryable': isinstance(e, (self.ConnectionError, self.ConnectionTimeout))
+        }
 
     def ping(self) -> bool:
         """
@@ -158,7 +575,8 @@ class ElasticsearchModule(AIbasicModuleBase):
         index: str,
         mappings: Optional[Dict[str, Any]] = None,
         settings: Optional[Dict[str, Any]] = None,
-        aliases: Optional[Dict[str, Any]] = None
+        aliases: Optional[Dict[str, Any]] = None,
+        ingest_mode: bool = False
     ) -> Dict[str, Any]:
         """
         Create an index.
@@ -168,11 +586,17 @@ class ElasticsearchModule(AIbasicModuleBase):
             mappings: Index mappings (field types)
             settings: Index settings (shards, replicas, etc.)
             aliases: Index aliases
+            ingest_mode: Create the index tuned for an initial bulk load (no
+                replicas, 30s refresh, async translog); explicit settings win.
+                Call finalize_index() when the load is done.
 
         Returns:
             Dictionary with creation result
         """
         try:
+            if ingest_mode:
+                settings = {**_INGEST_INDEX_SETTINGS, **(settings or {})}
+
             body = {}
             if mappings:
                 body['mappings'] = mappings
@@ -182,9 +606,47 @@ class ElasticsearchModule(AIbasicModuleBase):
                 body['aliases'] = aliases
 
             result = self.client.indices.create(index=index, body=body if body else None)
+            self._invalidate_caches()
+            self._ngram_fields.clear()
             return {'success': True, 'acknowledged': result.get('acknowledged', False)}
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
+
+    def finalize_index(
+        self,
+        index: str,
+        number_of_replicas: int = 1,
+        refresh_interval: str = '1s'
+    ) -> Dict[str, Any]:
+        """
+        Switch an index created with ingest_mode=True to serving settings.
+
+        Restores replicas, the refresh interval and durable translog writes,
+        then refreshes the index so the loaded documents are searchable.
+
+        Args:
+            index: Index name
+            number_of_replicas: Replicas to serve with
+            refresh_interval: Refresh interval to serve with
+
+        Returns:
+            Dictionary with success status
+        """
+        try:
+            self.client.indices.put_settings(
+                index=index,
+                settings={'index': {
+                    'number_of_replicas': number_of_replicas,
+                    'refresh_interval': refresh_interval,
+                    'translog.durability': 'request'
+                }}
+            )
+            self.client.indices.refresh(index=index)
+            self._invalidate_caches()
+            self._refreshed[index] = time.monotonic()
+            return {'success': True}
+        except Exception as e:
+            return self._failure(e)
 
     def delete_index(self, index: str) -> Dict[str, Any]:
         """
@@ -198,11 +660,13 @@ class ElasticsearchModule(AIbasicModuleBase):
         """
         try:
             result = self.client.indices.delete(index=index)
+            self._invalidate_caches()
+            self._ngram_fields.clear()
             return {'success': True, 'acknowledged': result.get('acknowledged', False)}
         except self.NotFoundError:
             return {'success': False, 'error': f'Index {index} not found'}
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
 
     def index_exists(self, index: str) -> bool:
         """
@@ -214,17 +678,56 @@ class ElasticsearchModule(AIbasicModuleBase):
         Returns:
             True if exists, False otherwise
         """
+        now = time.monotonic()
+        entry = self._exists_cache.get(index)
+        if entry is not None and now - entry[0] < self._cache_ttl:
+            return entry[1]
         try:
-            return self.client.indices.exists(index=index)
+            exists = bool(self.client.indices.exists(index=index))
         except Exception:
             return False
+        with self._cache_lock:
+            self._exists_cache[index] = (now, exists)
+        return exists
+
+    def indices_exist(self, names: List[str]) -> Dict[str, Any]:
+        """
+        Check whether several indices (or aliases/data streams) exist in one request.
+
+        Args:
+            names: Index names
+
+        Returns:
+            Dictionary mapping each name to True if it exists, or the usual
+            failure dictionary if the cluster could not be asked
+        """
+        try:
+            try:
+                resolved = self.client.indices.resolve_index(name=','.join(names))
+            except self.NotFoundError:
+                # One missing name fails the whole request: ask per name instead
+                result = {name: bool(self.client.indices.exists(index=name)) for name in names}
+            else:
+                existing = set()
+                for kind in ('indices', 'aliases', 'data_streams'):
+                    existing.update(item['name'] for item in resolved.get(kind, []))
+                result = {name: name in existing for name in names}
+        except Exception as e:
+            return self._failure(e)
+
+        now = time.monotonic()
+        with self._cache_lock:
+            for name, exists in result.items():
+                self._exists_cache[name] = (now, exists)
+        return result
 
     def index_document(
         self,
         index: str,
         document: Dict[str, Any],
         doc_id: Optional[str] = None,
-        refresh: bool = False
+        refresh: bool = False,
+        buffered: bool = False
     ) -> Dict[str, Any]:
         """
         Index a document.
@@ -234,17 +737,25 @@ class ElasticsearchModule(AIbasicModuleBase):
             document: Document to index
             doc_id: Document ID (auto-generated if None)
             refresh: Refresh index after operation
+            buffered: Queue the document and send it with others in one bulk
+                request (after write_batch_size documents, max_buffer_bytes or
+                flush_interval seconds, or on flush()); refresh is ignored
 
         Returns:
             Dictionary with index result
         """
+        if buffered:
+            return self._buffer_document(index, document, doc_id)
+
         try:
             result = self.client.index(
                 index=index,
                 document=document,
                 id=doc_id,
-                refresh=refresh
+                refresh=self._effective_refresh(index, refresh)
             )
+            self._invalidate_caches()
+            self._mark_refreshed(index, refresh)
             return {
                 'success': True,
                 'id': result['_id'],
@@ -252,61 +763,239 @@ class ElasticsearchModule(AIbasicModuleBase):
                 'result': result['result']
             }
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
+
+    def _buffer_document(self, index: str, document: Dict[str, Any], doc_id: Optional[str]) -> Dict[str, Any]:
+        """Queue a document for the next bulk flush."""
+        source = _encode_source(document)
+        action = {'_index': index, '_source': source}
+        if doc_id is not None:
+            action['_id'] = doc_id
+
+        with self._buffer_lock:
+            self._buffer.append(action)
+            self._buffer_bytes += len(source)
+            full = (len(self._buffer) >= self._write_batch_size
+                    or self._buffer_bytes >= self._max_buffer_bytes)
+            if not full and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if full:
+            return dict(self.flush(), buffered=True)
+        return {'success': True, 'buffered': True}
+
+    def flush(self) -> Dict[str, Any]:
+        """
+        Send documents queued by index_document(buffered=True) as one bulk request.
+
+        If the request fails the documents stay queued for the next flush.
+        Items rejected by a background (timer) flush, and the error of a
+        failed one, are reported in the result of the next call.
+
+        Returns:
+            Dictionary with bulk result
+        """
+        with self._buffer_lock:
+            actions, self._buffer = self._buffer, []
+            self._buffer_bytes = 0
+            timer, self._flush_timer = self._flush_timer, None
+            earlier, self._flush_error = self._flush_error, None
+        if timer is not None:
+            timer.cancel()
+
+        if not actions:
+            result = {'success': True, 'successful': 0, 'failed': []}
+        else:
+            try:
+                success, failed = self._bulk(self.client, actions, raise_on_error=False)
+                self._invalidate_caches()
+                result = {'success': True, 'successful': success, 'failed': failed}
+            except Exception as e:
+                # Requeue ahead of anything buffered meanwhile, so nothing is dropped
+                with self._buffer_lock:
+                    self._buffer[:0] = actions
+                    self._buffer_bytes += sum(len(action['_source']) for action in actions)
+                result = self._failure(e)
+
+        if earlier is not None:
+            result['failed'] = earlier.get('failed', []) + result.get('failed', [])
+            if not earlier['success']:
+                result['previous_error'] = earlier['error']
+        return result
+
+    def _timed_flush(self) -> None:
+        """Flush from the background timer, keeping any failure for the next flush()."""
+        result = self.flush()
+        if result['success'] and not result['failed']:
+            return
+        if result['success']:
+            logger.warning("Buffered bulk flush rejected %d document(s)", len(result['failed']))
+        else:
+            logger.warning("Buffered bulk flush failed, documents kept queued: %s", result['error'])
+        with self._buffer_lock:
+            self._flush_error = result
 
     def bulk_index(
         self,
         index: str,
-        documents: List[Dict[str, Any]],
+        documents: Iterable[Dict[str, Any]],
         id_field: Optional[str] = None,
-        refresh: bool = False
+        refresh: bool = False,
+        thread_count: Optional[int] = None,
+        chunk_size: int = 1000,
+        max_chunk_bytes: int = 8 * 1024 * 1024,
+        tune_for_ingest: bool = False
     ) -> Dict[str, Any]:
         """
         Bulk index multiple documents.
 
+        Actions are generated lazily (encoded directly to NDJSON bytes when
+        orjson is installed) and sent as chunked bulk requests from
+        several threads in parallel over the shared client; the worker count
+        is capped at connections_per_node so no thread waits on the pool, and
+        a requested refresh happens once after the last chunk. The defaults
+        (1000 documents, 8 MB per request) suit typical documents; for
+        documents larger than ~50 KB lower chunk_size toward 300-500.
+
         Args:
             index: Index name
-            documents: List of documents
+            documents: Documents to index; any iterable, so a generator
+                streams a large load without materializing it
             id_field: Field to use as document ID (optional)
             refresh: Refresh index after operation
+            thread_count: Number of parallel bulk workers (default: the module's
+                bulk_thread_count, else CPU count capped at connections_per_node)
+            chunk_size: Documents per bulk request
+            max_chunk_bytes: Maximum size of a bulk request in bytes
+            tune_for_ingest: Disable refresh and relax translog flushing during
+                the load, then restore the settings and force-merge the index
 
         Returns:
             Dictionary with bulk result
         """
         try:
-            from elasticsearch.helpers import bulk
-
-            actions = []
-            for doc in documents:
-                action = {
-                    '_index': index,
-                    '_source': doc
-                }
-                if id_field and id_field in doc:
-                    action['_id'] = doc[id_field]
+            def _actions():
+                for doc in documents:
+                    action = {
+                        '_index': index,
+                        '_source': doc
+                    }
+                    if id_field and id_field in doc:
+                        action['_id'] = doc[id_field]
+                    yield action
+
+            bulk_options = {}
+            if ORJSON_AVAILABLE:
+                actions = documents
+                bulk_options['expand_action_callback'] = _orjson_bulk_lines(index, id_field)
+            else:
+                actions = _actions()
 
-                actions.append(action)
+            success = 0
+            failed = []
+            # Larger chunks need more server-side time than the default timeout
+            client = self.client.options(request_timeout=max(self.timeout, 60))
 
-            success, failed = bulk(
-                self.client,
-                actions,
-                refresh=refresh,
-                raise_on_error=False
-            )
+            workers = thread_count or self.bulk_thread_count or min(os.cpu_count() or 4, self.connections_per_node)
+            if workers > 1:
+                bulk_options.update(thread_count=workers, queue_size=workers)
+                send = self._parallel_bulk
+            else:
+                # A single worker needs no thread pool: stream chunks from this thread
+                send = self._streaming_bulk
+
+            previous_settings = self._tune_for_ingest(index) if tune_for_ingest else None
+            try:
+                for ok, info in send(
+                    client,
+                    actions,
+                    chunk_size=chunk_size,
+                    max_chunk_bytes=max_chunk_bytes,
+                    raise_on_error=False,
+                    **bulk_options
+                ):
+                    if ok:
+                        success += 1
+                    else:
+                        failed.append(info)
+            finally:
+                self._invalidate_caches()
+                if previous_settings is not None:
+                    self._restore_after_ingest(index, previous_settings, client)
+
+            if self._effective_refresh(index, refresh):
+                self.client.indices.refresh(index=index)
+                self._refreshed[index] = time.monotonic()
 
             return {
                 'success': True,
                 'successful': success,
                 'failed': failed,
-                'total': len(documents)
+                'total': success + len(failed)
             }
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
+
+    def _tune_for_ingest(self, index: str) -> Dict[str, Any]:
+        """
+        Apply write-optimized settings to an index before a bulk load.
+
+        Returns:
+            The previous values of the changed settings (None if unset)
+        """
+        response = self.client.indices.get_settings(index=index)
+        current = next(iter(response.values()), {}).get('settings', {}).get('index', {})
+        previous = {
+            'refresh_interval': current.get('refresh_interval'),
+            'translog.flush_threshold_size': current.get('translog', {}).get('flush_threshold_size')
+        }
+        self.client.indices.put_settings(
+            index=index,
+            settings={'index': {'refresh_interval': '-1', 'translog.flush_threshold_size': '1gb'}}
+        )
+        return previous
+
+    def _restore_after_ingest(self, index: str, previous: Dict[str, Any], client: Any) -> None:
+        """Restore settings changed by _tune_for_ingest and consolidate segments."""
+        self.client.indices.put_settings(index=index, settings={'index': previous})
+        client.indices.forcemerge(index=index, max_num_segments=5)
+
+    @contextlib.contextmanager
+    def batched_refresh(self, *indices: str):
+        """
+        Defer refreshes of the given indices until the block exits.
+
+        Writes to these indices inside the block ignore refresh=True; a single
+        refresh of all of them is issued when the block ends.
+
+        Args:
+            *indices: Index names
+        """
+        self._deferred_refresh.update(indices)
+        try:
+            yield self
+        finally:
+            self._deferred_refresh.subtract(indices)
+            self._deferred_refresh += collections.Counter()  # drop indices no longer deferred
+            self.refresh_index(','.join(indices))
+
+    def _effective_refresh(self, index: str, refresh: bool) -> bool:
+        """Return the refresh flag for a write, honouring batched_refresh()."""
+        return refresh and index not in self._deferred_refresh
+
+    def _mark_refreshed(self, index: str, refresh: bool) -> None:
+        """Record that a write just refreshed index, for refresh_index()."""
+        if self._effective_refresh(index, refresh):
+            self._refreshed[index] = time.monotonic()
 
     def get_document(
         self,
         index: str,
-        doc_id: str
+        doc_id: str,
+        includes: Optional[List[str]] = None,
+        excludes: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Get a document by ID.
@@ -314,18 +1003,67 @@ class ElasticsearchModule(AIbasicModuleBase):
         Args:
             index: Index name
             doc_id: Document ID
+            includes: Source fields to return (filtered server-side)
+            excludes: Source fields to leave out (filtered server-side)
 
         Returns:
             Document if found, None otherwise
         """
+        key = (index, doc_id, tuple(includes or ()), tuple(excludes or ()))
+        with self._cache_lock:
+            entry = self._doc_cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self._cache_ttl:
+                self._doc_cache.move_to_end(key)
+                return copy.deepcopy(entry[1])
+
         try:
-            result = self.client.get(index=index, id=doc_id)
-            return result['_source']
+            result = self.client.get(
+                index=index, id=doc_id, _source_includes=includes, _source_excludes=excludes
+            )
         except self.NotFoundError:
             return None
         except Exception as e:
             return {'error': str(e)}
 
+        source = result['_source']
+        if self._cache_max > 0:
+            with self._cache_lock:
+                self._doc_cache[key] = (time.monotonic(), copy.deepcopy(source))
+                self._doc_cache.move_to_end(key)
+                while len(self._doc_cache) > 1024:
+                    self._doc_cache.popitem(last=False)
+        return source
+
+    def get_documents(
+        self,
+        index: str,
+        doc_ids: List[str],
+        includes: Optional[List[str]] = None,
+        excludes: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get several documents by ID in one request.
+
+        Args:
+            index: Index name
+            doc_ids: Document IDs
+            includes: Source fields to return (filtered server-side)
+            excludes: Source fields to leave out (filtered server-side)
+
+        Returns:
+            Dictionary mapping each ID to its document, or None if not found
+        """
+        try:
+            result = self.client.mget(
+                index=index, ids=list(doc_ids), _source_includes=includes, _source_excludes=excludes
+            )
+            return {
+                doc['_id']: doc.get('_source') if doc.get('found') else None
+                for doc in result['docs']
+            }
+        except Exception as e:
+            return {'error': str(e)}
+
     def update_document(
         self,
         index: str,
@@ -350,15 +1088,17 @@ class ElasticsearchModule(AIbasicModuleBase):
                 index=index,
                 id=doc_id,
                 doc=document,
-                refresh=refresh
+                refresh=self._effective_refresh(index, refresh)
             )
+            self._invalidate_caches()
+            self._mark_refreshed(index, refresh)
             return {
                 'success': True,
                 'version': result['_version'],
                 'result': result['result']
             }
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
 
     def delete_document(
         self,
@@ -381,8 +1121,10 @@ class ElasticsearchModule(AIbasicModuleBase):
             result = self.client.delete(
                 index=index,
                 id=doc_id,
-                refresh=refresh
+                refresh=self._effective_refresh(index, refresh)
             )
+            self._invalidate_caches()
+            self._mark_refreshed(index, refresh)
             return {
                 'success': True,
                 'result': result['result']
@@ -390,7 +1132,7 @@ class ElasticsearchModule(AIbasicModuleBase):
         except self.NotFoundError:
             return {'success': False, 'error': 'Document not found'}
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
 
     def search(
         self,
@@ -400,7 +1142,16 @@ class ElasticsearchModule(AIbasicModuleBase):
         from_: int = 0,
         sort: Optional[List] = None,
         source: Optional[Union[bool, List[str]]] = None,
-        aggs: Optional[Dict[str, Any]] = None
+        aggs: Optional[Dict[str, Any]] = None,
+        hits_size: Optional[int] = None,
+        includes: Optional[List[str]] = None,
+        excludes: Optional[List[str]] = None,
+        request_cache: Optional[bool] = None,
+        search_after: Optional[List] = None,
+        pit_id: Optional[str] = None,
+        pit_keep_alive: str = '1m',
+        track_total_hits: Optional[Union[bool, int]] = None,
+        preference: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Search documents.
@@ -413,103 +1164,702 @@ class ElasticsearchModule(AIbasicModuleBase):
             sort: Sort specification
             source: Fields to return
             aggs: Aggregations
+            hits_size: Hits to return alongside aggs (aggregation searches
+                return no hits by default so the shard request cache applies)
+            includes: Source fields to return (filtered server-side)
+            excludes: Source fields to leave out (filtered server-side)
+            request_cache: Use the shard request cache (default: index setting,
+                always on for aggregations). Pass False for queries with "now"
+                in date ranges, or round them (e.g. "now/m") so they repeat
+            search_after: Sort values of the last hit of the previous page
+                (the previous response's next_cursor); requires sort or pit_id
+            pit_id: Point in time to search instead of index, from
+                open_point_in_time(); keeps pages consistent while paginating
+            pit_keep_alive: How long to extend the point in time by
+            track_total_hits: Count matches exactly (True), up to a limit (int),
+                or not at all (False, total is then None and shards stop
+                collecting once the top hits are found); default counts up
+                to 10,000
+            preference: Shard copy routing key (default: derived from index
+                and query, so repeated queries hit the same warm copies;
+                pass e.g. '_local' or a session id to override)
+
+        For deep pagination use sort + search_after (and optionally a point in
+        time) instead of from_: each page then costs the same, and paging is
+        not capped by index.max_result_window.
+
+        Filtering large fields out with includes/excludes, together with the
+        client's http_compress, keeps responses from wide documents small.
+
+        Identical requests are answered from an in-process LRU cache for
+        cache_ttl seconds. Queries using relative date math ("now") are never
+        cached, and writes made through this module clear the cache.
 
         Returns:
             Dictionary with search results
         """
-        try:
-            body = {}
+        if search_after is not None and not sort and not pit_id:
+            return {'success': False, 'error': 'search_after requires sort or pit_id'}
+        if aggs:
+            size = hits_size or 0
+        key = None if pit_id else self._search_cache_key(
+            index, query, size, from_, sort, source, aggs, includes, excludes, search_after, track_total_hits
+        )
+        if key is not None:
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry is not None and (
+                    key in self._pinned_keys or time.monotonic() - entry[0] < self._cache_ttl
+                ):
+                    self._cache.move_to_end(key)
+                    return copy.deepcopy(entry[1])
+
+        response = self._search_uncached(
+            index, query, size, from_, sort, source, aggs, includes, excludes, request_cache,
+            search_after, pit_id, pit_keep_alive, track_total_hits, preference
+        )
 
-            if query:
-                body['query'] = query
+        if key is not None and response.get('success'):
+            with self._cache_lock:
+                self._cache[key] = (time.monotonic(), copy.deepcopy(response))
+                self._cache.move_to_end(key)
+                self._evict_search_cache()
+        return response
+
+    def _evict_search_cache(self) -> None:
+        """Drop least recently used unpinned results beyond cache_size (lock held)."""
+        while len(self._cache) > self._cache_max:
+            victim = next((key for key in self._cache if key not in self._pinned_keys), None)
+            if victim is None:
+                return
+            del self._cache[victim]
+
+    def clear_cache(self, preserve_pinned: bool = True) -> None:
+        """
+        Clear the in-process search, document and index existence caches.
+
+        Args:
+            preserve_pinned: Keep the results of preloaded queries
+        """
+        with self._cache_lock:
+            if preserve_pinned:
+                for key in [key for key in self._cache if key not in self._pinned_keys]:
+                    del self._cache[key]
             else:
-                body['query'] = {'match_all': {}}
+                self._cache.clear()
+                self._pinned_keys.clear()
+            self._doc_cache.clear()
+            self._exists_cache.clear()
+            self._read_cache.clear()
+
+    def _search_cache_key(self, *request) -> Optional[bytes]:
+        """Build the query cache key, or None if the request must not be cached."""
+        if self._cache_max <= 0 or self._cache_ttl <= 0:
+            return None
+        if ORJSON_AVAILABLE:
+            canonical = orjson.dumps(request, default=str, option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS)
+        else:
+            canonical = json.dumps(request, sort_keys=True, default=str).encode('utf-8')
+        if b'"now' in canonical:
+            return None
+        return hashlib.blake2b(canonical, digest_size=16).digest()
 
-            if aggs:
-                body['aggs'] = aggs
+    def _invalidate_caches(self) -> None:
+        """
+        Drop cached search results, documents and index checks after a write.
 
-            result = self.client.search(
-                index=index,
-                body=body,
-                size=size,
-                from_=from_,
-                sort=sort,
-                _source=source
+        Pinned queries stay pinned and are cached again on their next search.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._doc_cache.clear()
+            self._exists_cache.clear()
+            self._read_cache.clear()
+        # Anything written since the last refresh needs a new one
+        self._refreshed.clear()
+
+    def _cached_read(self, ttl: float, fetch, *request):
+        """
+        Return fetch() through the read cache, reusing results for ttl seconds.
+
+        Errors raised by fetch() propagate and are never cached.
+        """
+        key = self._search_cache_key(*request) if ttl > 0 else None
+        if key is None:
+            return fetch()
+        with self._cache_lock:
+            entry = self._read_cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                self._read_cache.move_to_end(key)
+                return entry[1]
+        value = fetch()
+        with self._cache_lock:
+            self._read_cache[key] = (time.monotonic(), value)
+            self._read_cache.move_to_end(key)
+            while len(self._read_cache) > 1024:
+                self._read_cache.popitem(last=False)
+        return value
+
+    def _search_uncached(
+        self,
+        index: str,
+        query: Optional[Dict[str, Any]],
+        size: int,
+        from_: int,
+        sort: Optional[List],
+        source: Optional[Union[bool, List[str]]],
+        aggs: Optional[Dict[str, Any]],
+        includes: Optional[List[str]] = None,
+        excludes: Optional[List[str]] = None,
+        request_cache: Optional[bool] = None,
+        search_after: Optional[List] = None,
+        pit_id: Optional[str] = None,
+        pit_keep_alive: str = '1m',
+        track_total_hits: Optional[Union[bool, int]] = None,
+        preference: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Execute a search against the cluster.
+
+        Aggregations always run as a size=0 request so the shard request
+        cache can serve them; when hits are also wanted they are fetched by a
+        second, concurrent request and the two responses are merged.
+        """
+        try:
+            if not pit_id:
+                query = self._prefix_to_ngram(index, query)
+            # Hits are ranked by score unless an explicit sort leaves it out
+            if not size or (sort and '_score' not in str(sort)):
+                query = _filter_context(query)
+            # A point in time replaces the index in the request (and fixes the shard copies)
+            pit = {'id': pit_id, 'keep_alive': pit_keep_alive} if pit_id else None
+            body = _search_body(
+                query, pit=pit, size=size, sort=sort, search_after=search_after, _source=source,
+                track_total_hits=track_total_hits
             )
+            if from_:
+                body['from'] = from_
+
+            agg_request_cache = True if request_cache is None else request_cache
+            if pit_id:
+                target = {}
+            else:
+                target = {'index': index, 'preference': preference or _stable_preference(index, query)}
+            # Only ask for the parts of the response read below (everything in debug mode)
+            filter_path = None if self._debug else _SEARCH_FILTER_PATH
+
+            if aggs and size:
+                # The aggregation request never reads scores, even when the hits do
+                agg_body = _search_body(_filter_context(query), pit=pit, size=0, aggs=aggs)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    agg_future = executor.submit(
+                        self._send_search, **target, body=agg_body,
+                        request_cache=agg_request_cache, filter_path=filter_path
+                    )
+                    result = self._send_search(
+                        **target, body=body, _source_includes=includes, _source_excludes=excludes,
+                        request_cache=request_cache, filter_path=filter_path
+                    )
+                    aggregations = agg_future.result().get('aggregations', {})
+            elif aggs:
+                body = _search_body(query, pit=pit, size=0, aggs=aggs, track_total_hits=track_total_hits)
+                result = self._send_search(
+                    **target, body=body, request_cache=agg_request_cache, filter_path=filter_path
+                )
+                aggregations = result.get('aggregations', {})
+            else:
+                result = self._send_search(
+                    **target,
+                    body=body,
+                    _source_includes=includes,
+                    _source_excludes=excludes,
+                    request_cache=request_cache,
+                    filter_path=filter_path
+                )
+
+            # Filtered responses omit empty sections (e.g. hits.hits with no matches)
+            hits_section = result.get('hits', {})
+            raw_hits = hits_section.get('hits', [])
+            # Untracked totals are unknown rather than zero
+            total = None if track_total_hits is False else hits_section.get('total', {}).get('value', 0)
 
             self.last_query = body
-            self.last_result = result
+            self.last_query_meta = {
+                'index': index,
+                'size': size,
+                'took': result.get('took'),
+                'total': total
+            }
+            if aggs and size:
+                # Sent alongside the hits query above
+                self.last_query_meta['aggregation_query'] = agg_body
+            if self._debug:
+                self.last_result = result
 
-            hits = [hit['_source'] for hit in result['hits']['hits']]
+            hits = [hit.get('_source', {}) for hit in raw_hits]
 
             response = {
                 'success': True,
                 'hits': hits,
-                'total': result['hits']['total']['value'],
-                'max_score': result['hits'].get('max_score')
+                'total': total,
+                'max_score': hits_section.get('max_score')
             }
 
             if aggs:
-                response['aggregations'] = result.get('aggregations', {})
+                response['aggregations'] = aggregations
+            if raw_hits and 'sort' in raw_hits[-1]:
+                response['next_cursor'] = raw_hits[-1]['sort']
+            if 'pit_id' in result:
+                response['pit_id'] = result['pit_id']
 
             return response
 
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
+
+    def msearch(self, searches: List[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Run several searches in a single _msearch request.
+
+        One round trip replaces one per search and the cluster executes the
+        searches concurrently. Batches of 10-50 searches work well; larger
+        ones can fill the search thread pool queue.
+
+        Args:
+            searches: (index, query) or (index, query, size) tuples; query
+                may be None for match_all and size defaults to 10
+
+        Returns:
+            One dictionary per search, in order, shaped like search() results
+        """
+        body = []
+        for index, query, *rest in searches:
+            body.append({'index': index})
+            body.append({'query': query or _MATCH_ALL_QUERY, 'size': rest[0] if rest else 10})
+        try:
+            filter_path = None if self._debug else (
+                'responses.hits.total.value,responses.hits.max_score,'
+                'responses.hits.hits._source,responses.error,responses.status'
+            )
+            result = self.client.msearch(body=body, filter_path=filter_path)
+        except Exception as e:
+            return [self._failure(e) for _ in searches]
+
+        responses = []
+        for item in result.get('responses', []):
+            if 'error' in item:
+                error = item['error']
+                responses.append({
+                    'success': False,
+                    'error': error.get('reason', str(error)),
+                    'error_type': error.get('type'),
+                    'retryable': item.get('status') in (429, 503)
+                })
+                continue
+            hits_section = item.get('hits', {})
+            responses.append({
+                'success': True,
+                'hits': [hit.get('_source', {}) for hit in hits_section.get('hits', [])],
+                'total': hits_section.get('total', {}).get('value', 0),
+                'max_score': hits_section.get('max_score')
+            })
+        return responses
+
+    def register_query_template(self, name: str, template: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Store a mustache search template on the cluster for search_template().
+
+        Registering is skipped when the same template is already stored
+        under this name by the module.
+
+        Args:
+            name: Template ID
+            template: Mustache template source (string or Query DSL with
+                {{placeholders}})
+
+        Returns:
+            Dictionary with success status
+        """
+        canonical = json.dumps(template, sort_keys=True)
+        if self._templates.get(name) == canonical:
+            return {'success': True, 'name': name}
+        try:
+            self.client.put_script(id=name, script={'lang': 'mustache', 'source': template})
+            self._templates[name] = canonical
+            return {'success': True, 'name': name}
+        except Exception as e:
+            return self._failure(e)
+
+    def search_template(
+        self,
+        index: str,
+        name: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Search with a template stored by register_query_template().
+
+        Only the template ID and parameters are sent, instead of the full
+        Query DSL body on every request.
+
+        Args:
+            index: Index name (supports wildcards)
+            name: Template ID
+            params: Values for the template placeholders
+
+        Returns:
+            Dictionary with search results
+        """
+        try:
+            result = self.client.search_template(index=index, id=name, params=params or {})
+            hits_section = result.get('hits', {})
+            response = {
+                'success': True,
+                'hits': [hit.get('_source', {}) for hit in hits_section.get('hits', [])],
+                'total': hits_section.get('total', {}).get('value', 0),
+                'max_score': hits_section.get('max_score')
+            }
+            if 'aggregations' in result:
+                response['aggregations'] = result['aggregations']
+            return response
+        except Exception as e:
+            return self._failure(e)
+
+    def set_debug(self, enabled: bool = True) -> None:
+        """
+        Toggle retention of the full raw response of the last search.
+
+        Args:
+            enabled: Keep the raw response in last_result
+        """
+        self._debug = enabled
+        if not enabled:
+            self.last_result = None
+
+    def search_iter(
+        self,
+        index: str,
+        query: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        includes: Optional[List[str]] = None,
+        max_docs: Optional[int] = None,
+        docvalue_fields: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all documents matching a query.
+
+        Documents are fetched lazily from a point in time with search_after
+        (the scroll API on clients without point in time support), so memory
+        use does not grow with the number of matches and results are not
+        capped by index.max_result_window. The client parses each response
+        whole, so batch_size bounds the largest response held in memory;
+        prefer this over search() with a large size. Closing the generator
+        early closes the point in time. Limits that fit in one batch are
+        served by a single plain search, without opening one at all.
+
+        Args:
+            index: Index name
+            query: Query DSL (match_all if None)
+            batch_size: Documents fetched per request
+            includes: Source fields to return (default: all)
+            max_docs: Stop after this many documents (default: all)
+            docvalue_fields: Read these fields from doc values instead of
+                _source (keyword, numeric, date, boolean, ip fields only)
+
+        Yields:
+            Document sources, or with docvalue_fields a dict of field name
+            to list of values per document
+        """
+        body = {'query': query or _MATCH_ALL_QUERY}
+        part = '_source'
+        if docvalue_fields:
+            # Columnar doc values: no _source to load and parse per hit
+            body['_source'] = False
+            body['docvalue_fields'] = list(docvalue_fields)
+            part = 'fields'
+        elif includes:
+            body['_source'] = list(includes)
+
+        if max_docs is not None and max_docs <= batch_size:
+            result = self.client.search(index=index, body=body, size=max_docs)
+            for hit in result['hits']['hits']:
+                yield hit.get(part, {})
+            return
+
+        # Hits come back in index order, so scores are never used
+        body['query'] = _filter_context(query) or _MATCH_ALL_QUERY
+        if hasattr(self.client, 'open_point_in_time'):
+            yield from self._iter_point_in_time(index, body, batch_size, max_docs, part)
+            return
+
+        yielded = 0
+        hits = self._scan(
+            self.client,
+            index=index,
+            query=body,
+            size=batch_size,
+            preserve_order=False
+        )
+        try:
+            for hit in hits:
+                yield hit.get(part, {})
+                yielded += 1
+                if max_docs is not None and yielded >= max_docs:
+                    return
+        finally:
+            hits.close()
+
+    def _iter_point_in_time(
+        self,
+        index: str,
+        body: Dict[str, Any],
+        batch_size: int,
+        max_docs: Optional[int],
+        part: str = '_source'
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Page through a point in time with search_after for search_iter().
+
+        Unlike a scroll, the point in time holds no per-request search
+        context on the shards; _shard_doc is the cheapest total order.
+        """
+        keep_alive = '2m'
+        pit_id = self.client.open_point_in_time(index=index, keep_alive=keep_alive)['id']
+        page = dict(body, sort=[{'_shard_doc': 'asc'}], track_total_hits=False)
+        remaining = max_docs
+        try:
+            while remaining is None or remaining > 0:
+                page['pit'] = {'id': pit_id, 'keep_alive': keep_alive}
+                page['size'] = batch_size if remaining is None else min(batch_size, remaining)
+                result = self.client.search(body=page)
+                # The id can change between responses; always continue from the latest
+                pit_id = result.get('pit_id', pit_id)
+                hits = result['hits']['hits']
+                for hit in hits:
+                    yield hit.get(part, {})
+                if remaining is not None:
+                    remaining -= len(hits)
+                if len(hits) < page['size']:
+                    return
+                page['search_after'] = hits[-1]['sort']
+        finally:
+            try:
+                self.client.close_point_in_time(id=pit_id)
+            except Exception:
+                # Expires on its own after keep_alive
+                pass
 
     def search_df(
         self,
         index: str,
         query: Optional[Dict[str, Any]] = None,
-        size: int = 10000
-    ) -> pd.DataFrame:
+        size: Optional[int] = None,
+        batch_size: int = 1000,
+        columns: Optional[List[str]] = None,
+        dtype_backend: str = 'numpy',
+        fields: Optional[List[str]] = None
+    ) -> 'pd.DataFrame':
         """
         Search and return results as DataFrame.
 
+        Hits are streamed through search_iter() in fixed-size batches, so the
+        result is not limited by index.max_result_window and memory stays
+        bounded while fetching. Each hit is appended straight into per-column
+        lists (nested objects flattened into dotted column names), so no
+        list of row dicts is kept and pandas builds the frame column-wise.
+        When the columns are known up front, only those fields are fetched.
+
         Args:
             index: Index name
             query: Query DSL
-            size: Maximum number of results
+            size: Maximum number of rows (None for all matching documents)
+            batch_size: Documents fetched per request
+            columns: Fields to return, dotted for nested fields (default: all)
+            dtype_backend: 'pyarrow' builds Arrow-backed columns (requires
+                pyarrow; columns with mixed value types fall back to numpy)
+            fields: Columns read from doc values instead of _source (keyword,
+                numeric, date, boolean, ip fields); replaces columns and
+                skips loading and parsing each document's _source
 
         Returns:
             pandas DataFrame with results
         """
-        result = self.search(index, query, size=size)
-        if result.get('success'):
-            return pd.DataFrame(result['hits'])
-        else:
+        import pandas as pd  # Only this method needs pandas; keep it off the import path
+
+        if fields:
+            return self._docvalue_df(pd, index, query, size, batch_size, fields, dtype_backend)
+
+        data = {column: [] for column in columns or ()}
+        paths = [(column.split('.'), data[column]) for column in columns or ()]
+        rows = 0
+
+        def _add(prefix, doc):
+            for key, value in doc.items():
+                name = prefix + key
+                if isinstance(value, dict) and value:
+                    _add(name + '.', value)
+                    continue
+                column = data.get(name)
+                if column is None:
+                    column = data[name] = [None] * rows
+                column.append(value)
+
+        hits = self.search_iter(index, query, batch_size=batch_size, includes=columns, max_docs=size)
+        try:
+            for hit in hits:
+                if columns:
+                    for path, column in paths:
+                        value = hit
+                        for key in path:
+                            value = value.get(key) if isinstance(value, dict) else None
+                        column.append(value)
+                else:
+                    _add('', hit)
+                rows += 1
+                # Fields missing from this document
+                for column in data.values():
+                    if len(column) < rows:
+                        column.append(None)
+                if size is not None and rows >= size:
+                    break
+        except Exception:
             return pd.DataFrame()
+        finally:
+            hits.close()  # Closes the point in time when stopping early
+
+        return self._build_df(pd, data, columns, dtype_backend)
+
+    def _docvalue_df(
+        self,
+        pd,
+        index: str,
+        query: Optional[Dict[str, Any]],
+        size: Optional[int],
+        batch_size: int,
+        fields: List[str],
+        dtype_backend: str
+    ) -> 'pd.DataFrame':
+        """Build the search_df() frame from doc values."""
+        data = {field: [] for field in fields}
+        hits = self.search_iter(index, query, batch_size=batch_size, max_docs=size, docvalue_fields=fields)
+        try:
+            for hit in hits:
+                for field, column in data.items():
+                    # Doc values always come as lists; unwrap single values
+                    values = hit.get(field)
+                    column.append(values[0] if values and len(values) == 1 else values or None)
+        except Exception:
+            return pd.DataFrame()
+        finally:
+            hits.close()
+        return self._build_df(pd, data, fields, dtype_backend)
+
+    @staticmethod
+    def _build_df(pd, data: Dict[str, List], columns: Optional[List[str]], dtype_backend: str) -> 'pd.DataFrame':
+        """Turn per-column lists into a DataFrame."""
+        if dtype_backend == 'pyarrow' and data:
+            import pyarrow as pa
+            try:
+                table = pa.Table.from_pydict(data)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                pass
+            else:
+                return table.to_pandas(types_mapper=pd.ArrowDtype)
+        return pd.DataFrame(data, columns=columns)
+
+    def open_point_in_time(self, index: str, keep_alive: str = '1m') -> Dict[str, Any]:
+        """
+        Open a point in time for consistent deep pagination with search_after.
+
+        Args:
+            index: Index name (supports wildcards)
+            keep_alive: How long the point in time is kept between requests
+
+        Returns:
+            Dictionary with the point in time id
+        """
+        try:
+            result = self.client.open_point_in_time(index=index, keep_alive=keep_alive)
+            return {'success': True, 'pit_id': result['id']}
+        except Exception as e:
+            return self._failure(e)
+
+    def close_point_in_time(self, pit_id: str) -> Dict[str, Any]:
+        """
+        Close a point in time and release its resources.
+
+        Args:
+            pit_id: Point in time id
+
+        Returns:
+            Dictionary with success status
+        """
+        try:
+            self.client.close_point_in_time(id=pit_id)
+            return {'success': True}
+        except Exception as e:
+            return self._failure(e)
 
     def count(
         self,
         index: str,
-        query: Optional[Dict[str, Any]] = None
-    ) -> int:
+        query: Optional[Dict[str, Any]] = None,
+        pit_id: Optional[str] = None,
+        preference: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Count documents matching query.
 
         Args:
             index: Index name
             query: Query DSL (all documents if None)
+            pit_id: Count within a point in time from open_point_in_time(),
+                consistent with pages fetched from it (index is then ignored)
+            preference: Shard copy routing key (default: derived from index
+                and query, as in search())
 
         Returns:
-            Number of matching documents
+            Dictionary with success status and the number of matching documents
         """
         try:
-            body = {}
-            if query:
-                body['query'] = query
+            count = self._cached_read(
+                self._cache_ttl,
+                lambda: self._count_uncached(index, _filter_context(query), pit_id, preference),
+                'count', index, query, pit_id
+            )
+            return {'success': True, 'count': count}
+        except Exception as e:
+            return self._failure(e)
 
-            result = self.client.count(index=index, body=body if body else None)
-            return result['count']
-        except Exception:
-            return 0
+    def _count_uncached(
+        self,
+        index: str,
+        query: Optional[Dict[str, Any]],
+        pit_id: Optional[str],
+        preference: Optional[str] = None
+    ) -> int:
+        """Run a count against the cluster."""
+        if pit_id:
+            # _count does not take a point in time; a hitless search does
+            result = self.client.search(
+                pit={'id': pit_id}, query=query or _MATCH_ALL_QUERY, size=0,
+                track_total_hits=True, filter_path='hits.total.value'
+            )
+            return result['hits']['total']['value']
+        if not query or query == _MATCH_ALL_QUERY:
+            # No body: answered from per-shard document counts
+            return self.client.count(index=index)['count']
+        return self.client.count(
+            index=index, query=query, preference=preference or _stable_preference(index, query)
+        )['count']
 
     def delete_by_query(
         self,
         index: str,
         query: Dict[str, Any],
-        refresh: bool = False
+        refresh: bool = False,
+        slices: Union[int, str] = 'auto',
+        requests_per_second: float = -1,
+        wait_for_completion: bool = True
     ) -> Dict[str, Any]:
         """
         Delete documents matching query.
@@ -518,30 +1868,44 @@ class ElasticsearchModule(AIbasicModuleBase):
             index: Index name
             query: Query DSL
             refresh: Refresh index after operation
+            slices: Number of parallel slices ('auto' uses one per shard)
+            requests_per_second: Throttle in sub-requests per second (-1: unthrottled)
+            wait_for_completion: If False, start the operation as a task and
+                return its id for get_task() instead of blocking
 
         Returns:
-            Dictionary with deletion result
+            Dictionary with deletion result, or the task id
         """
         try:
             result = self.client.delete_by_query(
                 index=index,
-                body={'query': query},
-                refresh=refresh
+                body={'query': _filter_context(query)},
+                refresh=self._effective_refresh(index, refresh),
+                slices=slices,
+                scroll_size=1000,
+                requests_per_second=requests_per_second,
+                wait_for_completion=wait_for_completion
             )
+            self._invalidate_caches()
+            if not wait_for_completion:
+                return {'success': True, 'task': result['task']}
             return {
                 'success': True,
                 'deleted': result['deleted'],
                 'total': result['total']
             }
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
 
     def update_by_query(
         self,
         index: str,
         query: Dict[str, Any],
         script: Dict[str, Any],
-        refresh: bool = False
+        refresh: bool = False,
+        slices: Union[int, str] = 'auto',
+        requests_per_second: float = -1,
+        wait_for_completion: bool = True
     ) -> Dict[str, Any]:
         """
         Update documents matching query.
@@ -551,26 +1915,62 @@ class ElasticsearchModule(AIbasicModuleBase):
             query: Query DSL
             script: Update script
             refresh: Refresh index after operation
+            slices: Number of parallel slices ('auto' uses one per shard)
+            requests_per_second: Throttle in sub-requests per second (-1: unthrottled)
+            wait_for_completion: If False, start the operation as a task and
+                return its id for get_task() instead of blocking
 
         Returns:
-            Dictionary with update result
+            Dictionary with update result, or the task id
         """
         try:
             result = self.client.update_by_query(
                 index=index,
                 body={
-                    'query': query,
+                    'query': _filter_context(query),
                     'script': script
                 },
-                refresh=refresh
+                refresh=self._effective_refresh(index, refresh),
+                slices=slices,
+                scroll_size=1000,
+                requests_per_second=requests_per_second,
+                wait_for_completion=wait_for_completion
             )
+            self._invalidate_caches()
+            if not wait_for_completion:
+                return {'success': True, 'task': result['task']}
             return {
                 'success': True,
                 'updated': result['updated'],
                 'total': result['total']
             }
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
+
+    def get_task(self, task_id: str) -> Dict[str, Any]:
+        """
+        Poll a task started with wait_for_completion=False.
+
+        Args:
+            task_id: Task id returned by delete_by_query() or update_by_query()
+
+        Returns:
+            Dictionary with completed flag, progress status and, once
+            completed, the operation's response
+        """
+        try:
+            result = self.client.tasks.get(task_id=task_id)
+            if result['completed']:
+                # Documents kept changing after the request returned
+                self._invalidate_caches()
+            return {
+                'success': True,
+                'completed': result['completed'],
+                'status': result['task'].get('status', {}),
+                'response': result.get('response')
+            }
+        except Exception as e:
+            return self._failure(e)
 
     def put_mapping(
         self,
@@ -592,25 +1992,128 @@ class ElasticsearchModule(AIbasicModuleBase):
                 index=index,
                 body={'properties': properties}
             )
+            self._invalidate_caches()
+            self._ngram_fields.clear()
             return {'success': True, 'acknowledged': result.get('acknowledged', False)}
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
+
+    def put_ngram_mapping(
+        self,
+        index: str,
+        field: str,
+        min_gram: int = 2,
+        max_gram: int = 19,
+        backfill: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Add a <field>.ngram sub-field that indexes the field's leading
+        characters, so prefix queries become term lookups. Only keyword
+        fields without a normalizer are supported.
+
+        search() then rewrites {"prefix": {field: ...}} queries to the
+        sub-field instead of scanning the term dictionary. The sub-field is
+        an unanalyzed text field with index_prefixes, so matches are the
+        same as on a keyword field and no custom analyzer is needed.
+
+        Args:
+            index: Index name
+            field: Existing field to add the sub-field to
+            min_gram: Shortest indexed prefix
+            max_gram: Longest indexed prefix (at most 19); longer prefixes
+                still match, without the shortcut
+            backfill: Start an update_by_query task that reindexes existing
+                documents in place so they get the sub-field (until it
+                finishes, prefix searches miss older documents)
+
+        Returns:
+            Dictionary with success status, plus the backfill task id
+            (follow it with get_task())
+        """
+        try:
+            current = self.client.indices.get_field_mapping(index=index, fields=field)
+            mappings = [mapping for mapping in _field_mappings(current, field) if mapping]
+            if not mappings:
+                return {'success': False, 'error': f'Field {field} not found in index {index}'}
+            # The sub-field matches raw values, which is only equivalent for unnormalized keywords
+            if not all(_is_plain_keyword(mapping) for mapping in mappings):
+                return {
+                    'success': False,
+                    'error': f'Field {field} must be a keyword field without a normalizer'
+                }
+            # Resend the field's own mapping so only the sub-field is added
+            mapping = dict(mappings[0])
+            mapping['fields'] = dict(mapping.get('fields', {}), ngram={
+                'type': 'text',
+                'analyzer': 'keyword',
+                'index_prefixes': {'min_chars': min_gram, 'max_chars': max_gram}
+            })
+            self.client.indices.put_mapping(index=index, body={'properties': {field: mapping}})
+            self._invalidate_caches()
+            self._ngram_fields.clear()
+            response = {'success': True, 'field': f'{field}.ngram'}
+            if backfill:
+                result = self.client.update_by_query(
+                    index=index, conflicts='proceed', slices='auto', refresh=True, wait_for_completion=False
+                )
+                response['task'] = result['task']
+            return response
+        except Exception as e:
+            return self._failure(e)
+
+    def _has_ngram(self, index: str, field: str) -> bool:
+        """Check (once per index and field) whether field is a plain keyword with an .ngram sub-field."""
+        known = self._ngram_fields.get((index, field))
+        if known is None:
+            sub_field = f'{field}.ngram'
+            try:
+                current = self.client.indices.get_field_mapping(index=index, fields=[field, sub_field])
+                parents = _field_mappings(current, field)
+                subs = _field_mappings(current, sub_field)
+                known = bool(parents) and all(
+                    _is_plain_keyword(parent) and sub is not None for parent, sub in zip(parents, subs)
+                )
+            except Exception:
+                known = False
+            self._ngram_fields[(index, field)] = known
+        return known
+
+    def _prefix_to_ngram(self, index: str, query: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Point a top-level prefix query at the field's .ngram sub-field, if it has one."""
+        if not isinstance(query, dict) or list(query) != ['prefix'] or len(query['prefix']) != 1:
+            return query
+        (field, value), = query['prefix'].items()
+        # Options such as case_insensitive or rewrite stay on the original field
+        if isinstance(value, dict) and not set(value) <= {'value', 'boost'}:
+            return query
+        if field.endswith('.ngram') or not self._has_ngram(index, field):
+            return query
+        return {'prefix': {f'{field}.ngram': value}}
 
     def refresh_index(self, index: str) -> Dict[str, Any]:
         """
         Refresh an index to make recent changes searchable.
 
+        Skipped when the module refreshed the index less than half a second
+        ago and has written nothing to it since (e.g. right after
+        bulk_index(refresh=True)).
+
         Args:
             index: Index name
 
         Returns:
             Dictionary with refresh result
         """
+        refreshed = self._refreshed.get(index)
+        if refreshed is not None and time.monotonic() - refreshed < 0.5:
+            return {'success': True, 'skipped': True}
         try:
             self.client.indices.refresh(index=index)
+            self._invalidate_caches()
+            self._refreshed[index] = time.monotonic()
             return {'success': True}
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
 
     def create_alias(
         self,
@@ -629,9 +2132,10 @@ class ElasticsearchModule(AIbasicModuleBase):
         """
         try:
             result = self.client.indices.put_alias(index=index, name=alias)
+            self._invalidate_caches()
             return {'success': True, 'acknowledged': result.get('acknowledged', False)}
         except Exception as e:
-            return {'success': False, 'error': str(e)}
+            return self._failure(e)
 
     def get_cluster_health(self) -> Dict[str, Any]:
         """
@@ -641,7 +2145,7 @@ class ElasticsearchModule(AIbasicModuleBase):
             Dictionary with cluster health information
         """
         try:
-            return self.client.cluster.health()
+            return self._cached_read(self._health_cache_ttl, self.client.cluster.health, 'health')
         except Exception as e:
             return {'error': str(e)}
 
@@ -656,16 +2160,26 @@ class ElasticsearchModule(AIbasicModuleBase):
             Dictionary with index stats
         """
         try:
-            return self.client.indices.stats(index=index)
+            return self._cached_read(
+                self._stats_cache_ttl, lambda: self.client.indices.stats(index=index), 'stats', index
+            )
         except Exception as e:
             return {'error': str(e)}
 
     def close(self):
         """
         Close the Elasticsearch client connection.
+
+        Buffered documents are flushed first.
+
+        Returns:
+            Result of the final flush (including failures of earlier
+            background flushes), or None if no client was created
         """
         if hasattr(self, 'client'):
+            result = self.flush()
             self.client.close()
+            return result
 
     @classmethod
     def get_metadata(cls):
@@ -687,383 +2201,804 @@ class ElasticsearchModule(AIbasicModuleBase):
     def get_usage_notes(cls):
         """Get detailed usage notes."""
         return [
-            "Module uses singleton pattern - one instance shared across operations",
+            "Use ElasticsearchModule.instance(**config) (or get_elasticsearch_module) to share one module and client per configuration",
             "Supports multiple authentication methods: basic auth (username/password) or API key",
             "Can connect to single node or cluster with multiple hosts for high availability",
             "All document operations support optional 'refresh' parameter to make changes immediately searchable",
             "Index names support wildcards (e.g., 'logs-*') for multi-index operations",
             "Query DSL uses nested dictionaries matching Elasticsearch JSON syntax",
             "Bulk operations are highly efficient - use for indexing large numbers of documents",
+            "index_document(buffered=True) queues documents and sends them as one bulk request after write_batch_size documents, max_buffer_bytes or flush_interval seconds; call flush() (or close()) to send the rest",
             "Aggregations run alongside search queries to compute metrics, statistics, and analytics",
             "Document IDs are auto-generated if not provided during indexing",
             "The 'size' parameter controls pagination - max recommended is 10,000 per request",
             "Use 'from_' parameter for pagination offset (0-based)",
             "SSL certificate verification can be disabled for development but should be enabled in production",
             "Mappings define field types (text, keyword, integer, date, etc.) and cannot be changed for existing fields",
+            "Use put_ngram_mapping(index, field) for keyword fields (without a normalizer) searched by prefix: search() then sends top-level prefix queries on that field to the indexed-prefix sub-field instead of scanning terms",
             "Aliases provide abstraction over index names - useful for zero-downtime reindexing",
             "Use search_df() method to get results as pandas DataFrame for data analysis",
-            "The module stores last_query and last_result for debugging and inspection",
+            "Use msearch() to send several searches in one round trip; batches of 10-50 searches work well",
+            "Pass track_total_hits=False to search() when only the top hits are needed: shards stop collecting early and total is returned as None",
+            "search() parses the whole response at once; for thousands of hits use search_iter(), whose batch_size bounds the largest response held in memory",
+            "search_df() and search_iter() stream every match from a point in time with search_after (not capped at 10,000 hits, lighter on the cluster than a scroll); pass size/max_docs to stop early - limits up to batch_size use one plain search instead",
+            "The module stores last_query and last_query_meta (index, size, took, total) after each search; the full raw response is kept in last_result only with debug=True or set_debug(True)",
             "Refresh operation makes recent changes searchable but has performance cost - use sparingly",
-            "Count operations are faster than search when you only need document counts"
+            "Wrap a series of writes in 'with es.batched_refresh(index):' to replace per-write refreshes with one refresh at the end",
+            "refresh_index() is skipped (returns skipped: True) if the module refreshed that index under 0.5 seconds earlier and has written nothing since, e.g. right after bulk_index(refresh=True)",
+            "Count operations are faster than search when you only need document counts",
+            "Where scores are not used (count, delete_by_query, update_by_query, search_iter/search_df, aggregations, and searches sorted without _score) queries run in filter context - bool must clauses become filter clauses and other queries are wrapped in constant_score - skipping scoring and using the query cache",
+            "Failed calls return {'success': False, 'error', 'error_type', 'retryable'}; retryable is True for connection failures and timeouts",
+            "Request and response bodies are (de)serialized with orjson when it is installed",
+            "Pass search_cbor=True (requires cbor2) to send search requests and receive responses as CBOR instead of JSON",
+            "AsyncElasticsearchModule offers async search, search_many, index_document and bulk_index for asyncio programs (requires elasticsearch[async])",
+            "The client pools connections_per_node HTTP connections per node (default 25, 'maxsize' is accepted as an alias); raise it if more threads call the module concurrently",
+            "Request bodies are gzip-compressed (http_compress=True) and connections are kept alive and reused across calls",
+            "Search results, counts, get_document lookups and index_exists checks are cached in-process for cache_ttl seconds (default 5), cluster health for health_cache_ttl (2) and index stats for stats_cache_ttl (30); writes through the module clear the caches and queries using 'now' are never cached",
+            "Queries passed as preload_queries run at startup and stay pinned in the search cache; use clear_cache() to drop cached results"
         ]
 
     @classmethod
     def get_methods_info(cls):
         """Get information about module methods."""
-        from aibasic.modules.module_base import MethodInfo
-        return [
-            MethodInfo(
-                name="ping",
-                description="Check if Elasticsearch cluster is accessible and responding",
-                parameters={},
-                returns="Boolean: True if cluster responds, False otherwise",
-                examples=[
-                    '(elasticsearch) ping cluster',
-                    '(elasticsearch) check if elasticsearch is available'
-                ]
-            ),
-            MethodInfo(
-                name="info",
-                description="Get detailed cluster information including version, name, and configuration",
-                parameters={},
-                returns="Dictionary with cluster information",
-                examples=[
-                    '(elasticsearch) get cluster info',
-                    '(elasticsearch) show elasticsearch version and details'
-                ]
-            ),
-            MethodInfo(
-                name="create_index",
-                description="Create a new index with optional mappings, settings, and aliases",
-                parameters={
-                    "index": "Index name to create",
-                    "mappings": "Field type definitions (optional, dict with 'properties' defining field types)",
-                    "settings": "Index settings like number of shards and replicas (optional, dict)",
-                    "aliases": "Index aliases (optional, dict)"
-                },
-                returns="Dictionary with success status and acknowledgement",
-                examples=[
-                    '(elasticsearch) create index "products"',
-                    '(elasticsearch) create index "logs" with mappings {"properties": {"timestamp": {"type": "date"}, "message": {"type": "text"}}}',
-                    '(elasticsearch) create index "users" with settings {"number_of_shards": 3, "number_of_replicas": 2}',
-                    '(elasticsearch) create index "events" with mappings {"properties": {"level": {"type": "keyword"}}} and aliases {"current": {}}'
-                ]
-            ),
-            MethodInfo(
-                name="delete_index",
-                description="Delete an index (supports wildcards for deleting multiple indices)",
-                parameters={
-                    "index": "Index name to delete (supports wildcards like 'logs-*')"
-                },
-                returns="Dictionary with success status and acknowledgement",
-                examples=[
-                    '(elasticsearch) delete index "old-logs"',
-                    '(elasticsearch) delete index "test-*"',
-                    '(elasticsearch) remove index "temporary"'
-                ]
-            ),
-            MethodInfo(
-                name="index_exists",
-                description="Check if an index exists in the cluster",
-                parameters={
-                    "index": "Index name to check"
-                },
-                returns="Boolean: True if index exists, False otherwise",
-                examples=[
-                    '(elasticsearch) check if index "products" exists',
-                    '(elasticsearch) does index "users" exist'
-                ]
-            ),
-            MethodInfo(
-                name="index_document",
-                description="Index a single document into an index (create or update)",
-                parameters={
-                    "index": "Index name",
-                    "document": "Document data as dictionary",
-                    "doc_id": "Document ID (optional, auto-generated if not provided)",
-                    "refresh": "Refresh index immediately to make document searchable (default: False)"
-                },
-                returns="Dictionary with document ID, version, and result (created/updated)",
-                examples=[
-                    '(elasticsearch) index document {"name": "John", "age": 30} into index "users"',
-                    '(elasticsearch) index document {"product": "laptop", "price": 999} with id "prod-123" into index "products"',
-                    '(elasticsearch) index document {"message": "error occurred", "level": "ERROR"} into index "logs" with refresh True'
-                ]
-            ),
-            MethodInfo(
-                name="bulk_index",
-                description="Bulk index multiple documents efficiently in a single request",
-                parameters={
-                    "index": "Index name",
-                    "documents": "List of document dictionaries to index",
-                    "id_field": "Field name to use as document ID (optional)",
-                    "refresh": "Refresh index after bulk operation (default: False)"
-                },
-                returns="Dictionary with successful count, failed count, and total",
-                examples=[
-                    '(elasticsearch) bulk index documents [{"name": "Alice"}, {"name": "Bob"}] into index "users"',
-                    '(elasticsearch) bulk index documents from list with id_field "user_id" into index "accounts"',
-                    '(elasticsearch) index 1000 documents into index "logs" with refresh True'
-                ]
-            ),
-            MethodInfo(
-                name="get_document",
-                description="Retrieve a document by its ID from an index",
-                parameters={
-                    "index": "Index name",
-                    "doc_id": "Document ID to retrieve"
-                },
-                returns="Document dictionary if found, None if not found, or error dict",
-                examples=[
-                    '(elasticsearch) get document "user-123" from index "users"',
-                    '(elasticsearch) retrieve document with id "prod-456" from index "products"',
-                    '(elasticsearch) fetch document "event-789" from index "events"'
-                ]
-            ),
-            MethodInfo(
-                name="update_document",
-                description="Update specific fields of an existing document",
-                parameters={
-                    "index": "Index name",
-                    "doc_id": "Document ID to update",
-                    "document": "Dictionary with fields to update (partial document)",
-                    "refresh": "Refresh index immediately (default: False)"
-                },
-                returns="Dictionary with version and result status",
-                examples=[
-                    '(elasticsearch) update document "user-123" in index "users" with {"age": 31}',
-                    '(elasticsearch) update document "prod-456" with {"price": 899, "stock": 50} in index "products"',
-                    '(elasticsearch) update document "event-789" set {"status": "processed"} with refresh True'
-                ]
-            ),
-            MethodInfo(
-                name="delete_document",
-                description="Delete a document by its ID from an index",
-                parameters={
-                    "index": "Index name",
-                    "doc_id": "Document ID to delete",
-                    "refresh": "Refresh index immediately (default: False)"
-                },
-                returns="Dictionary with success status and result",
-                examples=[
-                    '(elasticsearch) delete document "user-123" from index "users"',
-                    '(elasticsearch) remove document "old-event" from index "events"',
-                    '(elasticsearch) delete document "temp-456" from index "temporary" with refresh True'
-                ]
-            ),
-            MethodInfo(
-                name="search",
-                description="Search documents using Elasticsearch Query DSL with support for pagination, sorting, and aggregations",
-                parameters={
-                    "index": "Index name (supports wildcards like 'logs-*')",
-                    "query": "Query DSL dictionary (optional, defaults to match_all)",
-                    "size": "Number of results to return (default: 10, max recommended: 10000)",
-                    "from_": "Offset for pagination (default: 0)",
-                    "sort": "Sort specification list (optional)",
-                    "source": "Fields to return - True/False or list of field names (optional)",
-                    "aggs": "Aggregations dictionary (optional)"
-                },
-                returns="Dictionary with hits list, total count, max_score, and optional aggregations",
-                examples=[
-                    '(elasticsearch) search index "products"',
-                    '(elasticsearch) search index "users" with query {"match": {"name": "john"}}',
-                    '(elasticsearch) search index "logs" with query {"range": {"timestamp": {"gte": "2024-01-01"}}} size 100',
-                    '(elasticsearch) search index "events" with query {"term": {"level": "ERROR"}} and aggs {"by_type": {"terms": {"field": "type.keyword"}}}',
-                    '(elasticsearch) search index "products" sort [{"price": "asc"}] size 20',
-                    '(elasticsearch) search index "users" from 50 size 10 source ["name", "email"]'
-                ]
-            ),
-            MethodInfo(
-                name="search_df",
-                description="Search documents and return results as pandas DataFrame for data analysis",
-                parameters={
-                    "index": "Index name",
-                    "query": "Query DSL dictionary (optional, defaults to match_all)",
-                    "size": "Maximum number of results (default: 10000)"
-                },
-                returns="pandas DataFrame with search results",
-                examples=[
-                    '(elasticsearch) search index "products" as dataframe',
-                    '(elasticsearch) search index "logs" with query {"match": {"level": "ERROR"}} as dataframe',
-                    '(elasticsearch) get all documents from index "users" as dataframe with size 50000'
-                ]
-            ),
-            MethodInfo(
-                name="count",
-                description="Count documents matching a query (faster than search when only count is needed)",
-                parameters={
-                    "index": "Index name",
-                    "query": "Query DSL dictionary (optional, counts all documents if omitted)"
-                },
-                returns="Integer: number of matching documents",
-                examples=[
-                    '(elasticsearch) count documents in index "users"',
-                    '(elasticsearch) count documents in index "logs" matching query {"term": {"level": "ERROR"}}',
-                    '(elasticsearch) count index "products" where query {"range": {"price": {"lt": 100}}}'
-                ]
-            ),
-            MethodInfo(
-                name="delete_by_query",
-                description="Delete all documents matching a query",
-                parameters={
-                    "index": "Index name",
-                    "query": "Query DSL dictionary specifying which documents to delete",
-                    "refresh": "Refresh index immediately (default: False)"
-                },
-                returns="Dictionary with deleted count and total processed",
-                examples=[
-                    '(elasticsearch) delete documents from index "logs" where query {"range": {"timestamp": {"lt": "2023-01-01"}}}',
-                    '(elasticsearch) delete from index "users" matching query {"term": {"status": "inactive"}}',
-                    '(elasticsearch) delete documents in index "temp" where query {"match_all": {}} with refresh True'
-                ]
-            ),
-            MethodInfo(
-                name="update_by_query",
-                description="Update all documents matching a query using a script",
-                parameters={
-                    "index": "Index name",
-                    "query": "Query DSL dictionary specifying which documents to update",
-                    "script": "Update script dictionary (e.g., {'source': 'ctx._source.field++'})",
-                    "refresh": "Refresh index immediately (default: False)"
-                },
-                returns="Dictionary with updated count and total processed",
-                examples=[
-                    '(elasticsearch) update documents in index "products" matching query {"term": {"category": "electronics"}} with script {"source": "ctx._source.price *= 1.1"}',
-                    '(elasticsearch) update index "users" where query {"match_all": {}} with script {"source": "ctx._source.updated_at = params.now", "params": {"now": "2024-01-01"}}',
-                    '(elasticsearch) update documents matching query {"range": {"views": {"lt": 10}}} with script {"source": "ctx._source.views = 0"} and refresh True'
-                ]
-            ),
-            MethodInfo(
-                name="put_mapping",
-                description="Add new fields to index mapping (cannot modify existing field types)",
-                parameters={
-                    "index": "Index name",
-                    "properties": "Dictionary defining new field mappings"
-                },
-                returns="Dictionary with success status and acknowledgement",
-                examples=[
-                    '(elasticsearch) put mapping for index "users" with properties {"phone": {"type": "keyword"}}',
-                    '(elasticsearch) add mapping to index "products" properties {"tags": {"type": "keyword"}, "rating": {"type": "float"}}',
-                    '(elasticsearch) update mapping for index "logs" add properties {"source_ip": {"type": "ip"}}'
-                ]
-            ),
-            MethodInfo(
-                name="refresh_index",
-                description="Refresh index to make recent changes immediately searchable (has performance cost)",
-                parameters={
-                    "index": "Index name to refresh"
-                },
-                returns="Dictionary with success status",
-                examples=[
-                    '(elasticsearch) refresh index "products"',
-                    '(elasticsearch) refresh index "logs" to make changes searchable',
-                    '(elasticsearch) force refresh on index "users"'
-                ]
-            ),
-            MethodInfo(
-                name="create_alias",
-                description="Create an alias pointing to an index (useful for zero-downtime reindexing)",
-                parameters={
-                    "index": "Index name",
-                    "alias": "Alias name to create"
-                },
-                returns="Dictionary with success status and acknowledgement",
-                examples=[
-                    '(elasticsearch) create alias "current_products" for index "products_v2"',
-                    '(elasticsearch) add alias "active_logs" to index "logs-2024-01"',
-                    '(elasticsearch) create alias "users" pointing to index "users_production"'
-                ]
-            ),
-            MethodInfo(
-                name="get_cluster_health",
-                description="Get cluster health status including status color (green/yellow/red), node counts, and shard information",
-                parameters={},
-                returns="Dictionary with cluster health details",
-                examples=[
-                    '(elasticsearch) get cluster health',
-                    '(elasticsearch) check cluster status',
-                    '(elasticsearch) show cluster health information'
-                ]
-            ),
-            MethodInfo(
-                name="get_index_stats",
-                description="Get detailed statistics for an index including document count, storage size, and performance metrics",
-                parameters={
-                    "index": "Index name"
-                },
-                returns="Dictionary with comprehensive index statistics",
-                examples=[
-                    '(elasticsearch) get stats for index "products"',
-                    '(elasticsearch) show index statistics for "logs"',
-                    '(elasticsearch) get index "users" stats and metrics'
-                ]
-            )
-        ]
+        return _METHOD_INFOS
 
     @classmethod
     def get_examples(cls):
         """Get AIbasic usage examples."""
-        return [
-            # Basic connectivity
-            '10 (elasticsearch) ping cluster',
-            '20 (elasticsearch) get cluster info',
-            '30 (elasticsearch) get cluster health',
-
-            # Index management
-            '40 (elasticsearch) create index "products"',
-            '50 (elasticsearch) create index "logs" with mappings {"properties": {"timestamp": {"type": "date"}, "message": {"type": "text"}, "level": {"type": "keyword"}}}',
-            '60 (elasticsearch) create index "users" with settings {"number_of_shards": 3, "number_of_replicas": 1}',
-            '70 (elasticsearch) check if index "products" exists',
-            '80 (elasticsearch) delete index "old-logs"',
-            '90 (elasticsearch) get stats for index "products"',
-
-            # Document operations
-            '100 (elasticsearch) index document {"name": "Laptop", "price": 999, "category": "electronics"} into index "products"',
-            '110 (elasticsearch) index document {"user": "john", "email": "john@example.com"} with id "user-123" into index "users"',
-            '120 (elasticsearch) get document "user-123" from index "users"',
-            '130 (elasticsearch) update document "user-123" in index "users" with {"age": 30, "city": "NYC"}',
-            '140 (elasticsearch) delete document "user-456" from index "users"',
-
-            # Bulk operations
-            '150 (elasticsearch) bulk index documents [{"name": "Alice"}, {"name": "Bob"}, {"name": "Charlie"}] into index "users"',
-            '160 (elasticsearch) bulk index 1000 documents into index "logs" with id_field "event_id" and refresh True',
-
-            # Search operations
-            '170 (elasticsearch) search index "products"',
-            '180 (elasticsearch) search index "products" with query {"match": {"name": "laptop"}} size 20',
-            '190 (elasticsearch) search index "users" with query {"term": {"city.keyword": "NYC"}}',
-            '200 (elasticsearch) search index "logs" with query {"range": {"timestamp": {"gte": "2024-01-01", "lt": "2024-02-01"}}} size 100',
-            '210 (elasticsearch) search index "products" with query {"bool": {"must": [{"match": {"category": "electronics"}}, {"range": {"price": {"lt": 1000}}}]}}',
-            '220 (elasticsearch) search index "products" sort [{"price": "asc"}] size 50',
-            '230 (elasticsearch) search index "users" from 100 size 20 source ["name", "email"]',
-
-            # Aggregations
-            '240 (elasticsearch) search index "products" with aggs {"avg_price": {"avg": {"field": "price"}}, "by_category": {"terms": {"field": "category.keyword"}}}',
-            '250 (elasticsearch) search index "logs" with query {"match_all": {}} and aggs {"errors_per_day": {"date_histogram": {"field": "timestamp", "interval": "day"}}}',
-
-            # DataFrame integration
-            '260 (elasticsearch) search index "products" as dataframe',
-            '270 (elasticsearch) search index "logs" with query {"term": {"level": "ERROR"}} as dataframe with size 10000',
-
-            # Count operations
-            '280 (elasticsearch) count documents in index "users"',
-            '290 (elasticsearch) count documents in index "logs" matching query {"term": {"level": "ERROR"}}',
-
-            # Batch updates/deletes
-            '300 (elasticsearch) delete documents from index "logs" where query {"range": {"timestamp": {"lt": "2023-01-01"}}}',
-            '310 (elasticsearch) update documents in index "products" matching query {"term": {"category": "electronics"}} with script {"source": "ctx._source.price *= 0.9"}',
-
-            # Mapping and aliases
-            '320 (elasticsearch) put mapping for index "users" with properties {"phone": {"type": "keyword"}, "age": {"type": "integer"}}',
-            '330 (elasticsearch) create alias "current_products" for index "products_v2"',
-            '340 (elasticsearch) refresh index "products"'
-        ]
+        return _EXAMPLES
+
+    @classmethod
+    def get_examples_dsl(cls) -> tuple:
+        """
+        Get the usage examples paired with their inline Query DSL.
+
+        Returns:
+            (example, dsl) tuples, where dsl holds the JSON objects embedded
+            in the example, parsed once at import time
+        """
+        return _EXAMPLES_PARSED
+
+
+# Static metadata catalog, built once at import time and shared read-only
+_METHOD_INFOS = (
+    MethodInfo(
+        name="ping",
+        description="Check if Elasticsearch cluster is accessible and responding",
+        parameters=MappingProxyType({}),
+        returns="Boolean: True if cluster responds, False otherwise",
+        examples=(
+            '(elasticsearch) ping cluster',
+            '(elasticsearch) check if elasticsearch is available',
+        )
+    ),
+    MethodInfo(
+        name="info",
+        description="Get detailed cluster information including version, name, and configuration",
+        parameters=MappingProxyType({}),
+        returns="Dictionary with cluster information",
+        examples=(
+            '(elasticsearch) get cluster info',
+            '(elasticsearch) show elasticsearch version and details',
+        )
+    ),
+    MethodInfo(
+        name="create_index",
+        description="Create a new index with optional mappings, settings, and aliases",
+        parameters=MappingProxyType({
+            "index": "Index name to create",
+            "mappings": "Field type definitions (optional, dict with 'properties' defining field types)",
+            "settings": "Index settings like number of shards and replicas (optional, dict)",
+            "aliases": "Index aliases (optional, dict)",
+            "ingest_mode": "Create tuned for an initial bulk load - no replicas, 30s refresh, async translog (default: False)"
+        }),
+        returns="Dictionary with success status and acknowledgement",
+        examples=(
+            '(elasticsearch) create index "products"',
+            '(elasticsearch) create index "logs" with mappings {"properties": {"timestamp": {"type": "date"}, "message": {"type": "text"}}}',
+            '(elasticsearch) create index "users" with settings {"number_of_shards": 3, "number_of_replicas": 2}',
+            '(elasticsearch) create index "events" with mappings {"properties": {"level": {"type": "keyword"}}} and aliases {"current": {}}',
+        )
+    ),
+    MethodInfo(
+        name="finalize_index",
+        description="Restore replicas, refresh interval and durable translog after an ingest_mode load",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "number_of_replicas": "Replicas to serve with (default: 1)",
+            "refresh_interval": "Refresh interval to serve with (default: '1s')"
+        }),
+        returns="Dictionary with success status",
+        examples=(
+            '(elasticsearch) finalize index "products" after loading',
+            '(elasticsearch) finalize index "logs" with 2 replicas',
+        )
+    ),
+    MethodInfo(
+        name="delete_index",
+        description="Delete an index (supports wildcards for deleting multiple indices)",
+        parameters=MappingProxyType({
+            "index": "Index name to delete (supports wildcards like 'logs-*')"
+        }),
+        returns="Dictionary with success status and acknowledgement",
+        examples=(
+            '(elasticsearch) delete index "old-logs"',
+            '(elasticsearch) delete index "test-*"',
+            '(elasticsearch) remove index "temporary"',
+        )
+    ),
+    MethodInfo(
+        name="index_exists",
+        description="Check if an index exists in the cluster",
+        parameters=MappingProxyType({
+            "index": "Index name to check"
+        }),
+        returns="Boolean: True if index exists, False otherwise",
+        examples=(
+            '(elasticsearch) check if index "products" exists',
+            '(elasticsearch) does index "users" exist',
+        )
+    ),
+    MethodInfo(
+        name="indices_exist",
+        description="Check whether several indices, aliases or data streams exist in a single request",
+        parameters=MappingProxyType({
+            "names": "List of index names"
+        }),
+        returns="Dictionary mapping each name to True/False, or a failure dictionary on errors",
+        examples=(
+            '(elasticsearch) check if indices ["users", "products", "orders"] exist',
+            '(elasticsearch) which of indices ["logs-2024", "logs-2025"] exist',
+        )
+    ),
+    MethodInfo(
+        name="index_document",
+        description="Index a single document into an index (create or update)",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "document": "Document data as dictionary",
+            "doc_id": "Document ID (optional, auto-generated if not provided)",
+            "refresh": "Refresh index immediately to make document searchable (default: False)",
+            "buffered": "Queue the document and send it with others in one bulk request (default: False)"
+        }),
+        returns="Dictionary with document ID, version, and result (created/updated); {'buffered': True} when buffered",
+        examples=(
+            '(elasticsearch) index document {"name": "John", "age": 30} into index "users"',
+            '(elasticsearch) index document {"product": "laptop", "price": 999} with id "prod-123" into index "products"',
+            '(elasticsearch) index document {"message": "error occurred", "level": "ERROR"} into index "logs" with refresh True',
+        )
+    ),
+    MethodInfo(
+        name="flush",
+        description="Send documents queued with index_document(buffered=True) as one bulk request",
+        parameters=MappingProxyType({}),
+        returns="Dictionary with successful count and failed items",
+        examples=(
+            '(elasticsearch) flush buffered documents',
+            '(elasticsearch) flush pending writes',
+        )
+    ),
+    MethodInfo(
+        name="bulk_index",
+        description="Bulk index multiple documents efficiently in a single request",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "documents": "List (or any iterable, e.g. a generator) of document dictionaries to index",
+            "id_field": "Field name to use as document ID (optional)",
+            "refresh": "Refresh index after bulk operation (default: False)",
+            "thread_count": "Parallel bulk workers (optional, default: CPU count)",
+            "chunk_size": "Documents per bulk request (default: 1000)",
+            "max_chunk_bytes": "Maximum bulk request size in bytes (default: 8 MB)",
+            "tune_for_ingest": "Disable refresh during the load, then restore settings and force-merge (default: False)"
+        }),
+        returns="Dictionary with successful count, failed items, and total",
+        examples=(
+            '(elasticsearch) bulk index documents [{"name": "Alice"}, {"name": "Bob"}] into index "users"',
+            '(elasticsearch) bulk index documents from list with id_field "user_id" into index "accounts"',
+            '(elasticsearch) index 1000 documents into index "logs" with refresh True',
+        )
+    ),
+    MethodInfo(
+        name="get_document",
+        description="Retrieve a document by its ID from an index",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "doc_id": "Document ID to retrieve",
+            "includes": "Source fields to return (optional)",
+            "excludes": "Source fields to leave out (optional)"
+        }),
+        returns="Document dictionary if found, None if not found, or error dict",
+        examples=(
+            '(elasticsearch) get document "user-123" from index "users"',
+            '(elasticsearch) retrieve document with id "prod-456" from index "products"',
+            '(elasticsearch) fetch document "event-789" from index "events"',
+        )
+    ),
+    MethodInfo(
+        name="get_documents",
+        description="Retrieve several documents by ID in a single request (multi-get)",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "doc_ids": "List of document IDs",
+            "includes": "Source fields to return (optional)",
+            "excludes": "Source fields to leave out (optional)"
+        }),
+        returns="Dictionary mapping each ID to its document, or None if not found",
+        examples=(
+            '(elasticsearch) get documents ["1", "2", "3"] from index "users"',
+            '(elasticsearch) fetch documents with ids ["p1", "p2"] from index "products"',
+        )
+    ),
+    MethodInfo(
+        name="update_document",
+        description="Update specific fields of an existing document",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "doc_id": "Document ID to update",
+            "document": "Dictionary with fields to update (partial document)",
+            "refresh": "Refresh index immediately (default: False)"
+        }),
+        returns="Dictionary with version and result status",
+        examples=(
+            '(elasticsearch) update document "user-123" in index "users" with {"age": 31}',
+            '(elasticsearch) update document "prod-456" with {"price": 899, "stock": 50} in index "products"',
+            '(elasticsearch) update document "event-789" set {"status": "processed"} with refresh True',
+        )
+    ),
+    MethodInfo(
+        name="delete_document",
+        description="Delete a document by its ID from an index",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "doc_id": "Document ID to delete",
+            "refresh": "Refresh index immediately (default: False)"
+        }),
+        returns="Dictionary with success status and result",
+        examples=(
+            '(elasticsearch) delete document "user-123" from index "users"',
+            '(elasticsearch) remove document "old-event" from index "events"',
+            '(elasticsearch) delete document "temp-456" from index "temporary" with refresh True',
+        )
+    ),
+    MethodInfo(
+        name="search",
+        description="Search documents using Elasticsearch Query DSL with support for pagination, sorting, and aggregations",
+        parameters=MappingProxyType({
+            "index": "Index name (supports wildcards like 'logs-*')",
+            "query": "Query DSL dictionary (optional, defaults to match_all)",
+            "size": "Number of results to return (default: 10, max recommended: 10000)",
+            "from_": "Offset for pagination (default: 0)",
+            "sort": "Sort specification list (optional)",
+            "source": "Fields to return - True/False or list of field names (optional)",
+            "aggs": "Aggregations dictionary (optional; aggregation searches return no hits unless hits_size is set)",
+            "hits_size": "Hits to return together with aggs, fetched by a separate concurrent request (optional)",
+            "includes": "Source fields to return, filtered server-side (optional)",
+            "excludes": "Source fields to leave out, filtered server-side (optional)",
+            "request_cache": "Use the shard request cache (optional; on by default for aggregations, pass False for 'now' date ranges)",
+            "search_after": "next_cursor from the previous page for deep pagination (optional, requires sort or pit_id)",
+            "pit_id": "Point in time id from open_point_in_time, searched instead of index (optional)",
+            "pit_keep_alive": "How long to extend the point in time (default: '1m')",
+            "track_total_hits": "True to count all matches, an int to count up to it, False to skip counting (total is None); default counts up to 10,000",
+            "preference": "Shard copy routing key (optional; defaults to a hash of index and query so repeats hit warm caches)"
+        }),
+        returns="Dictionary with hits list, total count, max_score, optional aggregations, and next_cursor for sorted searches",
+        examples=(
+            '(elasticsearch) search index "products"',
+            '(elasticsearch) search index "users" with query {"match": {"name": "john"}}',
+            '(elasticsearch) search index "logs" with query {"range": {"timestamp": {"gte": "2024-01-01"}}} size 100',
+            '(elasticsearch) search index "events" with query {"term": {"level": "ERROR"}} and aggs {"by_type": {"terms": {"field": "type.keyword"}}}',
+            '(elasticsearch) search index "products" sort [{"price": "asc"}] size 20',
+            '(elasticsearch) search index "users" from 50 size 10 source ["name", "email"]',
+            '(elasticsearch) search index "articles" with query {"match": {"title": "python"}} includes ["title", "author"]',
+        )
+    ),
+    MethodInfo(
+        name="msearch",
+        description="Run several searches in one request instead of one round trip per search",
+        parameters=MappingProxyType({
+            "searches": "List of (index, query) or (index, query, size) tuples; 10-50 per call recommended"
+        }),
+        returns="List of dictionaries, one per search in order, each with hits, total and max_score (or error)",
+        examples=(
+            '(elasticsearch) msearch [("users", {"term": {"status": "active"}}, 5), ("orders", {"range": {"total": {"gt": 100}}}, 20)]',
+            '(elasticsearch) run multiple searches on indices "logs" and "events" in a single request',
+        )
+    ),
+    MethodInfo(
+        name="register_query_template",
+        description="Store a mustache search template on the cluster for repeated parameterized searches",
+        parameters=MappingProxyType({
+            "name": "Template ID",
+            "template": "Mustache template source - string or Query DSL with {{placeholders}}"
+        }),
+        returns="Dictionary with success status and template name",
+        examples=(
+            '(elasticsearch) register query template "by_level" as {"query": {"term": {"level": "{{level}}"}}}',
+            '(elasticsearch) register search template "products_by_category" with {"query": {"match": {"category": "{{category}}"}}, "size": "{{size}}"}',
+        )
+    ),
+    MethodInfo(
+        name="search_template",
+        description="Search using a stored template, sending only its ID and parameters",
+        parameters=MappingProxyType({
+            "index": "Index name (supports wildcards)",
+            "name": "Template ID registered with register_query_template",
+            "params": "Values for the template placeholders (optional)"
+        }),
+        returns="Dictionary with hits list, total count, max_score, and optional aggregations",
+        examples=(
+            '(elasticsearch) search index "logs" with template "by_level" and params {"level": "ERROR"}',
+            '(elasticsearch) search template "products_by_category" on index "products" with params {"category": "books", "size": 20}',
+        )
+    ),
+    MethodInfo(
+        name="set_debug",
+        description="Toggle keeping the full raw response of the last search in last_result",
+        parameters=MappingProxyType({
+            "enabled": "Keep the raw response (default: True)"
+        }),
+        returns="None",
+        examples=(
+            '(elasticsearch) enable debug mode',
+            '(elasticsearch) set debug False',
+        )
+    ),
+    MethodInfo(
+        name="search_iter",
+        description="Iterate over all documents matching a query without loading them all into memory",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "query": "Query DSL dictionary (optional, defaults to match_all)",
+            "batch_size": "Documents fetched per request (default: 1000)",
+            "includes": "Source fields to return (optional, default: all)",
+            "max_docs": "Stop after this many documents (optional, default: all)",
+            "docvalue_fields": "Fields read from doc values instead of _source (optional; yields field -> list of values)"
+        }),
+        returns="Generator of document sources",
+        examples=(
+            '(elasticsearch) iterate over documents in index "logs" with query {"term": {"level": "ERROR"}}',
+            '(elasticsearch) stream all documents from index "events" in batches of 5000',
+        )
+    ),
+    MethodInfo(
+        name="search_df",
+        description="Search documents and return results as pandas DataFrame for data analysis",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "query": "Query DSL dictionary (optional, defaults to match_all)",
+            "size": "Maximum number of rows (optional, default: all matching documents)",
+            "batch_size": "Documents fetched per request (default: 1000)",
+            "columns": "Fields to return, dotted for nested fields; only these are transferred (optional, default: all fields flattened)",
+            "dtype_backend": "'numpy' (default) or 'pyarrow' for Arrow-backed columns (requires pyarrow)",
+            "fields": "Columns read from doc values instead of _source - keyword, numeric, date, boolean and ip fields only (optional, fastest for a few columns of wide documents)"
+        }),
+        returns="pandas DataFrame with search results",
+        examples=(
+            '(elasticsearch) search index "products" as dataframe',
+            '(elasticsearch) search index "logs" with query {"match": {"level": "ERROR"}} as dataframe',
+            '(elasticsearch) get all documents from index "users" as dataframe with size 50000',
+            '(elasticsearch) search index "orders" as dataframe with columns ["customer.id", "total", "created_at"]',
+            '(elasticsearch) search index "metrics" as dataframe with fields ["host", "cpu", "@timestamp"]',
+        )
+    ),
+    MethodInfo(
+        name="open_point_in_time",
+        description="Open a point in time for consistent deep pagination with search_after",
+        parameters=MappingProxyType({
+            "index": "Index name (supports wildcards)",
+            "keep_alive": "How long the point in time is kept between requests (default: '1m')"
+        }),
+        returns="Dictionary with success status and pit_id",
+        examples=(
+            '(elasticsearch) open point in time on index "logs"',
+            '(elasticsearch) open point in time on index "events" with keep_alive "5m"',
+        )
+    ),
+    MethodInfo(
+        name="close_point_in_time",
+        description="Close a point in time and release its resources",
+        parameters=MappingProxyType({
+            "pit_id": "Point in time id returned by open_point_in_time"
+        }),
+        returns="Dictionary with success status",
+        examples=(
+            '(elasticsearch) close point in time pit_id',
+        )
+    ),
+    MethodInfo(
+        name="count",
+        description="Count documents matching a query (faster than search when only count is needed; the query runs unscored in filter context)",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "query": "Query DSL dictionary (optional, counts all documents if omitted)",
+            "pit_id": "Point in time id to count within (optional)",
+            "preference": "Shard copy routing key (optional; defaults to a hash of index and query)"
+        }),
+        returns="Dictionary with success status and count (number of matching documents)",
+        examples=(
+            '(elasticsearch) count documents in index "users"',
+            '(elasticsearch) count documents in index "logs" matching query {"term": {"level": "ERROR"}}',
+            '(elasticsearch) count index "products" where query {"range": {"price": {"lt": 100}}}',
+        )
+    ),
+    MethodInfo(
+        name="delete_by_query",
+        description="Delete all documents matching a query",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "query": "Query DSL dictionary specifying which documents to delete",
+            "refresh": "Refresh index immediately (default: False)",
+            "slices": "Parallel slices to split the operation into (default: 'auto', one per shard)",
+            "requests_per_second": "Throttle in sub-requests per second (default: -1, unthrottled)",
+            "wait_for_completion": "Block until done (default: True); False returns a task id for get_task"
+        }),
+        returns="Dictionary with deleted count and total processed, or the task id",
+        examples=(
+            '(elasticsearch) delete documents from index "logs" where query {"range": {"timestamp": {"lt": "2023-01-01"}}}',
+            '(elasticsearch) delete from index "users" matching query {"term": {"status": "inactive"}}',
+            '(elasticsearch) delete documents in index "temp" where query {"match_all": {}} with refresh True',
+        )
+    ),
+    MethodInfo(
+        name="update_by_query",
+        description="Update all documents matching a query using a script",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "query": "Query DSL dictionary specifying which documents to update",
+            "script": "Update script dictionary (e.g., {'source': 'ctx._source.field++'})",
+            "refresh": "Refresh index immediately (default: False)",
+            "slices": "Parallel slices to split the operation into (default: 'auto', one per shard)",
+            "requests_per_second": "Throttle in sub-requests per second (default: -1, unthrottled)",
+            "wait_for_completion": "Block until done (default: True); False returns a task id for get_task"
+        }),
+        returns="Dictionary with updated count and total processed, or the task id",
+        examples=(
+            '(elasticsearch) update documents in index "products" matching query {"term": {"category": "electronics"}} with script {"source": "ctx._source.price *= 1.1"}',
+            '(elasticsearch) update index "users" where query {"match_all": {}} with script {"source": "ctx._source.updated_at = params.now", "params": {"now": "2024-01-01"}}',
+            '(elasticsearch) update documents matching query {"range": {"views": {"lt": 10}}} with script {"source": "ctx._source.views = 0"} and refresh True',
+        )
+    ),
+    MethodInfo(
+        name="get_task",
+        description="Check progress of a delete_by_query or update_by_query started with wait_for_completion False",
+        parameters=MappingProxyType({
+            "task_id": "Task id returned by the by-query operation"
+        }),
+        returns="Dictionary with completed flag, status and (when completed) the operation response",
+        examples=(
+            '(elasticsearch) get task "oTUltX4IQMOUUVeiohTt8A:12345"',
+            '(elasticsearch) check status of task "oTUltX4IQMOUUVeiohTt8A:12345"',
+        )
+    ),
+    MethodInfo(
+        name="put_mapping",
+        description="Add new fields to index mapping (cannot modify existing field types)",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "properties": "Dictionary defining new field mappings"
+        }),
+        returns="Dictionary with success status and acknowledgement",
+        examples=(
+            '(elasticsearch) put mapping for index "users" with properties {"phone": {"type": "keyword"}}',
+            '(elasticsearch) add mapping to index "products" properties {"tags": {"type": "keyword"}, "rating": {"type": "float"}}',
+            '(elasticsearch) update mapping for index "logs" add properties {"source_ip": {"type": "ip"}}',
+        )
+    ),
+    MethodInfo(
+        name="put_ngram_mapping",
+        description="Add an indexed-prefix sub-field (<field>.ngram) so prefix searches on the field become fast term lookups",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "field": "Existing keyword field (without a normalizer) to add the sub-field to",
+            "min_gram": "Shortest indexed prefix (default: 2)",
+            "max_gram": "Longest indexed prefix, at most 19 (default: 19)",
+            "backfill": "Start a background task that reindexes existing documents so they get the sub-field (default: True)"
+        }),
+        returns="Dictionary with success status, the sub-field name and the backfill task id",
+        examples=(
+            '(elasticsearch) add ngram mapping for field "name" in index "users"',
+            '(elasticsearch) put ngram mapping on index "products" field "sku" with min_gram 3',
+        )
+    ),
+    MethodInfo(
+        name="refresh_index",
+        description="Refresh index to make recent changes immediately searchable (has performance cost)",
+        parameters=MappingProxyType({
+            "index": "Index name to refresh"
+        }),
+        returns="Dictionary with success status",
+        examples=(
+            '(elasticsearch) refresh index "products"',
+            '(elasticsearch) refresh index "logs" to make changes searchable',
+            '(elasticsearch) force refresh on index "users"',
+        )
+    ),
+    MethodInfo(
+        name="clear_cache",
+        description="Clear the in-process search, document and index existence caches",
+        parameters=MappingProxyType({
+            "preserve_pinned": "Keep results of queries preloaded at startup (default: True)"
+        }),
+        returns="None",
+        examples=(
+            '(elasticsearch) clear cache',
+            '(elasticsearch) clear cache including pinned queries with preserve_pinned False',
+        )
+    ),
+    MethodInfo(
+        name="batched_refresh",
+        description="Context manager that defers refresh=True on writes to the given indices and refreshes them once at the end",
+        parameters=MappingProxyType({
+            "indices": "Index names whose refreshes are deferred"
+        }),
+        returns="Context manager yielding the module",
+        examples=(
+            '(elasticsearch) with batched refresh on index "products" index all documents with refresh True',
+            '(elasticsearch) defer refresh of indices "users" and "orders" until the batch completes',
+        )
+    ),
+    MethodInfo(
+        name="create_alias",
+        description="Create an alias pointing to an index (useful for zero-downtime reindexing)",
+        parameters=MappingProxyType({
+            "index": "Index name",
+            "alias": "Alias name to create"
+        }),
+        returns="Dictionary with success status and acknowledgement",
+        examples=(
+            '(elasticsearch) create alias "current_products" for index "products_v2"',
+            '(elasticsearch) add alias "active_logs" to index "logs-2024-01"',
+            '(elasticsearch) create alias "users" pointing to index "users_production"',
+        )
+    ),
+    MethodInfo(
+        name="get_cluster_health",
+        description="Get cluster health status including status color (green/yellow/red), node counts, and shard information",
+        parameters=MappingProxyType({}),
+        returns="Dictionary with cluster health details",
+        examples=(
+            '(elasticsearch) get cluster health',
+            '(elasticsearch) check cluster status',
+            '(elasticsearch) show cluster health information',
+        )
+    ),
+    MethodInfo(
+        name="get_index_stats",
+        description="Get detailed statistics for an index including document count, storage size, and performance metrics",
+        parameters=MappingProxyType({
+            "index": "Index name"
+        }),
+        returns="Dictionary with comprehensive index statistics",
+        examples=(
+            '(elasticsearch) get stats for index "products"',
+            '(elasticsearch) show index statistics for "logs"',
+            '(elasticsearch) get index "users" stats and metrics',
+        )
+    )
+)
+
+_EXAMPLES = (
+    # Basic connectivity
+    '10 (elasticsearch) ping cluster',
+    '20 (elasticsearch) get cluster info',
+    '30 (elasticsearch) get cluster health',
+
+    # Index management
+    '40 (elasticsearch) create index "products"',
+    '50 (elasticsearch) create index "logs" with mappings {"properties": {"timestamp": {"type": "date"}, "message": {"type": "text"}, "level": {"type": "keyword"}}}',
+    '60 (elasticsearch) create index "users" with settings {"number_of_shards": 3, "number_of_replicas": 1}',
+    '70 (elasticsearch) check if index "products" exists',
+    '80 (elasticsearch) delete index "old-logs"',
+    '90 (elasticsearch) get stats for index "products"',
+
+    # Document operations
+    '100 (elasticsearch) index document {"name": "Laptop", "price": 999, "category": "electronics"} into index "products"',
+    '110 (elasticsearch) index document {"user": "john", "email": "john@example.com"} with id "user-123" into index "users"',
+    '120 (elasticsearch) get document "user-123" from index "users"',
+    '130 (elasticsearch) update document "user-123" in index "users" with {"age": 30, "city": "NYC"}',
+    '140 (elasticsearch) delete document "user-456" from index "users"',
+
+    # Bulk operations
+    '150 (elasticsearch) bulk index documents [{"name": "Alice"}, {"name": "Bob"}, {"name": "Charlie"}] into index "users"',
+    '160 (elasticsearch) bulk index 1000 documents into index "logs" with id_field "event_id" and refresh True',
+
+    # Search operations
+    '170 (elasticsearch) search index "products"',
+    '180 (elasticsearch) search index "products" with query {"match": {"name": "laptop"}} size 20',
+    '190 (elasticsearch) search index "users" with query {"term": {"city.keyword": "NYC"}}',
+    '200 (elasticsearch) search index "logs" with query {"range": {"timestamp": {"gte": "2024-01-01", "lt": "2024-02-01"}}} size 100',
+    '210 (elasticsearch) search index "products" with query {"bool": {"must": [{"match": {"category": "electronics"}}, {"range": {"price": {"lt": 1000}}}]}}',
+    '220 (elasticsearch) search index "products" sort [{"price": "asc"}] size 50',
+    '230 (elasticsearch) search index "users" from 100 size 20 source ["name", "email"]',
+
+    # Aggregations
+    '240 (elasticsearch) search index "products" with aggs {"avg_price": {"avg": {"field": "price"}}, "by_category": {"terms": {"field": "category.keyword"}}}',
+    '250 (elasticsearch) search index "logs" with query {"match_all": {}} and aggs {"errors_per_day": {"date_histogram": {"field": "timestamp", "interval": "day"}}}',
+
+    # DataFrame integration
+    '260 (elasticsearch) search index "products" as dataframe',
+    '270 (elasticsearch) search index "logs" with query {"term": {"level": "ERROR"}} as dataframe with size 10000',
+
+    # Count operations
+    '280 (elasticsearch) count documents in index "users"',
+    '290 (elasticsearch) count documents in index "logs" matching query {"term": {"level": "ERROR"}}',
+
+    # Batch updates/deletes
+    '300 (elasticsearch) delete documents from index "logs" where query {"range": {"timestamp": {"lt": "2023-01-01"}}}',
+    '310 (elasticsearch) update documents in index "products" matching query {"term": {"category": "electronics"}} with script {"source": "ctx._source.price *= 0.9"}',
+
+    # Mapping and aliases
+    '320 (elasticsearch) put mapping for index "users" with properties {"phone": {"type": "keyword"}, "age": {"type": "integer"}}',
+    '325 (elasticsearch) add ngram mapping for field "phone" in index "users" so prefix searches like {"prefix": {"phone": "+39"}} use it',
+    '330 (elasticsearch) create alias "current_products" for index "products_v2"',
+    '340 (elasticsearch) refresh index "products"',
+)
+
+
+def _extract_dsl(text: str) -> tuple:
+    """Parse the JSON objects embedded in an example instruction."""
+    decoder = json.JSONDecoder()
+    found = []
+    start = text.find('{')
+    while start != -1:
+        try:
+            obj, end = decoder.raw_decode(text, start)
+        except ValueError:
+            start = text.find('{', start + 1)
+            continue
+        found.append(obj)
+        start = text.find('{', end)
+    return tuple(found)
+
+
+_EXAMPLES_PARSED = tuple((example, _extract_dsl(example)) for example in _EXAMPLES)
+
+
+class AsyncElasticsearchModule:
+    """
+    Async Elasticsearch module for concurrent search and indexing.
+
+    Mirrors the document and search API of ElasticsearchModule on top of
+    AsyncElasticsearch, so one caller can keep many requests in flight
+    (e.g. with asyncio.gather) instead of waiting on each blocking call.
+    Requires the async extra: pip install "elasticsearch[async]".
+    """
+
+    def __init__(
+        self,
+        hosts: Union[str, List[str]] = "http://localhost:9200",
+        username: str = None,
+        password: str = None,
+        api_key: str = None,
+        timeout: int = 30,
+        connections_per_node: int = 25,
+        **kwargs
+    ):
+        """Initialize async Elasticsearch module."""
+        try:
+            from elasticsearch import AsyncElasticsearch
+            from elasticsearch.exceptions import NotFoundError
+            from elasticsearch.helpers import async_bulk
+        except ImportError:
+            raise ImportError(
+                'Async support requires elasticsearch with aiohttp. Install with: pip install "elasticsearch[async]"'
+            )
+
+        self.NotFoundError = NotFoundError
+        self._async_bulk = async_bulk
+
+        if isinstance(hosts, str):
+            hosts = [hosts]
+        if api_key:
+            kwargs['api_key'] = api_key
+        elif username and password:
+            kwargs['basic_auth'] = (username, password)
+        if ORJSON_AVAILABLE and 'serializer' not in kwargs:
+            kwargs['serializer'] = _orjson_serializer()
+
+        self.client = AsyncElasticsearch(
+            hosts=hosts,
+            request_timeout=timeout,
+            connections_per_node=connections_per_node,
+            http_compress=True,
+            **kwargs
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # =============================================================================
+    # Documents and Search
+    # =============================================================================
+
+    async def index_document(self, index: str, document: Dict[str, Any],
+                             doc_id: Optional[str] = None, refresh: bool = False) -> Dict[str, Any]:
+        """Index a single document."""
+        try:
+            result = await self.client.index(index=index, id=doc_id, document=document, refresh=refresh)
+            return {'success': True, 'id': result['_id'], 'result': result['result']}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+    async def bulk_index(self, index: str, documents: Iterable[Dict[str, Any]],
+                         id_field: Optional[str] = None, refresh: bool = False,
+                         chunk_size: int = 1000) -> Dict[str, Any]:
+        """Bulk index documents with async_bulk."""
+        def _actions():
+            for doc in documents:
+                action = {'_index': index, '_source': doc}
+                if id_field and id_field in doc:
+                    action['_id'] = doc[id_field]
+                yield action
+
+        try:
+            success, failed = await self._async_bulk(
+                self.client, _actions(), chunk_size=chunk_size, refresh=refresh, raise_on_error=False
+            )
+            return {'success': True, 'successful': success, 'failed': failed, 'total': success + len(failed)}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+    async def get_document(self, index: str, doc_id: str) -> Optional[Dict[str, Any]]:
+        """Get a document by ID."""
+        try:
+            result = await self.client.get(index=index, id=doc_id)
+            return result['_source']
+        except self.NotFoundError:
+            return None
+        except Exception as e:
+            return {'error': str(e)}
+
+    async def search(self, index: str, query: Optional[Dict[str, Any]] = None,
+                     size: int = 10, **options) -> Dict[str, Any]:
+        """Search documents; extra options are passed to the client."""
+        try:
+            result = await self.client.search(
+                index=index, query=query or _MATCH_ALL_QUERY, size=size, **options
+            )
+            response = {
+                'success': True,
+                'hits': [hit['_source'] for hit in result['hits']['hits']],
+                'total': result['hits']['total']['value'],
+                'max_score': result['hits'].get('max_score')
+            }
+            if 'aggregations' in result:
+                response['aggregations'] = result['aggregations']
+            return response
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+    async def search_many(self, searches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run several searches (keyword dicts for search()) concurrently."""
+        return await asyncio.gather(*[self.search(**kwargs) for kwargs in searches])
+
+    async def count(self, index: str, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Count documents matching query."""
+        try:
+            if not query:
+                result = await self.client.count(index=index)
+            else:
+                result = await self.client.count(index=index, query=_filter_context(query))
+            return {'success': True, 'count': result['count']}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+
+    # =============================================================================
+    # Utility Methods
+    # =============================================================================
+
+    async def close(self):
+        """Close the async client's connections."""
+        await self.client.close()
 
 
 # Singleton instance getter
 def get_elasticsearch_module(**kwargs) -> ElasticsearchModule:
     """
-    Get the singleton Elasticsearch module instance.
+    Get the shared Elasticsearch module instance for a configuration.
 
     Args:
         **kwargs: Configuration parameters
@@ -1071,4 +3006,4 @@ def get_elasticsearch_module(**kwargs) -> ElasticsearchModule:
     Returns:
         ElasticsearchModule instance
     """
-    return ElasticsearchModule(**kwargs)
+    return ElasticsearchModule.instance(**kwargs)
@@ -80,8 +80,11 @@ Usage in generated code:
 """
 
 import configparser
+import queue
 import smtplib
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -95,6 +98,27 @@ import os
 import re
 from .module_base import AIbasicModuleBase
 
+# Idle seconds after which the persistent SMTP session is checked with NOOP before use
+_SMTP_IDLE_CHECK_SECONDS = 5.0
+
+# Batch sends retry transient SMTP replies (service unavailable, mailbox busy,
+# local error, insufficient storage, TLS temporarily unavailable)
+_SMTP_TRANSIENT_CODES = frozenset({421, 450, 451, 452, 454})
+_SMTP_RETRY_ATTEMPTS = 3
+_SMTP_RETRY_BASE_DELAY = 1.0
+
+
+def _is_transient_smtp(error: Exception) -> bool:
+    """Tell whether a failed send is worth retrying."""
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        # {address: (code, message)}; retry only if every refusal was temporary
+        return bool(error.recipients) and all(
+            code in _SMTP_TRANSIENT_CODES for code, _ in error.recipients.values()
+        )
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code in _SMTP_TRANSIENT_CODES
+
 
 class EmailModule(AIbasicModuleBase):
     """
@@ -142,6 +166,12 @@ class EmailModule(AIbasicModuleBase):
         self.from_name = from_name
         self.timeout = timeout
 
+        # Persistent SMTP session shared by all sends (reentrant so a batch
+        # can hold it across its send_email() calls)
+        self._smtp = None
+        self._smtp_last_used = 0.0
+        self._conn_lock = threading.RLock()
+
         # Validate configuration
         if not smtp_host:
             raise ValueError("SMTP host is required")
@@ -239,6 +269,59 @@ class EmailModule(AIbasicModuleBase):
 
         return smtp
 
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        Return the persistent SMTP session, connecting on first use.
+
+        Sessions idle for a while are checked with NOOP first, since
+        servers drop idle connections; a dead one is replaced.
+        """
+        if self._smtp is not None and time.monotonic() - self._smtp_last_used > _SMTP_IDLE_CHECK_SECONDS:
+            try:
+                healthy = self._smtp.noop()[0] == 250
+            except smtplib.SMTPException:
+                healthy = False
+            if not healthy:
+                self._drop_smtp()
+        if self._smtp is None:
+            self._smtp = self._connect()
+        return self._smtp
+
+    def _drop_smtp(self) -> None:
+        """Close the persistent session, ignoring errors from a dead connection."""
+        smtp, self._smtp = self._smtp, None
+        self._quit(smtp)
+
+    @staticmethod
+    def _quit(smtp: Optional[smtplib.SMTP]) -> None:
+        """Quit an SMTP session, closing the socket if the server is already gone."""
+        if smtp is not None:
+            try:
+                smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                smtp.close()
+
+    def _send(self, msg: MIMEMultipart, sender: str, recipients: List[str]) -> None:
+        """Send a message over the persistent session, reconnecting once if it was dropped."""
+        with self._conn_lock:
+            try:
+                self._get_smtp().send_message(msg, sender, recipients)
+            except smtplib.SMTPServerDisconnected:
+                self._drop_smtp()
+                self._get_smtp().send_message(msg, sender, recipients)
+            self._smtp_last_used = time.monotonic()
+
+    def close(self) -> None:
+        """Close the persistent SMTP connection."""
+        with self._conn_lock:
+            self._drop_smtp()
+
+    def __enter__(self) -> 'EmailModule':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     # ==================== Email Sending ====================
 
     def send_email(
@@ -272,6 +355,50 @@ class EmailModule(AIbasicModuleBase):
         Returns:
             Dict with send status and details
         """
+        msg, sender_email, all_recipients, to_list = self._build_message(
+            to, subject, body, cc, bcc, attachments, from_email, from_name, reply_to, priority
+        )
+
+        # Send email
+        try:
+            self._send(msg, sender_email, all_recipients)
+
+            print(f"[EmailModule] Email sent successfully to {len(all_recipients)} recipient(s)")
+
+            return {
+                'success': True,
+                'recipients': len(all_recipients),
+                'to': to_list,
+                'subject': subject,
+                'attachments': len(attachments) if attachments else 0
+            }
+
+        except Exception as e:
+            print(f"[EmailModule] Failed to send email: {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    def _build_message(
+        self,
+        to: Union[str, List[str]],
+        subject: str,
+        body: str,
+        cc: Optional[Union[str, List[str]]] = None,
+        bcc: Optional[Union[str, List[str]]] = None,
+        attachments: Optional[List[str]] = None,
+        from_email: Optional[str] = None,
+        from_name: Optional[str] = None,
+        reply_to: Optional[str] = None,
+        priority: str = 'normal'
+    ) -> tuple:
+        """
+        Build a plain text message for send_email().
+
+        Returns:
+            (message, sender address, all recipient addresses, To addresses)
+        """
         # Create message
         msg = MIMEMultipart()
 
@@ -321,28 +448,7 @@ class EmailModule(AIbasicModuleBase):
             for filepath in attachments:
                 self._attach_file(msg, filepath)
 
-        # Send email
-        try:
-            smtp = self._connect()
-            smtp.send_message(msg, sender_email, all_recipients)
-            smtp.quit()
-
-            print(f"[EmailModule] Email sent successfully to {len(all_recipients)} recipient(s)")
-
-            return {
-                'success': True,
-                'recipients': len(all_recipients),
-                'to': to_list,
-                'subject': subject,
-                'attachments': len(attachments) if attachments else 0
-            }
-
-        except Exception as e:
-            print(f"[EmailModule] Failed to send email: {e}")
-            return {
-                'success': False,
-                'error': str(e)
-            }
+        return msg, sender_email, all_recipients, to_list
 
     def send_html_email(
         self,
@@ -436,9 +542,7 @@ class EmailModule(AIbasicModuleBase):
 
         # Send email
         try:
-            smtp = self._connect()
-            smtp.send_message(msg, sender_email, all_recipients)
-            smtp.quit()
+            self._send(msg, sender_email, all_recipients)
 
             print(f"[EmailModule] HTML email sent successfully to {len(all_recipients)} recipient(s)")
 
@@ -509,40 +613,120 @@ class EmailModule(AIbasicModuleBase):
     def send_batch_emails(
         self,
         emails: List[Dict[str, Any]],
-        delay: float = 0
+        delay: float = 0,
+        concurrency: int = 1,
+        max_per_connection: int = 0
     ) -> Dict[str, Any]:
         """
         Send multiple emails in batch.
 
+        With concurrency 1, all emails go over the one persistent SMTP
+        session, held for the whole batch. With more, that many workers
+        each open their own session and send in parallel, retrying
+        transient SMTP errors with exponential backoff.
+
         Args:
             emails: List of email dicts with 'to', 'subject', 'body', etc.
-            delay: Delay between emails in seconds
+            delay: Delay between emails in seconds (per worker)
+            concurrency: Parallel SMTP sessions (check the provider's limit)
+            max_per_connection: Reconnect after this many emails per session
+                (0: no limit)
 
         Returns:
             Dict with batch send statistics
         """
-        import time
+        if concurrency > 1:
+            return self._send_batch_parallel(emails, delay, concurrency, max_per_connection)
 
         sent = 0
         failed = 0
         errors = []
 
-        for i, email_data in enumerate(emails):
-            try:
-                result = self.send_email(**email_data)
-                if result.get('success'):
-                    sent += 1
-                else:
+        with self._conn_lock:
+            for i, email_data in enumerate(emails):
+                try:
+                    result = self.send_email(**email_data)
+                    if result.get('success'):
+                        sent += 1
+                    else:
+                        failed += 1
+                        errors.append({'email': i, 'error': result.get('error')})
+
+                    # Delay between emails (avoid spam filters)
+                    if delay > 0 and i < len(emails) - 1:
+                        time.sleep(delay)
+
+                except Exception as e:
                     failed += 1
-                    errors.append({'email': i, 'error': result.get('error')})
+                    errors.append({'email': i, 'error': str(e)})
 
-                # Delay between emails (avoid spam filters)
-                if delay > 0 and i < len(emails) - 1:
-                    time.sleep(delay)
+        print(f"[EmailModule] Batch send complete: {sent} sent, {failed} failed")
 
-            except Exception as e:
-                failed += 1
-                errors.append({'email': i, 'error': str(e)})
+        return {
+            'total': len(emails),
+            'sent': sent,
+            'failed': failed,
+            'errors': errors if errors else None
+        }
+
+    def _send_batch_parallel(
+        self,
+        emails: List[Dict[str, Any]],
+        delay: float,
+        concurrency: int,
+        max_per_connection: int
+    ) -> Dict[str, Any]:
+        """Send a batch from a queue drained by worker threads with one SMTP session each."""
+        jobs = queue.Queue()
+        for job in enumerate(emails):
+            jobs.put(job)
+        errors = []
+        errors_lock = threading.Lock()
+
+        def _worker() -> None:
+            smtp = None
+            sent_on_connection = 0
+            try:
+                while True:
+                    try:
+                        i, email_data = jobs.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        msg, sender_email, all_recipients, _ = self._build_message(**email_data)
+                        for attempt in range(_SMTP_RETRY_ATTEMPTS):
+                            if smtp is None or (max_per_connection and sent_on_connection >= max_per_connection):
+                                self._quit(smtp)
+                                smtp, sent_on_connection = self._connect(), 0
+                            try:
+                                smtp.send_message(msg, sender_email, all_recipients)
+                                sent_on_connection += 1
+                                break
+                            except smtplib.SMTPException as e:
+                                if not _is_transient_smtp(e) or attempt == _SMTP_RETRY_ATTEMPTS - 1:
+                                    raise
+                                if isinstance(e, smtplib.SMTPServerDisconnected) or getattr(e, 'smtp_code', None) == 421:
+                                    # The server is closing this session
+                                    self._quit(smtp)
+                                    smtp = None
+                                time.sleep(_SMTP_RETRY_BASE_DELAY * 2 ** attempt)
+                    except Exception as e:
+                        with errors_lock:
+                            errors.append({'email': i, 'error': str(e)})
+
+                    # Delay between emails (avoid spam filters)
+                    if delay > 0:
+                        time.sleep(delay)
+            finally:
+                self._quit(smtp)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(min(concurrency, len(emails))):
+                executor.submit(_worker)
+
+        errors.sort(key=lambda error: error['email'])
+        failed = len(errors)
+        sent = len(emails) - failed
 
         print(f"[EmailModule] Batch send complete: {sent} sent, {failed} failed")
 
@@ -692,6 +876,8 @@ class EmailModule(AIbasicModuleBase):
             "Priority setting adds X-Priority headers ('low', 'normal', 'high')",
             "Reply-To header allows specifying different reply address from sender",
             "Batch sending supports optional delay between emails to avoid spam filters",
+            "send_batch_emails(concurrency=N) sends over N parallel SMTP connections and retries transient replies (421, 45x) with backoff; max_per_connection reconnects for providers that cap messages per connection",
+            "One SMTP connection is opened on first send and reused by all later sends (checked with NOOP after idling, reconnected if dropped); call close() or use the module as a context manager to release it",
             "Email validation uses regex pattern - validates format only, not deliverability",
             "Module automatically detects MIME types for attachments",
             "HTML emails can include plain text fallback for better compatibility",
@@ -773,13 +959,26 @@ class EmailModule(AIbasicModuleBase):
                 description="Send multiple emails in batch with optional delay to avoid spam filters",
                 parameters={
                     "emails": "List of email dictionaries, each with 'to', 'subject', 'body', etc.",
-                    "delay": "Delay between emails in seconds (default: 0, recommended: 1-2 for large batches)"
+                    "delay": "Delay between emails in seconds (default: 0, recommended: 1-2 for large batches)",
+                    "concurrency": "Parallel SMTP connections (default: 1; stay within the provider's limit, e.g. 15 for Gmail)",
+                    "max_per_connection": "Reconnect after this many emails per connection (default: 0, no limit)"
                 },
                 returns="Dictionary with total, sent, failed counts and error details",
                 examples=[
                     '(email) send batch emails [{"to": "user1@example.com", "subject": "Hello", "body": "Message 1"}, {"to": "user2@example.com", "subject": "Hello", "body": "Message 2"}]',
                     '(email) send batch emails from list with delay 1.5',
-                    '(email) send 100 emails with delay 2 seconds'
+                    '(email) send 100 emails with delay 2 seconds',
+                    '(email) send batch emails from newsletter_list with concurrency 10'
+                ]
+            ),
+            MethodInfo(
+                name="close",
+                description="Close the persistent SMTP connection (reopened automatically by the next send)",
+                parameters={},
+                returns="None",
+                examples=[
+                    '(email) close connection',
+                    '(email) close smtp connection'
                 ]
             ),
             MethodInfo(
@@ -44,6 +44,8 @@ class ModuleMetadata:
 class MethodInfo:
     """Information about a module method."""
 
+    __slots__ = ("name", "description", "parameters", "returns", "examples")
+
     def __init__(
         self,
         name: str,
@@ -63,9 +65,9 @@ class MethodInfo:
         return {
             "name": self.name,
             "description": self.description,
-            "parameters": self.parameters,
+            "parameters": dict(self.parameters),
             "returns": self.returns,
-            "examples": self.examples
+            "examples": list(self.examples)
         }
 
 
@@ -77,6 +79,9 @@ class AIbasicModuleBase(ABC):
     to provide rich metadata for the compiler.
     """
 
+    # No instance state here, so subclasses may declare __slots__ of their own
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def get_metadata(cls) -> ModuleMetadata:
@@ -0,0 +1,74 @@
+"""
+Tests for the CBOR search transport of the Elasticsearch module.
+
+The client's transport is replaced by a recorder, so the tests check the
+headers a search actually goes out with without needing a cluster.
+"""
+
+import pytest
+
+pytest.importorskip("elasticsearch")
+pytest.importorskip("cbor2")
+
+from elastic_transport import ApiResponseMeta, HttpHeaders, NodeConfig
+
+from aibasic.modules.elasticsearch_module import ElasticsearchModule
+
+
+SEARCH_RESPONSE = {'took': 1, 'hits': {'total': {'value': 0}, 'max_score': None, 'hits': []}}
+
+
+class _Response(tuple):
+    """(meta, body) pair as returned by Transport.perform_request()."""
+
+    @property
+    def meta(self):
+        return self[0]
+
+    @property
+    def body(self):
+        return self[1]
+
+
+def _record_requests(module, monkeypatch):
+    """Replace the module's transport with one that records request headers."""
+    sent = []
+
+    def perform_request(method, target, headers=None, body=None, **kwargs):
+        sent.append({'method': method, 'target': target, 'headers': dict(headers or {}), 'body': body})
+        content_type = headers.get('accept', 'application/json')
+        meta = ApiResponseMeta(
+            status=200,
+            http_version='1.1',
+            headers=HttpHeaders({'content-type': content_type, 'x-elastic-product': 'Elasticsearch'}),
+            duration=0.0,
+            node=NodeConfig('http', 'localhost', 9200),
+        )
+        return _Response((meta, SEARCH_RESPONSE))
+
+    monkeypatch.setattr(module.client.transport, 'perform_request', perform_request)
+    return sent
+
+
+def test_search_cbor_sends_cbor_content_type(monkeypatch):
+    module = ElasticsearchModule(search_cbor=True, cache_size=0)
+    sent = _record_requests(module, monkeypatch)
+
+    result = module.search('logs', {'term': {'level': 'error'}})
+
+    assert result['success'] is True
+    assert len(sent) == 1
+    assert sent[0]['target'].startswith('/logs/_search')
+    assert sent[0]['headers']['content-type'] == 'application/cbor'
+    assert sent[0]['headers']['accept'] == 'application/cbor'
+    # The body is encoded by the registered CBOR serializer
+    assert module.client.transport.serializers.dumps(sent[0]['body'], mimetype='application/cbor')
+
+
+def test_search_without_cbor_sends_json(monkeypatch):
+    module = ElasticsearchModule(cache_size=0)
+    sent = _record_requests(module, monkeypatch)
+
+    module.search('logs', {'term': {'level': 'error'}})
+
+    assert 'json' in sent[0]['headers']['content-type']